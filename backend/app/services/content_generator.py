@@ -8,15 +8,64 @@ from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 import aiohttp
 import json
+import hashlib
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 import sqlite3
-from contextlib import asynccontextmanager
+import threading
+import weakref
+import itertools
+import time
+from contextlib import asynccontextmanager, contextmanager
 
 from core.logging.logger import get_logger
 
 logger = get_logger("content_generator")
 
+# 生成IDのカウンタ（プロセス内の全インスタンスで共有し、ミリ秒時刻から開始）
+_id_counter = itertools.count(int(time.time() * 1000))
+
+# スタイルごとのシステムプロンプト（未知のスタイルは casual を使用）
+_STYLE_PROMPTS = {
+    "casual": "親しみやすく、カジュアルな口調で",
+    "formal": "丁寧で、フォーマルな口調で",
+    "humorous": "面白く、ユーモアのある口調で",
+    "informative": "情報提供に適した、分かりやすい口調で"
+}
+
+# よく使うSQL（共有接続のステートメントキャッシュで再利用される）
+_SQL_INSERT_TEMPLATE = """
+    INSERT OR REPLACE INTO prompt_templates 
+    (name, template, description, category, parameters, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_SELECT_TEMPLATES = """
+    SELECT name, template, description, category, parameters, created_at, updated_at
+    FROM prompt_templates
+"""
+
+_SQL_INSERT_HISTORY = """
+    INSERT INTO generation_history 
+    (id, content, prompt, template_name, parameters, created_at, model, usage)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_SELECT_HISTORY = """
+    SELECT id, content, prompt, template_name, parameters, created_at, model, usage
+    FROM generation_history 
+    ORDER BY created_at DESC
+    LIMIT ? OFFSET ?
+"""
+
+_SQL_SELECT_HISTORY_BY_TEMPLATE = """
+    SELECT id, content, prompt, template_name, parameters, created_at, model, usage
+    FROM generation_history 
+    WHERE template_name = ?
+    ORDER BY created_at DESC
+    LIMIT ? OFFSET ?
+"""
+
 class ContentGenerationError(Exception):
     """コンテンツ生成関連のエラー"""
     pass
@@ -33,6 +82,8 @@ class GenerationRequest:
     presence_penalty: float = 0.0
     style: str = "casual"
     language: str = "日本語"
+    # 同一リクエストに前回の生成結果を返す（毎回異なる出力が欲しい通常の生成では無効）
+    use_cache: bool = False
 
 @dataclass
 class GenerationResult:
@@ -60,16 +111,74 @@ class PromptTemplate:
 class ContentGenerator:
     """ChatGPT APIを使用したコンテンツ生成クラス"""
     
-    def __init__(self, api_key: Optional[str] = None, db_path: str = "content_generator.db"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        db_path: str = "content_generator.db",
+        *,
+        fast_unsafe: bool = False
+    ):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.base_url = "https://api.openai.com/v1/chat/completions"
         self.db_path = db_path
+        # True の場合は耐久性を犠牲にして書き込みを高速化する（テスト用）
+        self.fast_unsafe = fast_unsafe
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.Lock()
+        # 接続を閉じるファイナライザ（インスタンスの破棄時・終了時に呼ばれ、インスタンス自体は保持しない）
+        self._conn_finalizer: Optional[weakref.finalize] = None
+        # 完全一致のレスポンスキャッシュ（キー: プロンプト+テンプレート名+パラメータのハッシュ）
+        self._response_cache: Dict[str, GenerationResult] = {}
+        self.max_response_cache_size = 256
+        # プロンプトテンプレートのキャッシュ（None は未読み込み）
+        self._templates_cache: Optional[List[PromptTemplate]] = None
         self._init_database()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """データベースに接続（"file:" で始まるパスはURIとして扱う）"""
+        conn = sqlite3.connect(
+            self.db_path,
+            uri=self.db_path.startswith("file:"),
+            check_same_thread=False,
+            cached_statements=256
+        )
+        if self.fast_unsafe:
+            conn.execute("PRAGMA journal_mode=MEMORY")
+            conn.execute("PRAGMA synchronous=OFF")
+        else:
+            # WALで読み取りと書き込みを並行可能にし、fsyncはチェックポイント時のみに抑える
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+    
+    @contextmanager
+    def _connection(self):
+        """共有接続を排他的に取得（ブロックを抜けるとコミット、例外時はロールバック）"""
+        with self._conn_lock:
+            if self._conn is None:
+                self._conn = self._connect()
+                self._conn_finalizer = weakref.finalize(self, self._conn.close)
+            with self._conn:
+                yield self._conn
+    
+    def close(self) -> None:
+        """共有接続を閉じる"""
+        with self._conn_lock:
+            if self._conn_finalizer is not None:
+                self._conn_finalizer()
+                self._conn_finalizer = None
+            self._conn = None
+    
+    def __enter__(self) -> "ContentGenerator":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
         
     def _init_database(self) -> None:
         """データベースの初期化"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 # 生成履歴テーブル
@@ -123,6 +232,20 @@ class ContentGenerator:
             # プロンプトテンプレートの適用
             final_prompt = self._apply_template(request)
             
+            # 同一リクエストのキャッシュを確認
+            cache_key = self._response_cache_key(final_prompt, request) if request.use_cache else None
+            if cache_key and cache_key in self._response_cache:
+                logger.info("キャッシュ済みの生成結果を返します")
+                # キャッシュヒットも1回の生成として、新しいIDで履歴に残す
+                cached_result = replace(
+                    self._response_cache[cache_key],
+                    id=self._generate_id(),
+                    parameters=asdict(request),
+                    created_at=datetime.now()
+                )
+                await self._save_to_history(cached_result)
+                return cached_result
+            
             headers = {
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json"
@@ -173,6 +296,9 @@ class ContentGenerator:
                     # 履歴に保存
                     await self._save_to_history(generation_result)
                     
+                    if cache_key:
+                        self._store_response_cache(cache_key, generation_result)
+                    
                     logger.info(f"テキスト生成成功: {content[:50]}...")
                     return generation_result
                     
@@ -196,13 +322,13 @@ class ContentGenerator:
             生成結果のリスト
         """
         try:
-            variations = []
-            
-            for i in range(count):
-                # パラメータを少し変更してバリエーションを作成
-                variation_request = self._create_variation_request(base_request, i)
-                result = await self.generate_text(variation_request)
-                variations.append(result)
+            # パラメータを少し変更したリクエストを並行して実行
+            variation_requests = [
+                self._create_variation_request(base_request, i) for i in range(count)
+            ]
+            variations = list(await asyncio.gather(
+                *(self.generate_text(request) for request in variation_requests)
+            ))
                 
             logger.info(f"{count}個のバリエーションを生成しました")
             return variations
@@ -219,22 +345,15 @@ class ContentGenerator:
             template: プロンプトテンプレート
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT OR REPLACE INTO prompt_templates 
-                    (name, template, description, category, parameters, created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    template.name,
-                    template.template,
-                    template.description,
-                    template.category,
-                    json.dumps(template.parameters),
-                    template.created_at.isoformat(),
-                    template.updated_at.isoformat()
-                ))
+                cursor.execute(_SQL_INSERT_TEMPLATE, self._template_to_row(template))
                 conn.commit()
+            
+            if self._templates_cache is not None:
+                self._templates_cache = [
+                    t for t in self._templates_cache if t.name != template.name
+                ] + [template]
                 
             logger.info(f"プロンプトテンプレートを追加しました: {template.name}")
             
@@ -242,6 +361,47 @@ class ContentGenerator:
             logger.error(f"プロンプトテンプレート追加エラー: {str(e)}")
             raise ContentGenerationError(f"プロンプトテンプレートの追加に失敗しました: {str(e)}")
     
+    def add_prompt_templates_bulk(self, templates: List[PromptTemplate]) -> int:
+        """
+        プロンプトテンプレートを一括追加（1トランザクション）
+        
+        Args:
+            templates: プロンプトテンプレートのリスト
+            
+        Returns:
+            追加された件数
+        """
+        try:
+            rows = [self._template_to_row(template) for template in templates]
+            
+            with self._connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(_SQL_INSERT_TEMPLATE, rows)
+                conn.commit()
+            
+            # 次回の取得時にDBから読み直す
+            self._templates_cache = None
+                
+            logger.info(f"プロンプトテンプレートを一括追加しました: {len(rows)}件")
+            return len(rows)
+            
+        except Exception as e:
+            logger.error(f"プロンプトテンプレート一括追加エラー: {str(e)}")
+            raise ContentGenerationError(f"プロンプトテンプレートの一括追加に失敗しました: {str(e)}")
+    
+    @staticmethod
+    def _template_to_row(template: PromptTemplate) -> Tuple:
+        """テンプレートをDB行に変換"""
+        return (
+            template.name,
+            template.template,
+            template.description,
+            template.category,
+            json.dumps(template.parameters),
+            template.created_at.isoformat(),
+            template.updated_at.isoformat()
+        )
+    
     def get_prompt_templates(self, category: Optional[str] = None) -> List[PromptTemplate]:
         """
         プロンプトテンプレートを取得
@@ -253,39 +413,40 @@ class ContentGenerator:
             プロンプトテンプレートのリスト
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                if category:
-                    cursor.execute("""
-                        SELECT name, template, description, category, parameters, created_at, updated_at
-                        FROM prompt_templates WHERE category = ?
-                    """, (category,))
-                else:
-                    cursor.execute("""
-                        SELECT name, template, description, category, parameters, created_at, updated_at
-                        FROM prompt_templates
-                    """)
-                
-                templates = []
-                for row in cursor.fetchall():
-                    template = PromptTemplate(
-                        name=row[0],
-                        template=row[1],
-                        description=row[2],
-                        category=row[3],
-                        parameters=json.loads(row[4]),
-                        created_at=datetime.fromisoformat(row[5]),
-                        updated_at=datetime.fromisoformat(row[6])
-                    )
-                    templates.append(template)
-                
-                return templates
+            if self._templates_cache is None:
+                self._templates_cache = self._load_prompt_templates()
+            
+            if category:
+                return [t for t in self._templates_cache if t.category == category]
+            return list(self._templates_cache)
                 
         except Exception as e:
             logger.error(f"プロンプトテンプレート取得エラー: {str(e)}")
             raise ContentGenerationError(f"プロンプトテンプレートの取得に失敗しました: {str(e)}")
     
+    def _load_prompt_templates(self) -> List[PromptTemplate]:
+        """プロンプトテンプレートをDBから読み込み"""
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_SQL_SELECT_TEMPLATES)
+            
+            return [
+                PromptTemplate(
+                    name=row[0],
+                    template=row[1],
+                    description=row[2],
+                    category=row[3],
+                    parameters=json.loads(row[4]),
+                    created_at=datetime.fromisoformat(row[5]),
+                    updated_at=datetime.fromisoformat(row[6])
+                )
+                for row in cursor.fetchall()
+            ]
+    
+    def invalidate_template_cache(self) -> None:
+        """プロンプトテンプレートのキャッシュを破棄"""
+        self._templates_cache = None
+    
     def get_generation_history(
         self, 
         limit: int = 50, 
@@ -304,24 +465,15 @@ class ContentGenerator:
             生成履歴のリスト
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 if template_name:
-                    cursor.execute("""
-                        SELECT id, content, prompt, template_name, parameters, created_at, model, usage
-                        FROM generation_history 
-                        WHERE template_name = ?
-                        ORDER BY created_at DESC
-                        LIMIT ? OFFSET ?
-                    """, (template_name, limit, offset))
+                    cursor.execute(
+                        _SQL_SELECT_HISTORY_BY_TEMPLATE, (template_name, limit, offset)
+                    )
                 else:
-                    cursor.execute("""
-                        SELECT id, content, prompt, template_name, parameters, created_at, model, usage
-                        FROM generation_history 
-                        ORDER BY created_at DESC
-                        LIMIT ? OFFSET ?
-                    """, (limit, offset))
+                    cursor.execute(_SQL_SELECT_HISTORY, (limit, offset))
                 
                 history = []
                 for row in cursor.fetchall():
@@ -354,7 +506,7 @@ class ContentGenerator:
             削除された件数
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 if before_date:
@@ -383,7 +535,7 @@ class ContentGenerator:
             統計情報
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 # 総生成回数
@@ -443,14 +595,7 @@ class ContentGenerator:
     
     def _get_system_prompt(self, style: str, language: str) -> str:
         """システムプロンプトを取得"""
-        style_prompts = {
-            "casual": "親しみやすく、カジュアルな口調で",
-            "formal": "丁寧で、フォーマルな口調で",
-            "humorous": "面白く、ユーモアのある口調で",
-            "informative": "情報提供に適した、分かりやすい口調で"
-        }
-        
-        style_prompt = style_prompts.get(style, style_prompts["casual"])
+        style_prompt = _STYLE_PROMPTS.get(style, _STYLE_PROMPTS["casual"])
         
         return f"あなたは{language}で{style_prompt}コンテンツを生成するアシスタントです。"
     
@@ -469,23 +614,37 @@ class ContentGenerator:
             frequency_penalty=base_request.frequency_penalty,
             presence_penalty=base_request.presence_penalty,
             style=base_request.style,
-            language=base_request.language
+            language=base_request.language,
+            use_cache=base_request.use_cache
         )
     
+    def _response_cache_key(self, final_prompt: str, request: GenerationRequest) -> str:
+        """レスポンスキャッシュのキーを作成"""
+        params = asdict(request)
+        params.pop("use_cache")
+        raw = final_prompt + (request.template_name or "") + json.dumps(params, sort_keys=True)
+        return hashlib.blake2b(raw.encode("utf-8")).hexdigest()
+    
+    def _store_response_cache(self, key: str, result: GenerationResult) -> None:
+        """レスポンスキャッシュに保存（上限を超えたら古いものから削除）"""
+        self._response_cache[key] = result
+        while len(self._response_cache) > self.max_response_cache_size:
+            del self._response_cache[next(iter(self._response_cache))]
+    
+    def clear_response_cache(self) -> None:
+        """レスポンスキャッシュをクリア"""
+        self._response_cache.clear()
+    
     def _generate_id(self) -> str:
-        """一意のIDを生成"""
-        return f"gen_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+        """一意のIDを生成（プロセスID + 起動時刻を起点とした単調増加カウンタ）"""
+        return f"gen_{os.getpid():x}_{next(_id_counter):x}"
     
     async def _save_to_history(self, result: GenerationResult) -> None:
         """生成結果を履歴に保存"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO generation_history 
-                    (id, content, prompt, template_name, parameters, created_at, model, usage)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+                cursor.execute(_SQL_INSERT_HISTORY, (
                     result.id,
                     result.content,
                     result.prompt,
@@ -2,6 +2,7 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from typing import List, Dict, Optional
 import os
+import asyncio
 from datetime import datetime, timedelta
 import logging
 from dotenv import load_dotenv
@@ -13,6 +14,9 @@ load_dotenv()
 
 logger = get_logger("youtube_client")
 
+# 1回のバッチリクエストにまとめられるAPI呼び出しの上限
+BATCH_MAX_REQUESTS = 50
+
 class YouTubeClient:
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.getenv("YOUTUBE_API_KEY")
@@ -99,18 +103,61 @@ class YouTubeClient:
             
             response = request.execute()
             
-            comments = []
-            for item in response.get("items", []):
-                comment = {
-                    "id": item["id"],
-                    "author": item["snippet"]["topLevelComment"]["snippet"]["authorDisplayName"],
-                    "text": item["snippet"]["topLevelComment"]["snippet"]["textDisplay"],
-                    "like_count": item["snippet"]["topLevelComment"]["snippet"]["likeCount"],
-                    "published_at": item["snippet"]["topLevelComment"]["snippet"]["publishedAt"]
-                }
-                comments.append(comment)
+            return [self._parse_comment(item) for item in response.get("items", [])]
+            
+        except HttpError as e:
+            logger.error(f"An HTTP error occurred: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"An error occurred: {e}")
+            raise
+
+    async def get_comments_for_videos(
+        self,
+        video_ids: List[str],
+        max_results: int = 100
+    ) -> Dict[str, List[Dict]]:
+        """
+        複数動画のコメントをまとめて取得する
+        
+        commentThreads.list の呼び出しを最大50件ずつ1回のHTTPバッチリクエストにまとめる
+        
+        Args:
+            video_ids (List[str]): 動画IDのリスト
+            max_results (int): 動画ごとに取得するコメントの最大数（デフォルト: 100）
+            
+        Returns:
+            Dict[str, List[Dict]]: 動画IDごとのコメントのリスト
+        """
+        comments_by_video: Dict[str, List[Dict]] = {}
+        # 同じ動画IDを2回追加するとBatchHttpRequest.addがKeyErrorになるため、順序を保って重複を除く
+        video_ids = list(dict.fromkeys(video_ids))
+        
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                logger.error(f"An error occurred for video {request_id}: {exception}")
+                comments_by_video[request_id] = []
+                return
+            comments_by_video[request_id] = [
+                self._parse_comment(item) for item in response.get("items", [])
+            ]
+        
+        try:
+            for start in range(0, len(video_ids), BATCH_MAX_REQUESTS):
+                batch = self.youtube.new_batch_http_request(callback=_collect)
+                for video_id in video_ids[start:start + BATCH_MAX_REQUESTS]:
+                    batch.add(
+                        self.youtube.commentThreads().list(
+                            part="snippet",
+                            videoId=video_id,
+                            maxResults=max_results,
+                            order="relevance"
+                        ),
+                        request_id=video_id
+                    )
+                await asyncio.to_thread(batch.execute)
             
-            return comments
+            return comments_by_video
             
         except HttpError as e:
             logger.error(f"An HTTP error occurred: {e}")
@@ -119,6 +166,25 @@ class YouTubeClient:
             logger.error(f"An error occurred: {e}")
             raise
 
+    def _parse_comment(self, item: Dict) -> Dict:
+        """
+        commentThreads.list のレスポンス項目をコメント情報に変換する
+        
+        Args:
+            item (Dict): レスポンスの項目
+            
+        Returns:
+            Dict: コメント情報
+        """
+        snippet = item["snippet"]["topLevelComment"]["snippet"]
+        return {
+            "id": item["id"],
+            "author": snippet["authorDisplayName"],
+            "text": snippet["textDisplay"],
+            "like_count": snippet["likeCount"],
+            "published_at": snippet["publishedAt"]
+        }
+
     async def analyze_video_trends(
         self,
         video_id: str,
@@ -29,13 +29,19 @@ logger = logging.getLogger(__name__)
 class NotificationManager:
     """通知システムの中心マネージャー"""
     
-    def __init__(self, config_path: str = "config/notification.json"):
+    def __init__(
+        self,
+        config_path: str = "config/notification.json",
+        db_path: str = "data/notifications.db"
+    ):
         self.config_path = Path(config_path)
         self.config = self._load_config()
         self.channels = self._initialize_channels()
         self.templates = self._load_templates()
-        self.db_path = Path("data/notifications.db")
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # "file:" で始まるパスはSQLiteのURIとして扱う（テストでの共有キャッシュのインメモリDBなど）
+        self.db_path: Union[str, Path] = db_path if db_path.startswith("file:") else Path(db_path)
+        if isinstance(self.db_path, Path):
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_database()
         
         # 通知履歴の管理
@@ -170,10 +176,14 @@ class NotificationManager:
         
         return templates
     
+    def _connect(self) -> sqlite3.Connection:
+        """通知データベースに接続する（URI形式のパスにも対応）"""
+        return sqlite3.connect(self.db_path, uri=True)
+    
     def _init_database(self):
         """通知データベースを初期化"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS notifications (
@@ -425,7 +435,7 @@ class NotificationManager:
     ):
         """通知をデータベースに記録"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     INSERT INTO notifications 
@@ -480,7 +490,7 @@ class NotificationManager:
             query += " ORDER BY timestamp DESC LIMIT ?"
             params.append(limit)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute(query, params)
                 rows = cursor.fetchall()
@@ -514,7 +524,7 @@ class NotificationManager:
     def get_notification_statistics(self) -> Dict[str, Any]:
         """通知統計を取得"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # 総通知数
@@ -555,7 +565,7 @@ class NotificationManager:
         try:
             cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM notifications WHERE timestamp < ?", (cutoff_date,))
                 deleted_count = cursor.rowcount
@@ -45,6 +45,9 @@ class TrendAnalyzer:
             stats = category_stats[item.category]
             stats["count"] += 1
             stats["total_score"] += item.score
+        
+        # 平均スコアは集計後にカテゴリごとに一度だけ計算する
+        for stats in category_stats.values():
             stats["avg_score"] = stats["total_score"] / stats["count"]
             
         return category_stats
@@ -14,6 +14,62 @@ from unittest.mock import patch
 from fastapi.testclient import TestClient
 from app.main import app
 
+class FakeResp:
+    """aiohttpレスポンスの軽量スタブ"""
+    
+    def __init__(self, status=200, payload=None, body=b"", json_error=None):
+        self.status = status
+        self._payload = payload
+        self._body = body.encode("utf-8") if isinstance(body, str) else body
+        self._json_error = json_error
+    
+    async def json(self):
+        if self._json_error is not None:
+            raise self._json_error
+        return self._payload
+    
+    async def text(self):
+        return self._body.decode("utf-8")
+    
+    async def read(self):
+        return self._body
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class FakeSession:
+    """aiohttp.ClientSessionの軽量スタブ
+
+    routes は {(メソッド, URL): FakeResp} の辞書。URLを None にすると
+    そのメソッドの全リクエストに一致する。
+    """
+    
+    def __init__(self, routes):
+        self.routes = routes
+    
+    def _route(self, method, url):
+        response = self.routes.get((method, url)) or self.routes.get((method, None))
+        if response is None:
+            raise AssertionError(f"未登録のリクエスト: {method} {url}")
+        return response
+    
+    def post(self, url, **kwargs):
+        return self._route("POST", url)
+    
+    def get(self, url, **kwargs):
+        return self._route("GET", url)
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
 @pytest.fixture
 def client():
     """FastAPIテストクライアント"""
@@ -3,11 +3,12 @@
 """
 
 import pytest
-import asyncio
+import functools
 import json
-from datetime import datetime, timedelta
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+import sqlite3
+import uuid
+from datetime import datetime
+from types import MappingProxyType
 
 from core.notifications.notification_types import (
     NotificationType, 
@@ -23,6 +24,178 @@ from core.notifications.notification_channels import (
 from core.notifications.notification_manager import NotificationManager
 from core.notifications.report_scheduler import ReportScheduler
 
+# テスト用の通知設定（全チャンネル無効）
+_DEFAULT_NOTIF_CONFIG_BYTES = json.dumps({
+    "email": {
+        "enabled": False,
+        "smtp_server": "",
+        "smtp_port": 587,
+        "username": "",
+        "password": "",
+        "from_address": "",
+        "to_addresses": []
+    },
+    "slack": {
+        "enabled": False,
+        "webhook_url": "",
+        "channel": "#general",
+        "username": "Xbot"
+    },
+    "webhook": {
+        "enabled": False,
+        "webhook_url": "",
+        "method": "POST",
+        "headers": {},
+        "timeout": 10
+    },
+    "general": {
+        "retry_attempts": 3,
+        "retry_delay": 5,
+        "batch_size": 10,
+        "enable_quota_warnings": True,
+        "enable_system_notifications": True,
+        "enable_report_notifications": True
+    }
+}, separators=(",", ":")).encode("utf-8")
+
+# エラーハンドリング統合テスト用の最小構成
+_MINIMAL_NOTIF_CONFIG_BYTES = json.dumps({
+    "email": {"enabled": False},
+    "slack": {"enabled": False},
+    "webhook": {"enabled": False},
+    "general": {
+        "enable_quota_warnings": True,
+        "enable_system_notifications": True,
+        "enable_report_notifications": True
+    }
+}, separators=(",", ":")).encode("utf-8")
+
+
+@pytest.fixture(scope="module")
+def data_dir(tmp_path_factory):
+    """モジュール内で共有するデータディレクトリ"""
+    return tmp_path_factory.mktemp("data")
+
+
+@pytest.fixture
+def notification_db():
+    """テストごとの通知データベース（共有キャッシュのインメモリSQLiteのURI）"""
+    uri = f"file:notifications_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    # 共有キャッシュのDBは接続が一つでも開いている間だけ保持される
+    anchor = sqlite3.connect(uri, uri=True)
+    yield uri
+    anchor.close()
+
+
+# デフォルトで読み込まれるテンプレートID
+_EXPECTED_TEMPLATES = frozenset({
+    "error_notification",
+    "system_notification",
+    "quota_warning",
+    "backup_complete",
+    "trend_analysis_complete",
+    "content_generation_complete"
+})
+
+# 通知マネージャーが記録するタイムスタンプの固定値
+_FROZEN_NOW = datetime(2024, 1, 1)
+
+
+class _FrozenDatetime(datetime):
+    """now() が常に固定値を返す datetime"""
+    
+    @classmethod
+    def now(cls, tz=None):
+        return _FROZEN_NOW
+
+
+@pytest.fixture(scope="module", autouse=True)
+def frozen_time():
+    """通知マネージャーとレポートスケジューラーの現在時刻を固定する"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("core.notifications.notification_manager.datetime", _FrozenDatetime)
+        mp.setattr("core.notifications.report_scheduler.datetime", _FrozenDatetime)
+        yield _FROZEN_NOW
+
+
+# 統合テストで事前投入する過去の通知履歴
+_SEED_HISTORY_ROWS = [
+    ("2023-12-31T09:00:00", "system", "info", "過去の通知1", "事前投入データ1", "[]"),
+    ("2023-12-31T10:00:00", "quota_warning", "warning", "過去の通知2", "事前投入データ2", "[]"),
+    ("2023-12-31T11:00:00", "error", "error", "過去の通知3", "事前投入データ3", "[]"),
+]
+
+
+# レポート集計テストで投入する通知履歴（固定時刻 2024-01-01 は月曜日）
+# (timestamp, type, level, title, message, sent_channels, success_count, failure_count)
+_REPORT_HISTORY_ROWS = [
+    ("2023-12-31T09:00:00", "system", "info", "前週・前月", "対象外", "[]", 1, 0),
+    ("2024-01-01T08:00:00", "system", "info", "当日1", "当日", "[]", 1, 0),
+    ("2024-01-01T09:00:00", "error", "error", "当日2", "当日", "[]", 0, 1),
+    ("2024-01-01T10:00:00", "quota_warning", "warning", "当日3", "当日", "[]", 1, 0),
+    ("2024-01-03T09:00:00", "system", "info", "今週", "今週", "[]", 2, 0),
+    ("2024-01-20T09:00:00", "backup_complete", "info", "今月", "今月", "[]", 1, 0),
+]
+
+
+def _seed_notifications(db_path, rows):
+    """通知履歴を一つのトランザクションでまとめて投入する"""
+    with sqlite3.connect(db_path, uri=True) as conn:
+        conn.executemany(
+            """
+            INSERT INTO notifications
+            (timestamp, type, level, title, message, sent_channels)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            rows
+        )
+
+
+def _seed_report_notifications(db_path, rows):
+    """送信成否の件数付きで通知履歴を投入する"""
+    with sqlite3.connect(db_path, uri=True) as conn:
+        conn.executemany(
+            """
+            INSERT INTO notifications
+            (timestamp, type, level, title, message, sent_channels, success_count, failure_count)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def _prebuilt_templates():
+    """デフォルトテンプレートを一度だけ構築して使い回す"""
+    return NotificationManager._load_templates(NotificationManager.__new__(NotificationManager))
+
+
+class _CountingChannel:
+    """送信回数だけを記録する軽量なチャンネルスタブ"""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    async def send(self, content):
+        self.calls += 1
+        return True
+    
+    def is_enabled(self):
+        return True
+
+
+# レポートフォーマットテスト用のサンプルデータ（読み取り専用）
+_FORMATTING_DAILY_DATA = MappingProxyType({
+    "date": "2024-01-01",
+    "notification_count": 25,
+    "notification_stats": {"success_rate": 92.0},
+    "system_status": {
+        "database_size": "2.1MB",
+        "log_file_size": "800KB",
+        "uptime": "48時間以上"
+    }
+})
+
 
 class TestNotificationTypes:
     """通知タイプのテスト"""
@@ -80,125 +253,97 @@ class TestNotificationTypes:
 class TestNotificationChannels:
     """通知チャンネルのテスト"""
     
-    def test_email_channel_initialization(self):
-        """メールチャンネルの初期化テスト"""
-        config = {
-            "enabled": True,
-            "smtp_server": "smtp.gmail.com",
-            "smtp_port": 587,
-            "username": "test@example.com",
-            "password": "password123",
-            "from_address": "test@example.com",
-            "to_addresses": ["admin@example.com"]
-        }
-        
-        channel = EmailChannel(config)
-        assert channel.enabled is True
-        assert channel.smtp_server == "smtp.gmail.com"
-        assert channel.smtp_port == 587
-        assert channel.username == "test@example.com"
-        assert channel.to_addresses == ["admin@example.com"]
-    
-    def test_slack_channel_initialization(self):
-        """Slackチャンネルの初期化テスト"""
-        config = {
-            "enabled": True,
-            "webhook_url": "https://hooks.slack.com/test",
-            "channel": "#test",
-            "username": "TestBot",
-            "icon_emoji": ":test:"
-        }
-        
-        channel = SlackChannel(config)
-        assert channel.enabled is True
-        assert channel.webhook_url == "https://hooks.slack.com/test"
-        assert channel.channel == "#test"
-        assert channel.username == "TestBot"
-    
-    def test_webhook_channel_initialization(self):
-        """Webhookチャンネルの初期化テスト"""
-        config = {
-            "enabled": True,
-            "webhook_url": "https://api.example.com/webhook",
-            "method": "POST",
-            "headers": {"Authorization": "Bearer token"},
-            "timeout": 15
-        }
-        
-        channel = WebhookChannel(config)
+    @pytest.mark.parametrize(
+        "channel_cls,config,checks",
+        [
+            (
+                EmailChannel,
+                {
+                    "enabled": True,
+                    "smtp_server": "smtp.gmail.com",
+                    "smtp_port": 587,
+                    "username": "test@example.com",
+                    "password": "password123",
+                    "from_address": "test@example.com",
+                    "to_addresses": ["admin@example.com"]
+                },
+                {
+                    "smtp_server": "smtp.gmail.com",
+                    "smtp_port": 587,
+                    "username": "test@example.com",
+                    "to_addresses": ["admin@example.com"]
+                }
+            ),
+            (
+                SlackChannel,
+                {
+                    "enabled": True,
+                    "webhook_url": "https://hooks.slack.com/test",
+                    "channel": "#test",
+                    "username": "TestBot",
+                    "icon_emoji": ":test:"
+                },
+                {
+                    "webhook_url": "https://hooks.slack.com/test",
+                    "channel": "#test",
+                    "username": "TestBot"
+                }
+            ),
+            (
+                WebhookChannel,
+                {
+                    "enabled": True,
+                    "webhook_url": "https://api.example.com/webhook",
+                    "method": "POST",
+                    "headers": {"Authorization": "Bearer token"},
+                    "timeout": 15
+                },
+                {
+                    "webhook_url": "https://api.example.com/webhook",
+                    "method": "POST",
+                    "timeout": 15
+                }
+            ),
+        ],
+        ids=["email", "slack", "webhook"]
+    )
+    def test_channel_initialization(self, channel_cls, config, checks):
+        """各チャンネルの初期化テスト"""
+        channel = channel_cls(config)
         assert channel.enabled is True
-        assert channel.webhook_url == "https://api.example.com/webhook"
-        assert channel.method == "POST"
-        assert channel.timeout == 15
+        for attr, expected in checks.items():
+            assert getattr(channel, attr) == expected
     
-    def test_channel_disabled(self):
+    @pytest.mark.parametrize(
+        "channel_cls",
+        [EmailChannel, SlackChannel, WebhookChannel],
+        ids=["email", "slack", "webhook"]
+    )
+    def test_channel_disabled(self, channel_cls):
         """チャンネル無効化のテスト"""
-        config = {"enabled": False}
-        
-        email_channel = EmailChannel(config)
-        slack_channel = SlackChannel(config)
-        webhook_channel = WebhookChannel(config)
-        
-        assert email_channel.is_enabled() is False
-        assert slack_channel.is_enabled() is False
-        assert webhook_channel.is_enabled() is False
+        channel = channel_cls({"enabled": False})
+        assert channel.is_enabled() is False
 
 
 class TestNotificationManager:
     """通知マネージャーのテスト"""
     
-    @pytest.fixture
-    def temp_config_file(self, tmp_path):
+    @pytest.fixture(scope="module")
+    def temp_config_file(self, data_dir):
         """一時的な設定ファイルを作成"""
-        config = {
-            "email": {
-                "enabled": False,
-                "smtp_server": "",
-                "smtp_port": 587,
-                "username": "",
-                "password": "",
-                "from_address": "",
-                "to_addresses": []
-            },
-            "slack": {
-                "enabled": False,
-                "webhook_url": "",
-                "channel": "#general",
-                "username": "Xbot"
-            },
-            "webhook": {
-                "enabled": False,
-                "webhook_url": "",
-                "method": "POST",
-                "headers": {},
-                "timeout": 10
-            },
-            "general": {
-                "retry_attempts": 3,
-                "retry_delay": 5,
-                "batch_size": 10,
-                "enable_quota_warnings": True,
-                "enable_system_notifications": True,
-                "enable_report_notifications": True
-            }
-        }
-        
-        config_file = tmp_path / "notification.json"
-        with open(config_file, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        config_file = data_dir / "notification.json"
+        config_file.write_bytes(_DEFAULT_NOTIF_CONFIG_BYTES)
         
         return str(config_file)
     
     @pytest.fixture
-    def notification_manager(self, temp_config_file, tmp_path):
+    def notification_manager(self, temp_config_file, notification_db, monkeypatch):
         """通知マネージャーのインスタンスを作成"""
-        # データディレクトリを作成
-        data_dir = tmp_path / "data"
-        data_dir.mkdir()
-        
-        manager = NotificationManager(temp_config_file)
-        manager.db_path = data_dir / "notifications.db"
-        return manager
+        # テンプレートは構築済みのものを浅いコピーで共有する
+        monkeypatch.setattr(
+            NotificationManager, "_load_templates", lambda self: dict(_prebuilt_templates())
+        )
+        return NotificationManager(temp_config_file, db_path=notification_db)
     
     def test_notification_manager_initialization(self, notification_manager):
         """通知マネージャーの初期化テスト"""
@@ -209,94 +354,52 @@ class TestNotificationManager:
     
     def test_default_templates_loaded(self, notification_manager):
         """デフォルトテンプレートの読み込みテスト"""
-        expected_templates = [
-            "error_notification",
-            "system_notification", 
-            "quota_warning",
-            "backup_complete",
-            "trend_analysis_complete",
-            "content_generation_complete"
-        ]
-        
-        for template_id in expected_templates:
-            assert template_id in notification_manager.templates
+        assert _EXPECTED_TEMPLATES <= notification_manager.templates.keys()
     
-    @pytest.mark.asyncio
-    async def test_send_notification_with_template(self, notification_manager):
-        """テンプレートを使用した通知送信テスト"""
-        # モックチャンネルを作成
-        mock_channel = Mock()
-        mock_channel.send.return_value = True
-        mock_channel.is_enabled.return_value = True
-        
-        notification_manager.channels["email"] = mock_channel
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize(
+        "method_name,args,kwargs",
+        [
+            (
+                "send_notification",
+                (),
+                {
+                    "notification_type": NotificationType.SYSTEM,
+                    "title": "テスト",
+                    "message": "テストメッセージ",
+                    "template_id": "system_notification",
+                    "details": {"operation": "テスト操作"}
+                }
+            ),
+            (
+                "send_error_notification",
+                (Exception("テストエラー"), "test_function", "TestSystem"),
+                {}
+            ),
+            (
+                "send_system_notification",
+                ("テスト操作", "完了", {"detail": "テスト詳細"}),
+                {}
+            ),
+            (
+                "send_quota_warning",
+                ("YouTube API", 85.5, {"quota_type": "daily"}),
+                {}
+            ),
+        ],
+        ids=["template", "error", "system", "quota_warning"]
+    )
+    async def test_send_variants(self, notification_manager, method_name, args, kwargs):
+        """各種通知送信メソッドのテスト"""
+        # スタブチャンネルを作成
+        channel = _CountingChannel()
+        notification_manager.channels["email"] = channel
         
         # 通知を送信
-        result = await notification_manager.send_notification(
-            notification_type=NotificationType.SYSTEM,
-            title="テスト",
-            message="テストメッセージ",
-            template_id="system_notification",
-            details={"operation": "テスト操作"}
-        )
-        
-        assert result is True
-        mock_channel.send.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_send_error_notification(self, notification_manager):
-        """エラー通知の送信テスト"""
-        # モックチャンネルを作成
-        mock_channel = Mock()
-        mock_channel.send.return_value = True
-        mock_channel.is_enabled.return_value = True
-        
-        notification_manager.channels["email"] = mock_channel
-        
-        # エラー通知を送信
-        error = Exception("テストエラー")
-        result = await notification_manager.send_error_notification(
-            error, "test_function", "TestSystem"
-        )
-        
-        assert result is True
-        mock_channel.send.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_send_system_notification(self, notification_manager):
-        """システム通知の送信テスト"""
-        # モックチャンネルを作成
-        mock_channel = Mock()
-        mock_channel.send.return_value = True
-        mock_channel.is_enabled.return_value = True
-        
-        notification_manager.channels["email"] = mock_channel
-        
-        # システム通知を送信
-        result = await notification_manager.send_system_notification(
-            "テスト操作", "完了", {"detail": "テスト詳細"}
-        )
-        
-        assert result is True
-        mock_channel.send.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_send_quota_warning(self, notification_manager):
-        """クォータ警告の送信テスト"""
-        # モックチャンネルを作成
-        mock_channel = Mock()
-        mock_channel.send.return_value = True
-        mock_channel.is_enabled.return_value = True
-        
-        notification_manager.channels["email"] = mock_channel
-        
-        # クォータ警告を送信
-        result = await notification_manager.send_quota_warning(
-            "YouTube API", 85.5, {"quota_type": "daily"}
-        )
+        result = await getattr(notification_manager, method_name)(*args, **kwargs)
         
         assert result is True
-        mock_channel.send.assert_called_once()
+        assert channel.calls == 1
     
     def test_get_notification_statistics(self, notification_manager):
         """通知統計の取得テスト"""
@@ -317,6 +420,18 @@ class TestReportScheduler:
         """レポートスケジューラーのインスタンスを作成"""
         return ReportScheduler()
     
+    @pytest.fixture
+    def seeded_notification_manager(self, data_dir, notification_db, monkeypatch):
+        """集計対象の通知履歴を投入した通知マネージャーをレポートスケジューラーに設定"""
+        config_file = data_dir / "notification_report.json"
+        config_file.write_bytes(_DEFAULT_NOTIF_CONFIG_BYTES)
+        manager = NotificationManager(str(config_file), db_path=notification_db)
+        _seed_report_notifications(notification_db, _REPORT_HISTORY_ROWS)
+        monkeypatch.setattr(
+            "core.notifications.report_scheduler.notification_manager", manager
+        )
+        return manager
+    
     def test_report_scheduler_initialization(self, report_scheduler):
         """レポートスケジューラーの初期化テスト"""
         assert report_scheduler.is_running is False
@@ -337,104 +452,58 @@ class TestReportScheduler:
         assert daily_config["time"] == "09:00"
         assert daily_config["channels"] == ["email", "slack"]
     
-    @pytest.mark.asyncio
-    async def test_daily_report_generation(self, report_scheduler):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_daily_report_generation(self, report_scheduler, seeded_notification_manager):
         """日次レポート生成のテスト"""
-        # モック通知マネージャーを作成
-        mock_notification_manager = Mock()
-        mock_notification_manager.get_notification_statistics.return_value = {
-            "total_notifications": 100,
-            "success_rate": 95.5
-        }
-        mock_notification_manager.get_notification_history.return_value = []
-        
-        # 通知マネージャーを置き換え
-        report_scheduler._collect_daily_data = Mock()
-        report_scheduler._collect_daily_data.return_value = {
-            "date": "2024-01-01",
-            "notification_count": 10,
-            "notification_stats": {"success_rate": 95.5},
-            "system_status": {
-                "database_size": "1.2MB",
-                "log_file_size": "500KB",
-                "uptime": "24時間以上"
-            },
-            "report_type": "daily"
-        }
-        
-        # 日次レポートを生成
+        # 日次レポートのデータを収集
         report_data = await report_scheduler._collect_daily_data()
         
         assert report_data["date"] == "2024-01-01"
-        assert report_data["notification_count"] == 10
+        assert report_data["notification_count"] == 3
         assert report_data["report_type"] == "daily"
         assert "system_status" in report_data
+        # 通知統計は全期間が対象（成功6件・失敗1件）
+        assert report_data["notification_stats"]["total_notifications"] == len(_REPORT_HISTORY_ROWS)
+        assert report_data["notification_stats"]["success_rate"] == 85.71
     
-    @pytest.mark.asyncio
-    async def test_weekly_report_generation(self, report_scheduler):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_weekly_report_generation(self, report_scheduler, seeded_notification_manager):
         """週次レポート生成のテスト"""
-        # モックデータを設定
-        report_scheduler._collect_weekly_data = Mock()
-        report_scheduler._collect_weekly_data.return_value = {
-            "week_start": "2024-01-01",
-            "week_end": "2024-01-07",
-            "weekly_stats": {
-                "total_notifications": 50,
-                "error_count": 2,
-                "warning_count": 3,
-                "success_rate": 96.0
-            },
-            "report_type": "weekly"
-        }
-        
-        # 週次レポートを生成
+        # 週次レポートのデータを収集
         report_data = await report_scheduler._collect_weekly_data()
         
         assert report_data["week_start"] == "2024-01-01"
         assert report_data["week_end"] == "2024-01-07"
-        assert report_data["weekly_stats"]["total_notifications"] == 50
-        assert report_data["weekly_stats"]["success_rate"] == 96.0
+        assert report_data["weekly_stats"] == {
+            "total_notifications": 4,
+            "error_count": 1,
+            "warning_count": 1,
+            "success_rate": 80.0
+        }
+        assert [n["title"] for n in report_data["notification_details"]] == [
+            "今週", "当日3", "当日2", "当日1"
+        ]
     
-    @pytest.mark.asyncio
-    async def test_monthly_report_generation(self, report_scheduler):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_monthly_report_generation(self, report_scheduler, seeded_notification_manager):
         """月次レポート生成のテスト"""
-        # モックデータを設定
-        report_scheduler._collect_monthly_data = Mock()
-        report_scheduler._collect_monthly_data.return_value = {
-            "month": "2024-01",
-            "month_start": "2024-01-01",
-            "month_end": "2024-01-31",
-            "monthly_stats": {
-                "total_notifications": 200,
-                "type_breakdown": {"system": 150, "error": 50},
-                "level_breakdown": {"info": 180, "warning": 15, "error": 5},
-                "success_rate": 97.5
-            },
-            "report_type": "monthly"
-        }
-        
-        # 月次レポートを生成
+        # 月次レポートのデータを収集
         report_data = await report_scheduler._collect_monthly_data()
         
         assert report_data["month"] == "2024-01"
-        assert report_data["monthly_stats"]["total_notifications"] == 200
-        assert report_data["monthly_stats"]["success_rate"] == 97.5
+        assert report_data["month_start"] == "2024-01-01"
+        assert report_data["month_end"] == "2024-01-31"
+        assert report_data["monthly_stats"] == {
+            "total_notifications": 5,
+            "type_breakdown": {"backup_complete": 1, "system": 2, "quota_warning": 1, "error": 1},
+            "level_breakdown": {"info": 3, "warning": 1, "error": 1},
+            "success_rate": 83.33
+        }
     
     def test_report_formatting(self, report_scheduler):
         """レポートフォーマットのテスト"""
         # 日次レポートのフォーマット
-        daily_data = {
-            "date": "2024-01-01",
-            "notification_count": 25,
-            "notification_stats": {"success_rate": 92.0},
-            "system_status": {
-                "database_size": "2.1MB",
-                "log_file_size": "800KB",
-                "uptime": "48時間以上"
-            }
-        }
-        
-        formatted_report = report_scheduler._format_daily_report(daily_data)
+        formatted_report = report_scheduler._format_daily_report(_FORMATTING_DAILY_DATA)
         
         assert "日次レポート" in formatted_report
         assert "25件" in formatted_report
@@ -462,54 +531,19 @@ class TestReportScheduler:
 class TestIntegration:
     """統合テスト"""
     
-    @pytest.mark.asyncio
-    async def test_full_notification_flow(self, tmp_path):
+    @pytest.mark.slow
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_full_notification_flow(self, data_dir, notification_db):
         """完全な通知フローのテスト"""
         # 設定ファイルを作成
-        config_file = tmp_path / "notification.json"
-        config = {
-            "email": {
-                "enabled": False,
-                "smtp_server": "",
-                "smtp_port": 587,
-                "username": "",
-                "password": "",
-                "from_address": "",
-                "to_addresses": []
-            },
-            "slack": {
-                "enabled": False,
-                "webhook_url": "",
-                "channel": "#general",
-                "username": "Xbot"
-            },
-            "webhook": {
-                "enabled": False,
-                "webhook_url": "",
-                "method": "POST",
-                "headers": {},
-                "timeout": 10
-            },
-            "general": {
-                "retry_attempts": 3,
-                "retry_delay": 5,
-                "batch_size": 10,
-                "enable_quota_warnings": True,
-                "enable_system_notifications": True,
-                "enable_report_notifications": True
-            }
-        }
-        
-        with open(config_file, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        config_file = data_dir / "notification_full.json"
+        config_file.write_bytes(_DEFAULT_NOTIF_CONFIG_BYTES)
         
-        # データディレクトリを作成
-        data_dir = tmp_path / "data"
-        data_dir.mkdir()
+        # 通知マネージャーを作成（DBはテストごとの一時ファイル）
+        manager = NotificationManager(str(config_file), db_path=notification_db)
         
-        # 通知マネージャーを作成
-        manager = NotificationManager(str(config_file))
-        manager.db_path = data_dir / "notifications.db"
+        # 過去の通知履歴を投入
+        _seed_notifications(notification_db, _SEED_HISTORY_ROWS)
         
         # 通知を送信（チャンネルは無効なので失敗するが、データベースには記録される）
         result = await manager.send_notification(
@@ -524,7 +558,7 @@ class TestIntegration:
         
         # 通知履歴を確認
         history = await manager.get_notification_history(limit=10)
-        assert len(history) > 0
+        assert len(history) == len(_SEED_HISTORY_ROWS) + 1
         
         # 最新の通知を確認
         latest_notification = history[0]
@@ -532,33 +566,18 @@ class TestIntegration:
         assert latest_notification["message"] == "これは統合テストです"
         assert latest_notification["type"] == "system"
         assert latest_notification["level"] == "info"
+        assert latest_notification["timestamp"] == _FROZEN_NOW.isoformat()
     
-    @pytest.mark.asyncio
-    async def test_error_handling_integration(self, tmp_path):
+    @pytest.mark.slow
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_error_handling_integration(self, data_dir, notification_db):
         """エラーハンドリングの統合テスト"""
         # 設定ファイルを作成
-        config_file = tmp_path / "notification.json"
-        config = {
-            "email": {"enabled": False},
-            "slack": {"enabled": False},
-            "webhook": {"enabled": False},
-            "general": {
-                "enable_quota_warnings": True,
-                "enable_system_notifications": True,
-                "enable_report_notifications": True
-            }
-        }
-        
-        with open(config_file, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
-        
-        # データディレクトリを作成
-        data_dir = tmp_path / "data"
-        data_dir.mkdir()
+        config_file = data_dir / "notification_minimal.json"
+        config_file.write_bytes(_MINIMAL_NOTIF_CONFIG_BYTES)
         
-        # 通知マネージャーを作成
-        manager = NotificationManager(str(config_file))
-        manager.db_path = data_dir / "notifications.db"
+        # 通知マネージャーを作成（DBはテストごとの一時ファイル）
+        manager = NotificationManager(str(config_file), db_path=notification_db)
         
         # エラー通知を送信
         error = ValueError("テストエラー")
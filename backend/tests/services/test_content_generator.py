@@ -3,12 +3,15 @@
 """
 import pytest
 import asyncio
-import tempfile
+import gc
 import os
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
+import weakref
+import uuid
+from aioresponses import aioresponses
 from datetime import datetime
 import json
 import sqlite3
+import time_machine
 
 from app.services.content_generator import (
     ContentGenerator,
@@ -18,37 +21,62 @@ from app.services.content_generator import (
 )
 from core.error_handling.error_handler import ContentGenerationError
 
-@pytest.fixture
+FIXED_NOW = datetime(2024, 1, 1)
+
+@pytest.fixture(autouse=True)
+def frozen_time():
+    """現在時刻を固定"""
+    with time_machine.travel(FIXED_NOW, tick=False):
+        yield
+
+@pytest.fixture(scope="class")
 def temp_db():
-    """一時データベース"""
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
-        db_path = f.name
-    yield db_path
-    os.unlink(db_path)
+    """一時データベース（共有キャッシュのインメモリSQLite）"""
+    db_uri = f"file:contentgen_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    # 共有キャッシュのDBは接続が一つでも開いている間だけ保持される
+    anchor = sqlite3.connect(db_uri, uri=True)
+    yield db_uri
+    anchor.close()
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def content_generator(temp_db):
-    """コンテンツ生成器"""
-    return ContentGenerator(api_key="test_key", db_path=temp_db)
+    """コンテンツ生成器（クラス内で共有）"""
+    generator = ContentGenerator(api_key="test_key", db_path=temp_db, fast_unsafe=True)
+    yield generator
+    generator.close()
 
-@pytest.fixture
-def mock_response():
-    """モックレスポンス"""
-    mock = Mock()
-    mock.status = 200
-    mock.json = AsyncMock(return_value={
-        "choices": [{
-            "message": {
-                "content": "Generated test content"
-            }
-        }],
-        "usage": {
-            "prompt_tokens": 10,
-            "completion_tokens": 20,
-            "total_tokens": 30
+@pytest.fixture(autouse=True)
+def _reset_generator(content_generator):
+    """テストごとに共有生成器の状態を初期化"""
+    yield
+    content_generator.api_key = "test_key"
+    content_generator.clear_response_cache()
+    content_generator.clear_history()
+    with content_generator._connection() as conn:
+        conn.execute("DELETE FROM prompt_templates")
+    content_generator.invalidate_template_cache()
+
+OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
+
+_CHAT_PAYLOAD = {
+    "choices": [{
+        "message": {
+            "content": "Generated test content"
         }
-    })
-    return mock
+    }],
+    "usage": {
+        "prompt_tokens": 10,
+        "completion_tokens": 20,
+        "total_tokens": 30
+    }
+}
+
+@pytest.fixture
+def mocked_openai():
+    """OpenAI Chat Completions APIのモック"""
+    with aioresponses() as m:
+        m.post(OPENAI_CHAT_URL, payload=_CHAT_PAYLOAD, repeat=True)
+        yield m
 
 @pytest.fixture
 def sample_template():
@@ -59,43 +87,85 @@ def sample_template():
         description="Test template",
         category="test",
         parameters={"temperature": 0.7},
-        created_at=datetime.now(),
-        updated_at=datetime.now()
+        created_at=FIXED_NOW,
+        updated_at=FIXED_NOW
     )
 
+@pytest.fixture
+def populated_generator(content_generator):
+    """複数カテゴリのテンプレートを一括投入した生成器"""
+    templates = [
+        PromptTemplate(
+            name=f"bulk_{category}_{i}",
+            template=f"{category} {i}: {{prompt}}",
+            description=f"Bulk template {i}",
+            category=category,
+            parameters={"temperature": 0.5},
+            created_at=FIXED_NOW,
+            updated_at=FIXED_NOW
+        )
+        for category in ("news", "tips")
+        for i in range(5)
+    ]
+    content_generator.add_prompt_templates_bulk(templates)
+    return content_generator
+
+@pytest.mark.xdist_group("contentgen")
 class TestContentGenerator:
     """コンテンツ生成器のテスト"""
     
     def test_init(self, temp_db):
         """初期化テスト"""
-        generator = ContentGenerator(api_key="test_key", db_path=temp_db)
+        generator = ContentGenerator(api_key="test_key", db_path=temp_db, fast_unsafe=True)
         assert generator.api_key == "test_key"
         assert generator.db_path == temp_db
         assert generator.base_url == "https://api.openai.com/v1/chat/completions"
     
     def test_init_with_env_var(self, temp_db, monkeypatch):
-        """環境変数での初期化テスト"""
+        """環境変数での初期化テスト（生成時の環境変数を使用）"""
         monkeypatch.setenv("OPENAI_API_KEY", "env_key")
-        generator = ContentGenerator(db_path=temp_db)
+        generator = ContentGenerator(db_path=temp_db, fast_unsafe=True)
+        assert generator.api_key == "env_key"
+        # 空文字のキーは未指定として環境変数にフォールバックする
+        generator = ContentGenerator(api_key="", db_path=temp_db, fast_unsafe=True)
         assert generator.api_key == "env_key"
     
+    def test_released_without_close(self, temp_db):
+        """close() を呼ばなくてもインスタンスは保持されず、破棄時に接続が閉じられるテスト"""
+        generator = ContentGenerator(api_key="test_key", db_path=temp_db, fast_unsafe=True)
+        ref = weakref.ref(generator)
+        conn = generator._conn
+        
+        del generator
+        gc.collect()
+        
+        assert ref() is None
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    
+    def test_context_manager_closes(self, temp_db):
+        """with ブロックを抜けると接続が閉じられるテスト"""
+        with ContentGenerator(api_key="test_key", db_path=temp_db, fast_unsafe=True) as generator:
+            conn = generator._conn
+        
+        assert generator._conn is None
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    
     def test_database_initialization(self, temp_db):
         """データベース初期化テスト"""
-        generator = ContentGenerator(api_key="test_key", db_path=temp_db)
-        
-        # データベースファイルが作成されていることを確認
-        assert os.path.exists(temp_db)
+        generator = ContentGenerator(api_key="test_key", db_path=temp_db, fast_unsafe=True)
         
         # テーブルが作成されていることを確認
-        with sqlite3.connect(temp_db) as conn:
+        with sqlite3.connect(temp_db, uri=True) as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
             tables = [row[0] for row in cursor.fetchall()]
             assert "generation_history" in tables
             assert "prompt_templates" in tables
     
-    @pytest.mark.asyncio
-    async def test_generate_text_success(self, content_generator, mock_response):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_generate_text_success(self, content_generator, mocked_openai):
         """テキスト生成成功のテスト"""
         request = GenerationRequest(
             prompt="Test prompt",
@@ -103,20 +173,43 @@ class TestContentGenerator:
             max_tokens=100
         )
         
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_session.return_value.__aenter__.return_value.post.return_value.__aenter__.return_value = mock_response
-            
-            result = await content_generator.generate_text(request)
-            
-            assert isinstance(result, GenerationResult)
-            assert result.content == "Generated test content"
-            assert result.prompt == "Test prompt"
-            assert result.template_name is None
-            assert result.model == "gpt-3.5-turbo"
-            assert result.usage is not None
-            assert result.usage["total_tokens"] == 30
+        result = await content_generator.generate_text(request)
+        
+        assert isinstance(result, GenerationResult)
+        assert result.content == "Generated test content"
+        assert result.prompt == "Test prompt"
+        assert result.template_name is None
+        assert result.model == "gpt-3.5-turbo"
+        assert result.usage is not None
+        assert result.usage["total_tokens"] == 30
+    
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_generate_text_cache_hit(self, content_generator, mocked_openai):
+        """同一リクエストのキャッシュヒットテスト"""
+        request = GenerationRequest(prompt="Cached prompt", use_cache=True)
+        
+        first = await content_generator.generate_text(request)
+        second = await content_generator.generate_text(GenerationRequest(prompt="Cached prompt", use_cache=True))
+        
+        assert second.content == first.content
+        assert second.id != first.id
+        assert sum(len(calls) for calls in mocked_openai.requests.values()) == 1
+        # キャッシュヒットも履歴に記録される
+        history = content_generator.get_generation_history()
+        assert {entry.id for entry in history} == {first.id, second.id}
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_generate_text_cache_disabled(self, content_generator, mocked_openai):
+        """キャッシュ無効時は毎回APIを呼び出すテスト"""
+        # 既定ではキャッシュしない
+        request = GenerationRequest(prompt="Uncached prompt")
+        
+        await content_generator.generate_text(request)
+        await content_generator.generate_text(request)
+        
+        assert sum(len(calls) for calls in mocked_openai.requests.values()) == 2
+    
+    @pytest.mark.asyncio(loop_scope="class")
     async def test_generate_text_no_api_key(self, content_generator):
         """APIキーなしでのテキスト生成テスト"""
         request = GenerationRequest(prompt="Test prompt")
@@ -125,23 +218,19 @@ class TestContentGenerator:
         with pytest.raises(ContentGenerationError, match="OpenAI APIキーが設定されていません"):
             await content_generator.generate_text(request)
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="class")
     async def test_generate_text_api_error(self, content_generator):
         """APIエラー時のテキスト生成テスト"""
         request = GenerationRequest(prompt="Test prompt")
         
-        mock_response = Mock()
-        mock_response.status = 400
-        mock_response.text = AsyncMock(return_value="API Error")
-        
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_session.return_value.__aenter__.return_value.post.return_value.__aenter__.return_value = mock_response
+        with aioresponses() as m:
+            m.post(OPENAI_CHAT_URL, status=400, body="API Error")
             
             with pytest.raises(ContentGenerationError, match="テキスト生成に失敗しました"):
                 await content_generator.generate_text(request)
     
-    @pytest.mark.asyncio
-    async def test_generate_text_with_template(self, content_generator, mock_response, sample_template):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_generate_text_with_template(self, content_generator, mocked_openai, sample_template):
         """テンプレート付きテキスト生成テスト"""
         # テンプレートを追加
         content_generator.add_prompt_template(sample_template)
@@ -151,33 +240,28 @@ class TestContentGenerator:
             template_name="test_template"
         )
         
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_session.return_value.__aenter__.return_value.post.return_value.__aenter__.return_value = mock_response
-            
-            result = await content_generator.generate_text(request)
-            
-            assert result.prompt == "Template: Test prompt"
+        result = await content_generator.generate_text(request)
+        
+        assert result.prompt == "Template: Test prompt"
     
-    @pytest.mark.asyncio
-    async def test_generate_variations(self, content_generator, mock_response):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_generate_variations(self, content_generator, mocked_openai):
         """複数バリエーション生成テスト"""
         request = GenerationRequest(
             prompt="Test prompt",
             temperature=0.7
         )
         
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_session.return_value.__aenter__.return_value.post.return_value.__aenter__.return_value = mock_response
-            
-            variations = await content_generator.generate_variations(request, count=3)
-            
-            assert len(variations) == 3
-            for i, variation in enumerate(variations):
-                assert isinstance(variation, GenerationResult)
-                assert variation.content == "Generated test content"
-                # 温度パラメータが少しずつ異なることを確認
-                expected_temp = 0.7 + (i * 0.1)
-                assert variation.parameters["temperature"] == expected_temp
+        variations = await content_generator.generate_variations(request, count=3)
+        
+        assert len(variations) == 3
+        variations.sort(key=lambda v: v.parameters["temperature"])
+        for i, variation in enumerate(variations):
+            assert isinstance(variation, GenerationResult)
+            assert variation.content == "Generated test content"
+            # 温度パラメータが少しずつ異なることを確認
+            expected_temp = 0.7 + (i * 0.1)
+            assert variation.parameters["temperature"] == expected_temp
     
     def test_add_prompt_template(self, content_generator, sample_template):
         """プロンプトテンプレート追加テスト"""
@@ -201,6 +285,14 @@ class TestContentGenerator:
         templates = content_generator.get_prompt_templates(category="nonexistent")
         assert len(templates) == 0
     
+    def test_add_prompt_templates_bulk(self, populated_generator):
+        """テンプレート一括追加テスト"""
+        assert len(populated_generator.get_prompt_templates()) == 10
+        
+        news_templates = populated_generator.get_prompt_templates(category="news")
+        assert len(news_templates) == 5
+        assert all(t.category == "news" for t in news_templates)
+    
     def test_get_generation_history(self, content_generator):
         """生成履歴取得テスト"""
         history = content_generator.get_generation_history()
@@ -219,7 +311,7 @@ class TestContentGenerator:
     
     def test_clear_history_before_date(self, content_generator):
         """日付指定履歴クリアテスト"""
-        before_date = datetime.now()
+        before_date = FIXED_NOW
         deleted_count = content_generator.clear_history(before_date=before_date)
         assert deleted_count == 0
     
@@ -247,21 +339,21 @@ class TestContentGenerator:
         final_prompt = content_generator._apply_template(request)
         assert final_prompt == "Test prompt"  # 元のプロンプトが返される
     
-    def test_get_system_prompt(self, content_generator):
+    @pytest.mark.parametrize(
+        "style, language, expected_style",
+        [
+            ("casual", "日本語", "親しみやすく、カジュアルな口調で"),
+            ("formal", "英語", "丁寧で、フォーマルな口調で"),
+            # 存在しないスタイルはデフォルト（カジュアル）になる
+            ("unknown", "日本語", "親しみやすく、カジュアルな口調で"),
+        ],
+        ids=["casual", "formal", "unknown"]
+    )
+    def test_get_system_prompt(self, content_generator, style, language, expected_style):
         """システムプロンプト取得テスト"""
-        # カジュアルスタイル
-        prompt = content_generator._get_system_prompt("casual", "日本語")
-        assert "親しみやすく、カジュアルな口調で" in prompt
-        assert "日本語" in prompt
-        
-        # フォーマルスタイル
-        prompt = content_generator._get_system_prompt("formal", "英語")
-        assert "丁寧で、フォーマルな口調で" in prompt
-        assert "英語" in prompt
-        
-        # 存在しないスタイル
-        prompt = content_generator._get_system_prompt("unknown", "日本語")
-        assert "親しみやすく、カジュアルな口調で" in prompt  # デフォルトスタイル
+        prompt = content_generator._get_system_prompt(style, language)
+        assert expected_style in prompt
+        assert language in prompt
     
     def test_create_variation_request(self, content_generator):
         """バリエーションリクエスト作成テスト"""
@@ -285,8 +377,10 @@ class TestContentGenerator:
         assert id1 != id2
         assert id1.startswith("gen_")
         assert id2.startswith("gen_")
+        # 同時に起動したワーカープロセス間で衝突しないようプロセスIDを含む
+        assert id1.startswith(f"gen_{os.getpid():x}_")
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="class")
     async def test_save_to_history(self, content_generator):
         """履歴保存テスト"""
         result = GenerationResult(
@@ -295,7 +389,7 @@ class TestContentGenerator:
             prompt="Test prompt",
             template_name=None,
             parameters={"temperature": 0.7},
-            created_at=datetime.now(),
+            created_at=FIXED_NOW,
             model="gpt-3.5-turbo",
             usage={"total_tokens": 30}
         )
@@ -308,13 +402,14 @@ class TestContentGenerator:
         assert history[0].id == "test_id"
         assert history[0].content == "Test content"
     
-    @pytest.mark.asyncio
+    @pytest.mark.slow
+    @pytest.mark.asyncio(loop_scope="class")
     async def test_generate_text_network_error(self, content_generator):
         """ネットワークエラー時のテスト"""
         request = GenerationRequest(prompt="Test prompt")
         
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_session.side_effect = Exception("Network error")
+        with aioresponses() as m:
+            m.post(OPENAI_CHAT_URL, exception=Exception("Network error"))
             
             with pytest.raises(ContentGenerationError, match="テキスト生成中にエラーが発生しました"):
                 await content_generator.generate_text(request)
@@ -327,8 +422,8 @@ class TestContentGenerator:
             description="Parameter test",
             category="test",
             parameters={"temperature": 0.8, "max_tokens": 500},
-            created_at=datetime.now(),
-            updated_at=datetime.now()
+            created_at=FIXED_NOW,
+            updated_at=FIXED_NOW
         )
         
         content_generator.add_prompt_template(template)
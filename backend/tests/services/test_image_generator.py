@@ -3,40 +3,35 @@
 """
 import pytest
 import asyncio
-from unittest.mock import Mock, patch, AsyncMock
+from aioresponses import aioresponses
 from pathlib import Path
-import tempfile
-import os
 
 from app.services.image_generator import ImageGenerator
 from core.error_handling.error_handler import ImageGenerationError
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def image_generator():
-    """テスト用の画像生成器"""
+    """テスト用の画像生成器（クラス内で共有）"""
     return ImageGenerator(api_key="test_api_key")
 
-@pytest.fixture
-def mock_response():
-    """モックレスポンス"""
-    mock = Mock()
-    mock.status = 200
-    mock.json = AsyncMock(return_value={
-        "data": [{
-            "url": "https://example.com/generated_image.png",
-            "revised_prompt": "test prompt"
-        }]
-    })
-    return mock
+OPENAI_IMAGES_URL = "https://api.openai.com/v1/images"
+
+_IMAGE_PAYLOAD = {
+    "data": [{
+        "url": "https://example.com/generated_image.png",
+        "revised_prompt": "test prompt"
+    }]
+}
 
 @pytest.fixture
-def mock_error_response():
-    """エラーレスポンスのモック"""
-    mock = Mock()
-    mock.status = 400
-    mock.text = AsyncMock(return_value="Bad Request")
-    return mock
+def mocked_openai():
+    """OpenAI Images APIのモック"""
+    with aioresponses() as m:
+        m.post(f"{OPENAI_IMAGES_URL}/generations", payload=_IMAGE_PAYLOAD, repeat=True)
+        m.post(f"{OPENAI_IMAGES_URL}/variations", payload=_IMAGE_PAYLOAD, repeat=True)
+        yield m
 
+@pytest.mark.xdist_group("imagegen")
 class TestImageGenerator:
     """画像生成器のテストクラス"""
     
@@ -47,30 +42,27 @@ class TestImageGenerator:
         assert generator.base_url == "https://api.openai.com/v1/images"
         assert generator.default_params["model"] == "dall-e-3"
     
-    def test_init_without_api_key(self):
-        """APIキーなしでの初期化テスト"""
-        with patch.dict(os.environ, {"OPENAI_API_KEY": "env_key"}):
-            generator = ImageGenerator()
-            assert generator.api_key == "env_key"
+    def test_init_without_api_key(self, monkeypatch):
+        """APIキーなしでの初期化テスト（環境変数のキーを使用）"""
+        monkeypatch.setenv("OPENAI_API_KEY", "env_key")
+        generator = ImageGenerator()
+        assert generator.api_key == "env_key"
     
-    def test_init_without_api_key_no_env(self):
+    def test_init_without_api_key_no_env(self, monkeypatch):
         """APIキーなし・環境変数なしでの初期化テスト"""
-        with patch.dict(os.environ, {}, clear=True):
-            generator = ImageGenerator()
-            assert generator.api_key is None
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        generator = ImageGenerator()
+        assert generator.api_key is None
     
-    @pytest.mark.asyncio
-    async def test_generate_image_success(self, image_generator, mock_response):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_generate_image_success(self, image_generator, mocked_openai):
         """画像生成成功のテスト"""
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_session.return_value.__aenter__.return_value.post.return_value.__aenter__.return_value = mock_response
-            
-            result = await image_generator.generate_image("test prompt")
-            
-            assert result["data"][0]["url"] == "https://example.com/generated_image.png"
-            assert result["data"][0]["revised_prompt"] == "test prompt"
+        result = await image_generator.generate_image("test prompt")
+        
+        assert result["data"][0]["url"] == "https://example.com/generated_image.png"
+        assert result["data"][0]["revised_prompt"] == "test prompt"
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="class")
     async def test_generate_image_no_api_key(self):
         """APIキーなしでの画像生成テスト"""
         generator = ImageGenerator(api_key=None)
@@ -78,47 +70,38 @@ class TestImageGenerator:
         with pytest.raises(ImageGenerationError, match="OpenAI APIキーが設定されていません"):
             await generator.generate_image("test prompt")
     
-    @pytest.mark.asyncio
-    async def test_generate_image_api_error(self, image_generator, mock_error_response):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_generate_image_api_error(self, image_generator):
         """APIエラー時の画像生成テスト"""
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_session.return_value.__aenter__.return_value.post.return_value.__aenter__.return_value = mock_error_response
+        with aioresponses() as m:
+            m.post(f"{OPENAI_IMAGES_URL}/generations", status=400, body="Bad Request")
             
             with pytest.raises(ImageGenerationError, match="画像生成に失敗しました"):
                 await image_generator.generate_image("test prompt")
     
-    @pytest.mark.asyncio
-    async def test_generate_image_with_custom_params(self, image_generator, mock_response):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_generate_image_with_custom_params(self, image_generator, mocked_openai):
         """カスタムパラメータでの画像生成テスト"""
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_session.return_value.__aenter__.return_value.post.return_value.__aenter__.return_value = mock_response
-            
-            result = await image_generator.generate_image(
-                "test prompt",
-                size="512x512",
-                quality="hd",
-                style="natural"
-            )
-            
-            assert result["data"][0]["url"] == "https://example.com/generated_image.png"
+        result = await image_generator.generate_image(
+            "test prompt",
+            size="512x512",
+            quality="hd",
+            style="natural"
+        )
+        
+        assert result["data"][0]["url"] == "https://example.com/generated_image.png"
     
-    @pytest.mark.asyncio
-    async def test_generate_variations_success(self, image_generator, mock_response):
+    @pytest.mark.slow
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_generate_variations_success(self, image_generator, mocked_openai, tmp_path):
         """画像バリエーション生成成功のテスト"""
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_session.return_value.__aenter__.return_value.post.return_value.__aenter__.return_value = mock_response
-            
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as temp_file:
-                temp_file.write(b"fake image data")
-                temp_file_path = temp_file.name
-            
-            try:
-                result = await image_generator.generate_variations(temp_file_path, n=2)
-                assert result["data"][0]["url"] == "https://example.com/generated_image.png"
-            finally:
-                os.unlink(temp_file_path)
+        image_path = tmp_path / "img.png"
+        image_path.write_bytes(b"fake image data")
+        
+        result = await image_generator.generate_variations(str(image_path), n=2)
+        assert result["data"][0]["url"] == "https://example.com/generated_image.png"
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="class")
     async def test_generate_variations_no_api_key(self):
         """APIキーなしでのバリエーション生成テスト"""
         generator = ImageGenerator(api_key=None)
@@ -126,60 +109,50 @@ class TestImageGenerator:
         with pytest.raises(ImageGenerationError, match="OpenAI APIキーが設定されていません"):
             await generator.generate_variations("nonexistent.png")
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="class")
     async def test_generate_variations_file_not_found(self, image_generator):
         """存在しないファイルでのバリエーション生成テスト"""
         with pytest.raises(ImageGenerationError, match="元画像が見つかりません"):
             await image_generator.generate_variations("nonexistent.png")
     
-    def test_optimize_prompt_basic(self, image_generator):
-        """基本的なプロンプト最適化テスト"""
-        result = image_generator.optimize_prompt("cat")
-        assert "high quality photo of cat" in result
-        assert "high resolution" in result
-        assert "professional photography" in result
-    
-    def test_optimize_prompt_with_photo_keyword(self, image_generator):
-        """写真キーワード付きプロンプトの最適化テスト"""
-        result = image_generator.optimize_prompt("photo of a cat")
-        assert "high quality photo of photo of a cat" in result
-    
-    def test_optimize_prompt_empty(self, image_generator):
-        """空のプロンプト最適化テスト"""
-        result = image_generator.optimize_prompt("")
-        assert "high quality photo of" in result
-    
-    def test_optimize_prompt_whitespace(self, image_generator):
-        """空白付きプロンプト最適化テスト"""
-        result = image_generator.optimize_prompt("  cat  ")
-        assert "high quality photo of cat" in result
-    
-    @pytest.mark.asyncio
-    async def test_save_generated_image_success(self, image_generator):
+    @pytest.mark.parametrize(
+        "prompt, must_contain",
+        [
+            ("cat", ["high quality photo of cat", "high resolution", "professional photography"]),
+            ("photo of a cat", ["high quality photo of photo of a cat"]),
+            ("", ["high quality photo of"]),
+            ("  cat  ", ["high quality photo of cat"]),
+        ],
+        ids=["basic", "with_photo_keyword", "empty", "whitespace"]
+    )
+    def test_optimize_prompt(self, image_generator, prompt, must_contain):
+        """プロンプト最適化テスト"""
+        result = image_generator.optimize_prompt(prompt)
+        for expected in must_contain:
+            assert expected in result
+    
+    @pytest.mark.slow
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_save_generated_image_success(self, image_generator, tmp_path):
         """画像保存成功のテスト"""
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_response = Mock()
-            mock_response.status = 200
-            mock_response.read = AsyncMock(return_value=b"fake image data")
-            mock_session.return_value.__aenter__.return_value.get.return_value.__aenter__.return_value = mock_response
+        with aioresponses() as m:
+            m.get("https://example.com/image.png", body=b"fake image data")
             
-            with tempfile.TemporaryDirectory() as temp_dir:
-                result = await image_generator.save_generated_image(
-                    "https://example.com/image.png",
-                    save_dir=temp_dir
-                )
-                
-                assert Path(result).exists()
-                assert Path(result).suffix == ".png"
-                assert "generated_image_" in Path(result).name
-    
-    @pytest.mark.asyncio
+            result = await image_generator.save_generated_image(
+                "https://example.com/image.png",
+                save_dir=str(tmp_path)
+            )
+            
+            assert Path(result).exists()
+            assert Path(result).suffix == ".png"
+            assert "generated_image_" in Path(result).name
+    
+    @pytest.mark.slow
+    @pytest.mark.asyncio(loop_scope="class")
     async def test_save_generated_image_download_error(self, image_generator):
         """画像ダウンロードエラー時のテスト"""
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_response = Mock()
-            mock_response.status = 404
-            mock_session.return_value.__aenter__.return_value.get.return_value.__aenter__.return_value = mock_response
+        with aioresponses() as m:
+            m.get("https://example.com/image.png", status=404)
             
             with pytest.raises(ImageGenerationError, match="画像のダウンロードに失敗しました"):
                 await image_generator.save_generated_image("https://example.com/image.png")
@@ -195,24 +168,25 @@ class TestImageGenerator:
         result = image_generator.clear_history()
         assert result is True
     
-    @pytest.mark.asyncio
+    @pytest.mark.slow
+    @pytest.mark.asyncio(loop_scope="class")
     async def test_generate_image_network_error(self, image_generator):
         """ネットワークエラー時のテスト"""
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_session.side_effect = Exception("Network error")
+        with aioresponses() as m:
+            m.post(f"{OPENAI_IMAGES_URL}/generations", exception=Exception("Network error"))
             
             with pytest.raises(ImageGenerationError, match="画像生成中にエラーが発生しました"):
                 await image_generator.generate_image("test prompt")
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="class")
     async def test_generate_image_json_error(self, image_generator):
         """JSON解析エラー時のテスト"""
-        mock_response = Mock()
-        mock_response.status = 200
-        mock_response.json = AsyncMock(side_effect=Exception("JSON error"))
-        
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_session.return_value.__aenter__.return_value.post.return_value.__aenter__.return_value = mock_response
+        with aioresponses() as m:
+            m.post(
+                f"{OPENAI_IMAGES_URL}/generations",
+                body="not json",
+                content_type="application/json"
+            )
             
             with pytest.raises(ImageGenerationError, match="画像生成中にエラーが発生しました"):
                 await image_generator.generate_image("test prompt") 
\ No newline at end of file
@@ -3,7 +3,6 @@
 """
 import pytest
 import json
-import tempfile
 from pathlib import Path
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, AsyncMock
@@ -14,24 +13,21 @@ from app.services.post_manager import (
 )
 from app.services.scheduler import PostSchedule
 
-@pytest.fixture
-def temp_data_dir():
-    """一時データディレクトリ"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield temp_dir
-
-@pytest.fixture
-def post_manager(temp_data_dir):
-    """投稿管理サービスのインスタンス"""
+@pytest.fixture(scope="module", autouse=True)
+def _patched_deps():
+    """外部サービス依存をモジュール単位で一度だけモック化"""
     with patch('app.services.post_manager.ContentGenerator'), \
          patch('app.services.post_manager.ImageGenerator'), \
          patch('app.services.post_manager.VideoGenerator'), \
          patch('app.services.post_manager.XService'):
-        
-        manager = PostManager(data_dir=temp_data_dir)
-        yield manager
+        yield
 
 @pytest.fixture
+def post_manager(tmp_path):
+    """投稿管理サービスのインスタンス"""
+    return PostManager(data_dir=str(tmp_path))
+
+@pytest.fixture(scope="module")
 def sample_post_content():
     """サンプル投稿コンテンツ"""
     return PostContent(
@@ -41,7 +37,7 @@ def sample_post_content():
         links=[]
     )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_post_template():
     """サンプル投稿テンプレート"""
     return PostTemplate(
@@ -56,22 +52,17 @@ def sample_post_template():
 class TestPostManager:
     """投稿管理サービスのテストクラス"""
     
-    def test_init(self, temp_data_dir):
+    def test_init(self, tmp_path):
         """初期化テスト"""
-        with patch('app.services.post_manager.ContentGenerator'), \
-             patch('app.services.post_manager.ImageGenerator'), \
-             patch('app.services.post_manager.VideoGenerator'), \
-             patch('app.services.post_manager.XService'):
-            
-            manager = PostManager(data_dir=temp_data_dir)
-            
-            assert manager.data_dir == Path(temp_data_dir)
-            assert manager.posts_file == Path(temp_data_dir) / "posts.json"
-            assert manager.templates_file == Path(temp_dir) / "templates.json"
-            assert manager.drafts_file == Path(temp_dir) / "drafts.json"
-            assert len(manager.posts) == 0
-            assert len(manager.templates) > 0  # デフォルトテンプレート
-            assert len(manager.drafts) == 0
+        manager = PostManager(data_dir=str(tmp_path))
+        
+        assert manager.data_dir == tmp_path
+        assert manager.posts_file == tmp_path / "posts.json"
+        assert manager.templates_file == tmp_path / "templates.json"
+        assert manager.drafts_file == tmp_path / "drafts.json"
+        assert len(manager.posts) == 0
+        assert len(manager.templates) > 0  # デフォルトテンプレート
+        assert len(manager.drafts) == 0
     
     def test_create_post(self, post_manager, sample_post_content):
         """投稿作成テスト"""
@@ -272,27 +263,22 @@ class TestPostManager:
         
         assert "投稿が見つかりません" in str(exc_info.value)
     
-    def test_save_and_load_data(self, temp_data_dir, sample_post_content):
+    def test_save_and_load_data(self, tmp_path, sample_post_content):
         """データ保存・読み込みテスト"""
-        with patch('app.services.post_manager.ContentGenerator'), \
-             patch('app.services.post_manager.ImageGenerator'), \
-             patch('app.services.post_manager.VideoGenerator'), \
-             patch('app.services.post_manager.XService'):
-            
-            # 最初のマネージャーで投稿を作成
-            manager1 = PostManager(data_dir=temp_data_dir)
-            post = manager1.create_post(
-                content=sample_post_content,
-                post_type=PostType.TEXT
-            )
-            
-            # 新しいマネージャーでデータを読み込み
-            manager2 = PostManager(data_dir=temp_data_dir)
-            loaded_post = manager2.get_post(post.id)
-            
-            assert loaded_post is not None
-            assert loaded_post.content.text == post.content.text
-            assert loaded_post.post_type == post.post_type
+        # 最初のマネージャーで投稿を作成
+        manager1 = PostManager(data_dir=str(tmp_path))
+        post = manager1.create_post(
+            content=sample_post_content,
+            post_type=PostType.TEXT
+        )
+        
+        # 新しいマネージャーでデータを読み込み
+        manager2 = PostManager(data_dir=str(tmp_path))
+        loaded_post = manager2.get_post(post.id)
+        
+        assert loaded_post is not None
+        assert loaded_post.content.text == post.content.text
+        assert loaded_post.post_type == post.post_type
     
     def test_post_content_validation(self, post_manager):
         """投稿コンテンツのバリデーションテスト"""
@@ -350,12 +336,16 @@ class TestPostManager:
                 post_type=PostType.TEXT
             )
     
-    def test_concurrent_access(self, post_manager, sample_post_content):
+    @pytest.mark.parametrize("thread_count", [2, 4])
+    def test_concurrent_access(self, post_manager, sample_post_content, thread_count):
         """並行アクセステスト"""
         import threading
-        import time
+        
+        # 全スレッドの開始を揃え、バイトコード単位で処理が交互に実行されるようにする
+        barrier = threading.Barrier(thread_count)
         
         def create_post():
+            barrier.wait()
             try:
                 post_manager.create_post(
                     content=sample_post_content,
@@ -365,15 +355,14 @@ class TestPostManager:
                 pass
         
         # 複数のスレッドで同時に投稿を作成
-        threads = []
-        for _ in range(5):
-            thread = threading.Thread(target=create_post)
-            threads.append(thread)
+        threads = [threading.Thread(target=create_post) for _ in range(thread_count)]
+        for thread in threads:
             thread.start()
         
         for thread in threads:
-            thread.join()
+            thread.join(timeout=10)
         
-        # データの整合性を確認
+        # データの整合性を確認（デッドロックせず、作成数を超える下書きが残らない）
+        assert not any(thread.is_alive() for thread in threads)
         drafts = post_manager.get_drafts()
-        assert len(drafts) >= 0  # エラーが発生してもシステムが破綻しないことを確認 
\ No newline at end of file
+        assert 0 <= len(drafts) <= thread_count
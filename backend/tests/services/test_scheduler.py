@@ -3,7 +3,6 @@
 """
 import pytest
 import json
-import tempfile
 import asyncio
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -15,22 +14,22 @@ from app.services.scheduler import (
 )
 from app.services.post_manager import PostManager, Post, PostContent, PostType, PostStatus
 
-@pytest.fixture
-def temp_data_dir():
-    """一時データディレクトリ"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield temp_dir
+# モジュールスコープのサンプルデータで共有する固定時刻
+FIXED_NOW = datetime(2024, 1, 1)
 
-@pytest.fixture
-def scheduler(temp_data_dir):
-    """スケジューラーのインスタンス"""
+@pytest.fixture(scope="module", autouse=True)
+def _patched_deps():
+    """外部依存をモジュール単位で一度だけモック化"""
     with patch('backend.app.services.scheduler.PostManager'), \
          patch('backend.app.services.scheduler.get_task_manager'):
-        
-        scheduler = PostScheduler(data_dir=temp_data_dir)
-        yield scheduler
+        yield
 
 @pytest.fixture
+def scheduler(tmp_path):
+    """スケジューラーのインスタンス"""
+    return PostScheduler(data_dir=str(tmp_path))
+
+@pytest.fixture(scope="module")
 def sample_post():
     """サンプル投稿"""
     return Post(
@@ -45,16 +44,16 @@ def sample_post():
         status=PostStatus.DRAFT,
         post_type=PostType.TEXT,
         template_name=None,
-        created_at=datetime.now(),
-        updated_at=datetime.now()
+        created_at=FIXED_NOW,
+        updated_at=FIXED_NOW
     )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_schedule_config():
     """サンプルスケジュール設定"""
     return ScheduleConfig(
         schedule_type=ScheduleType.DAILY,
-        start_time=datetime.now(),
+        start_time=FIXED_NOW,
         interval_hours=24,
         days_of_week=[0, 1, 2, 3, 4, 5, 6],
         optimal_time_slots=[
@@ -68,19 +67,16 @@ def sample_schedule_config():
 class TestPostScheduler:
     """投稿スケジューラーのテストクラス"""
     
-    def test_init(self, temp_data_dir):
+    def test_init(self, tmp_path):
         """初期化テスト"""
-        with patch('backend.app.services.scheduler.PostManager'), \
-             patch('backend.app.services.scheduler.get_task_manager'):
-            
-            scheduler = PostScheduler(data_dir=temp_data_dir)
-            
-            assert scheduler.data_dir == Path(temp_data_dir)
-            assert scheduler.schedules_file == Path(temp_data_dir) / "schedules.json"
-            assert scheduler.config_file == Path(temp_data_dir) / "config.json"
-            assert len(scheduler.schedules) == 0
-            assert scheduler.config is not None
-            assert scheduler.config.schedule_type == ScheduleType.DAILY
+        scheduler = PostScheduler(data_dir=str(tmp_path))
+        
+        assert scheduler.data_dir == tmp_path
+        assert scheduler.schedules_file == tmp_path / "schedules.json"
+        assert scheduler.config_file == tmp_path / "config.json"
+        assert len(scheduler.schedules) == 0
+        assert scheduler.config is not None
+        assert scheduler.config.schedule_type == ScheduleType.DAILY
     
     def test_schedule_post(self, scheduler, sample_post):
         """投稿スケジュールテスト"""
@@ -278,27 +274,24 @@ class TestPostScheduler:
             assert stats["pending_schedules"] == 3
             assert stats["success_rate"] >= 0
     
-    def test_save_and_load_data(self, temp_data_dir):
+    def test_save_and_load_data(self, tmp_path):
         """データ保存・読み込みテスト"""
-        with patch('backend.app.services.scheduler.PostManager'), \
-             patch('backend.app.services.scheduler.get_task_manager'):
-            
-            # 最初のスケジューラーでスケジュールを作成
-            scheduler1 = PostScheduler(data_dir=temp_data_dir)
-            with patch.object(scheduler1.post_manager, 'get_post', return_value=Mock()):
-                schedule = scheduler1.schedule_post(
-                    post_id="test_post_id",
-                    scheduled_time=datetime.now() + timedelta(hours=1),
-                    schedule_type=ScheduleType.ONCE
-                )
-            
-            # 新しいスケジューラーでデータを読み込み
-            scheduler2 = PostScheduler(data_dir=temp_data_dir)
-            loaded_schedule = scheduler2.get_schedule(schedule.id)
-            
-            assert loaded_schedule is not None
-            assert loaded_schedule.post_id == schedule.post_id
-            assert loaded_schedule.schedule_type == schedule.schedule_type
+        # 最初のスケジューラーでスケジュールを作成
+        scheduler1 = PostScheduler(data_dir=str(tmp_path))
+        with patch.object(scheduler1.post_manager, 'get_post', return_value=Mock()):
+            schedule = scheduler1.schedule_post(
+                post_id="test_post_id",
+                scheduled_time=datetime.now() + timedelta(hours=1),
+                schedule_type=ScheduleType.ONCE
+            )
+        
+        # 新しいスケジューラーでデータを読み込み
+        scheduler2 = PostScheduler(data_dir=str(tmp_path))
+        loaded_schedule = scheduler2.get_schedule(schedule.id)
+        
+        assert loaded_schedule is not None
+        assert loaded_schedule.post_id == schedule.post_id
+        assert loaded_schedule.schedule_type == schedule.schedule_type
     
     @pytest.mark.asyncio
     async def test_scheduler_loop(self, scheduler):
@@ -396,32 +389,35 @@ class TestPostScheduler:
                 schedule_type=ScheduleType.ONCE
             )
     
-    def test_concurrent_schedule_creation(self, scheduler, sample_post):
+    @pytest.mark.parametrize("thread_count", [2, 4])
+    def test_concurrent_schedule_creation(self, scheduler, sample_post, thread_count):
         """並行スケジュール作成テスト"""
         import threading
-        import time
+        
+        # 全スレッドの開始を揃え、バイトコード単位で処理が交互に実行されるようにする
+        barrier = threading.Barrier(thread_count)
         
         def create_schedule():
+            barrier.wait()
             try:
-                with patch.object(scheduler.post_manager, 'get_post', return_value=sample_post):
-                    scheduler.schedule_post(
-                        post_id=sample_post.id,
-                        scheduled_time=datetime.now() + timedelta(hours=1),
-                        schedule_type=ScheduleType.ONCE
-                    )
+                scheduler.schedule_post(
+                    post_id=sample_post.id,
+                    scheduled_time=datetime.now() + timedelta(hours=1),
+                    schedule_type=ScheduleType.ONCE
+                )
             except Exception:
                 pass
         
-        # 複数のスレッドで同時にスケジュールを作成
-        threads = []
-        for _ in range(5):
-            thread = threading.Thread(target=create_schedule)
-            threads.append(thread)
-            thread.start()
-        
-        for thread in threads:
-            thread.join()
+        # 複数のスレッドで同時にスケジュールを作成（パッチはスレッド外で1回だけ適用）
+        with patch.object(scheduler.post_manager, 'get_post', return_value=sample_post):
+            threads = [threading.Thread(target=create_schedule) for _ in range(thread_count)]
+            for thread in threads:
+                thread.start()
+            
+            for thread in threads:
+                thread.join(timeout=10)
         
-        # データの整合性を確認
+        # データの整合性を確認（デッドロックせず、作成数を超えるスケジュールが残らない）
+        assert not any(thread.is_alive() for thread in threads)
         schedules = scheduler.get_schedules()
-        assert len(schedules) >= 0  # エラーが発生してもシステムが破綻しないことを確認 
\ No newline at end of file
+        assert 0 <= len(schedules) <= thread_count
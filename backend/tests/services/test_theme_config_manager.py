@@ -2,10 +2,10 @@
 テーマ設定管理サービスのテスト
 """
 import pytest
+import copy
 import json
-import tempfile
 from pathlib import Path
-from unittest.mock import patch, mock_open
+from dataclasses import asdict
 from datetime import datetime
 
 from app.services.theme_config_manager import (
@@ -16,16 +16,63 @@ from app.services.theme_config_manager import (
 )
 from core.error_handling.error_handler import ConfigError
 
+# 既存設定ファイル読み込みテスト用の設定（エンコード済みのバイト列）
+_SAMPLE_CONFIG_BYTES = json.dumps({
+    "categories": {
+        "test_category": {
+            "name": "テストカテゴリ",
+            "priority": 3,
+            "keywords": ["テスト"],
+            "seasonal_weight": 1.0,
+            "enabled": True
+        }
+    },
+    "seasonal_events": {},
+    "post_styles": {}
+}, separators=(",", ":")).encode("utf-8")
+
+# 検証エラーを起こす設定（読み取り専用のためモジュール内で共有）
+_INVALID_CATEGORY = Category(
+    name="",  # 空の名前
+    priority=10,  # 無効な優先度
+    keywords=["テスト"],
+    seasonal_weight=1.0
+)
+_INVALID_SEASONAL_EVENT = SeasonalEvent(
+    name="",  # 空の名前
+    start_date="invalid-date",  # 無効な日付
+    end_date="invalid-date",
+    categories=["entertainment"],
+    weight=1.0
+)
+_INVALID_POST_STYLE = PostStyle(
+    name="",  # 空の名前
+    tone="テスト",
+    format="テスト",
+    length_limit=0,  # 無効な文字数制限
+    language="日本語"
+)
+
 @pytest.fixture
-def temp_config_dir():
-    """テスト用の一時設定ディレクトリ"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield temp_dir
+def temp_config_dir(tmp_path_factory):
+    """テスト用の一時設定ディレクトリ（セッション共通の親ディレクトリ配下に作成）"""
+    return str(tmp_path_factory.mktemp("theme"))
+
+@pytest.fixture(scope="session")
+def readonly_theme_manager(tmp_path_factory):
+    """読み取り専用テストで共有するデフォルト設定のテーマ設定マネージャー"""
+    return ThemeConfigManager(config_dir=str(tmp_path_factory.mktemp("theme_ro")))
 
 @pytest.fixture
-def theme_manager(temp_config_dir):
-    """テスト用のテーマ設定マネージャー"""
-    return ThemeConfigManager(config_dir=temp_config_dir)
+def mutable_theme_manager(readonly_theme_manager, tmp_path):
+    """変更を伴うテスト用のテーマ設定マネージャー（共有マネージャーの辞書のみ複製）"""
+    m = copy.copy(readonly_theme_manager)
+    m.config_dir = tmp_path
+    m.theme_config_file = tmp_path / "theme_config.json"
+    m.categories = dict(readonly_theme_manager.categories)
+    m.seasonal_events = dict(readonly_theme_manager.seasonal_events)
+    m.post_styles = dict(readonly_theme_manager.post_styles)
+    return m
 
 @pytest.fixture
 def sample_category():
@@ -69,39 +116,24 @@ class TestThemeConfigManager:
         assert config_dir_path.exists()
         assert config_dir_path.is_dir()
     
-    def test_init_creates_default_config_when_file_not_exists(self, theme_manager):
+    def test_init_creates_default_config_when_file_not_exists(self, readonly_theme_manager):
         """設定ファイルが存在しない場合のデフォルト設定作成テスト"""
         # デフォルト設定が作成されることを確認
-        assert len(theme_manager.categories) > 0
-        assert len(theme_manager.seasonal_events) > 0
-        assert len(theme_manager.post_styles) > 0
+        assert len(readonly_theme_manager.categories) > 0
+        assert len(readonly_theme_manager.seasonal_events) > 0
+        assert len(readonly_theme_manager.post_styles) > 0
         
         # デフォルトカテゴリの確認
-        assert "entertainment" in theme_manager.categories
-        assert "technology" in theme_manager.categories
-        assert "lifestyle" in theme_manager.categories
-        assert "culture" in theme_manager.categories
+        assert "entertainment" in readonly_theme_manager.categories
+        assert "technology" in readonly_theme_manager.categories
+        assert "lifestyle" in readonly_theme_manager.categories
+        assert "culture" in readonly_theme_manager.categories
     
     def test_load_config_from_existing_file(self, temp_config_dir):
         """既存の設定ファイルからの読み込みテスト"""
         # テスト用の設定ファイルを作成
-        config_data = {
-            "categories": {
-                "test_category": {
-                    "name": "テストカテゴリ",
-                    "priority": 3,
-                    "keywords": ["テスト"],
-                    "seasonal_weight": 1.0,
-                    "enabled": True
-                }
-            },
-            "seasonal_events": {},
-            "post_styles": {}
-        }
-        
         config_file = Path(temp_config_dir) / "theme_config.json"
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(config_data, f)
+        config_file.write_bytes(_SAMPLE_CONFIG_BYTES)
         
         # 設定を読み込み
         manager = ThemeConfigManager(config_dir=temp_config_dir)
@@ -110,7 +142,7 @@ class TestThemeConfigManager:
         assert manager.categories["test_category"].name == "テストカテゴリ"
         assert manager.categories["test_category"].priority == 3
     
-    def test_save_config(self, theme_manager):
+    def test_save_config(self, mutable_theme_manager):
         """設定保存テスト"""
         # カテゴリを追加
         category = Category(
@@ -119,75 +151,74 @@ class TestThemeConfigManager:
             keywords=["保存", "テスト"],
             seasonal_weight=1.1
         )
-        theme_manager.categories["save_test"] = category
+        mutable_theme_manager.categories["save_test"] = category
         
         # 設定を保存
-        theme_manager.save_config()
+        mutable_theme_manager.save_config()
         
         # 設定ファイルが作成されたことを確認
-        config_file = Path(theme_manager.config_dir) / "theme_config.json"
+        config_file = Path(mutable_theme_manager.config_dir) / "theme_config.json"
         assert config_file.exists()
         
         # 保存された内容を確認
-        with open(config_file, 'r', encoding='utf-8') as f:
-            saved_data = json.load(f)
+        saved_data = json.loads(config_file.read_bytes())
         
         assert "save_test" in saved_data["categories"]
         assert saved_data["categories"]["save_test"]["name"] == "保存テストカテゴリ"
     
-    def test_save_config_error(self, theme_manager):
+    def test_save_config_error(self, mutable_theme_manager, mocker):
         """設定保存エラーテスト"""
         # 読み取り専用ディレクトリでエラーを発生させる
-        with patch('builtins.open', side_effect=PermissionError("Permission denied")):
-            with pytest.raises(ConfigError, match="テーマ設定の保存に失敗しました"):
-                theme_manager.save_config()
+        mocker.patch('builtins.open', side_effect=PermissionError("Permission denied"))
+        with pytest.raises(ConfigError, match="テーマ設定の保存に失敗しました"):
+            mutable_theme_manager.save_config()
     
-    def test_add_category(self, theme_manager, sample_category):
+    def test_add_category(self, mutable_theme_manager, sample_category):
         """カテゴリ追加テスト"""
-        theme_manager.add_category("test_category", sample_category)
+        mutable_theme_manager.add_category("test_category", sample_category)
         
-        assert "test_category" in theme_manager.categories
-        assert theme_manager.categories["test_category"].name == "テストカテゴリ"
-        assert theme_manager.categories["test_category"].priority == 3
+        assert "test_category" in mutable_theme_manager.categories
+        assert mutable_theme_manager.categories["test_category"].name == "テストカテゴリ"
+        assert mutable_theme_manager.categories["test_category"].priority == 3
     
-    def test_update_category(self, theme_manager, sample_category):
+    def test_update_category(self, mutable_theme_manager, sample_category):
         """カテゴリ更新テスト"""
         # カテゴリを追加
-        theme_manager.categories["test_category"] = sample_category
+        mutable_theme_manager.categories["test_category"] = sample_category
         
         # カテゴリを更新
-        theme_manager.update_category("test_category", priority=5, enabled=False)
+        mutable_theme_manager.update_category("test_category", priority=5, enabled=False)
         
-        assert theme_manager.categories["test_category"].priority == 5
-        assert theme_manager.categories["test_category"].enabled == False
+        assert mutable_theme_manager.categories["test_category"].priority == 5
+        assert mutable_theme_manager.categories["test_category"].enabled == False
     
-    def test_update_category_not_found(self, theme_manager):
+    def test_update_category_not_found(self, readonly_theme_manager):
         """存在しないカテゴリの更新テスト"""
         with pytest.raises(ConfigError, match="カテゴリが見つかりません"):
-            theme_manager.update_category("nonexistent", priority=5)
+            readonly_theme_manager.update_category("nonexistent", priority=5)
     
-    def test_delete_category(self, theme_manager, sample_category):
+    def test_delete_category(self, mutable_theme_manager, sample_category):
         """カテゴリ削除テスト"""
         # カテゴリを追加
-        theme_manager.categories["test_category"] = sample_category
+        mutable_theme_manager.categories["test_category"] = sample_category
         
         # カテゴリを削除
-        theme_manager.delete_category("test_category")
+        mutable_theme_manager.delete_category("test_category")
         
-        assert "test_category" not in theme_manager.categories
+        assert "test_category" not in mutable_theme_manager.categories
     
-    def test_delete_category_not_found(self, theme_manager):
+    def test_delete_category_not_found(self, readonly_theme_manager):
         """存在しないカテゴリの削除テスト"""
         with pytest.raises(ConfigError, match="カテゴリが見つかりません"):
-            theme_manager.delete_category("nonexistent")
+            readonly_theme_manager.delete_category("nonexistent")
     
-    def test_get_categories(self, theme_manager):
+    def test_get_categories(self, readonly_theme_manager):
         """カテゴリ一覧取得テスト"""
-        categories = theme_manager.get_categories()
+        categories = readonly_theme_manager.get_categories()
         assert isinstance(categories, dict)
         assert len(categories) > 0
     
-    def test_get_enabled_categories(self, theme_manager, sample_category):
+    def test_get_enabled_categories(self, mutable_theme_manager, sample_category):
         """有効なカテゴリ一覧取得テスト"""
         # 無効なカテゴリを追加
         disabled_category = Category(
@@ -197,124 +228,107 @@ class TestThemeConfigManager:
             seasonal_weight=1.0,
             enabled=False
         )
-        theme_manager.categories["disabled"] = disabled_category
+        mutable_theme_manager.categories["disabled"] = disabled_category
         
-        enabled_categories = theme_manager.get_enabled_categories()
+        enabled_categories = mutable_theme_manager.get_enabled_categories()
         
         # 無効なカテゴリが含まれていないことを確認
         assert "disabled" not in enabled_categories
     
-    def test_add_seasonal_event(self, theme_manager, sample_seasonal_event):
+    def test_add_seasonal_event(self, mutable_theme_manager, sample_seasonal_event):
         """季節イベント追加テスト"""
-        theme_manager.add_seasonal_event("test_event", sample_seasonal_event)
+        mutable_theme_manager.add_seasonal_event("test_event", sample_seasonal_event)
         
-        assert "test_event" in theme_manager.seasonal_events
-        assert theme_manager.seasonal_events["test_event"].name == "テストイベント"
-        assert theme_manager.seasonal_events["test_event"].weight == 1.5
+        assert "test_event" in mutable_theme_manager.seasonal_events
+        assert mutable_theme_manager.seasonal_events["test_event"].name == "テストイベント"
+        assert mutable_theme_manager.seasonal_events["test_event"].weight == 1.5
     
-    def test_get_current_seasonal_events(self, theme_manager):
+    def test_get_current_seasonal_events(self, readonly_theme_manager):
         """現在の季節イベント取得テスト"""
         # 現在の日付に基づいてテスト
-        current_events = theme_manager.get_current_seasonal_events()
+        current_events = readonly_theme_manager.get_current_seasonal_events()
         assert isinstance(current_events, list)
     
-    def test_get_category_priority_with_seasonal_weight(self, theme_manager):
+    def test_get_category_priority_with_seasonal_weight(self, readonly_theme_manager):
         """季節イベントを考慮したカテゴリ優先度取得テスト"""
         # entertainmentカテゴリの優先度を取得
-        priority = theme_manager.get_category_priority("entertainment")
+        priority = readonly_theme_manager.get_category_priority("entertainment")
         assert isinstance(priority, float)
         assert priority > 0
     
-    def test_get_category_priority_nonexistent(self, theme_manager):
+    def test_get_category_priority_nonexistent(self, readonly_theme_manager):
         """存在しないカテゴリの優先度取得テスト"""
-        priority = theme_manager.get_category_priority("nonexistent")
+        priority = readonly_theme_manager.get_category_priority("nonexistent")
         assert priority == 1.0  # デフォルト値
     
-    def test_get_recommended_categories(self, theme_manager):
+    def test_get_recommended_categories(self, readonly_theme_manager):
         """推奨カテゴリ取得テスト"""
-        recommended = theme_manager.get_recommended_categories(limit=3)
+        recommended = readonly_theme_manager.get_recommended_categories(limit=3)
         assert isinstance(recommended, list)
         assert len(recommended) <= 3
     
-    def test_add_post_style(self, theme_manager, sample_post_style):
+    def test_add_post_style(self, mutable_theme_manager, sample_post_style):
         """投稿スタイル追加テスト"""
-        theme_manager.add_post_style("test_style", sample_post_style)
+        mutable_theme_manager.add_post_style("test_style", sample_post_style)
         
-        assert "test_style" in theme_manager.post_styles
-        assert theme_manager.post_styles["test_style"].name == "テストスタイル"
-        assert theme_manager.post_styles["test_style"].length_limit == 280
+        assert "test_style" in mutable_theme_manager.post_styles
+        assert mutable_theme_manager.post_styles["test_style"].name == "テストスタイル"
+        assert mutable_theme_manager.post_styles["test_style"].length_limit == 280
     
-    def test_get_post_styles(self, theme_manager):
+    def test_get_post_styles(self, readonly_theme_manager):
         """投稿スタイル一覧取得テスト"""
-        styles = theme_manager.get_post_styles()
+        styles = readonly_theme_manager.get_post_styles()
         assert isinstance(styles, dict)
         assert len(styles) > 0
     
-    def test_get_enabled_post_styles(self, theme_manager):
+    def test_get_enabled_post_styles(self, readonly_theme_manager):
         """有効な投稿スタイル一覧取得テスト"""
-        enabled_styles = theme_manager.get_enabled_post_styles()
+        enabled_styles = readonly_theme_manager.get_enabled_post_styles()
         assert isinstance(enabled_styles, dict)
         
         # すべてのスタイルが有効であることを確認
         for style in enabled_styles.values():
             assert style.enabled == True
     
-    def test_validate_config_valid(self, theme_manager):
+    def test_validate_config_valid(self, readonly_theme_manager):
         """有効な設定の検証テスト"""
-        errors = theme_manager.validate_config()
+        errors = readonly_theme_manager.validate_config()
         assert isinstance(errors, list)
         # デフォルト設定は有効なので、エラーはないはず
         assert len(errors) == 0
     
-    def test_validate_config_invalid_category(self, theme_manager):
+    def test_validate_config_invalid_category(self, mutable_theme_manager):
         """無効なカテゴリ設定の検証テスト"""
         # 無効なカテゴリを追加
-        invalid_category = Category(
-            name="",  # 空の名前
-            priority=10,  # 無効な優先度
-            keywords=["テスト"],
-            seasonal_weight=1.0
-        )
-        theme_manager.categories["invalid"] = invalid_category
+        mutable_theme_manager.categories["invalid"] = _INVALID_CATEGORY
         
-        errors = theme_manager.validate_config()
+        errors = mutable_theme_manager.validate_config()
         assert len(errors) > 0
-        assert any("カテゴリ 'invalid' の名前が空です" in error for error in errors)
-        assert any("カテゴリ 'invalid' の優先度が無効です" in error for error in errors)
+        blob = "\n".join(errors)
+        assert "カテゴリ 'invalid' の名前が空です" in blob
+        assert "カテゴリ 'invalid' の優先度が無効です" in blob
     
-    def test_validate_config_invalid_seasonal_event(self, theme_manager):
+    def test_validate_config_invalid_seasonal_event(self, mutable_theme_manager):
         """無効な季節イベント設定の検証テスト"""
         # 無効な季節イベントを追加
-        invalid_event = SeasonalEvent(
-            name="",  # 空の名前
-            start_date="invalid-date",  # 無効な日付
-            end_date="invalid-date",
-            categories=["entertainment"],
-            weight=1.0
-        )
-        theme_manager.seasonal_events["invalid"] = invalid_event
+        mutable_theme_manager.seasonal_events["invalid"] = _INVALID_SEASONAL_EVENT
         
-        errors = theme_manager.validate_config()
+        errors = mutable_theme_manager.validate_config()
         assert len(errors) > 0
-        assert any("季節イベント 'invalid' の名前が空です" in error for error in errors)
-        assert any("季節イベント 'invalid' の日付形式が無効です" in error for error in errors)
+        blob = "\n".join(errors)
+        assert "季節イベント 'invalid' の名前が空です" in blob
+        assert "季節イベント 'invalid' の日付形式が無効です" in blob
     
-    def test_validate_config_invalid_post_style(self, theme_manager):
+    def test_validate_config_invalid_post_style(self, mutable_theme_manager):
         """無効な投稿スタイル設定の検証テスト"""
         # 無効な投稿スタイルを追加
-        invalid_style = PostStyle(
-            name="",  # 空の名前
-            tone="テスト",
-            format="テスト",
-            length_limit=0,  # 無効な文字数制限
-            language="日本語"
-        )
-        theme_manager.post_styles["invalid"] = invalid_style
+        mutable_theme_manager.post_styles["invalid"] = _INVALID_POST_STYLE
         
-        errors = theme_manager.validate_config()
+        errors = mutable_theme_manager.validate_config()
         assert len(errors) > 0
-        assert any("投稿スタイル 'invalid' の名前が空です" in error for error in errors)
-        assert any("投稿スタイル 'invalid' の文字数制限が無効です" in error for error in errors)
+        blob = "\n".join(errors)
+        assert "投稿スタイル 'invalid' の名前が空です" in blob
+        assert "投稿スタイル 'invalid' の文字数制限が無効です" in blob
     
     def test_load_config_file_error(self, temp_config_dir):
         """設定ファイル読み込みエラーテスト"""
@@ -329,54 +343,35 @@ class TestThemeConfigManager:
         assert len(manager.seasonal_events) > 0
         assert len(manager.post_styles) > 0
     
-    def test_category_dataclass(self):
-        """Categoryデータクラステスト"""
-        category = Category(
-            name="テスト",
-            priority=3,
-            keywords=["キーワード1", "キーワード2"],
-            seasonal_weight=1.2,
-            enabled=True
-        )
-        
-        assert category.name == "テスト"
-        assert category.priority == 3
-        assert category.keywords == ["キーワード1", "キーワード2"]
-        assert category.seasonal_weight == 1.2
-        assert category.enabled == True
-    
-    def test_seasonal_event_dataclass(self):
-        """SeasonalEventデータクラステスト"""
-        event = SeasonalEvent(
-            name="テストイベント",
-            start_date="01-01",
-            end_date="01-07",
-            categories=["cat1", "cat2"],
-            weight=1.5,
-            enabled=True
-        )
-        
-        assert event.name == "テストイベント"
-        assert event.start_date == "01-01"
-        assert event.end_date == "01-07"
-        assert event.categories == ["cat1", "cat2"]
-        assert event.weight == 1.5
-        assert event.enabled == True
-    
-    def test_post_style_dataclass(self):
-        """PostStyleデータクラステスト"""
-        style = PostStyle(
-            name="テストスタイル",
-            tone="親しみやすい",
-            format="短文",
-            length_limit=280,
-            language="日本語",
-            enabled=True
-        )
-        
-        assert style.name == "テストスタイル"
-        assert style.tone == "親しみやすい"
-        assert style.format == "短文"
-        assert style.length_limit == 280
-        assert style.language == "日本語"
-        assert style.enabled == True 
\ No newline at end of file
+    @pytest.mark.parametrize(
+        "cls, fields",
+        [
+            (Category, {
+                "name": "テスト",
+                "priority": 3,
+                "keywords": ["キーワード1", "キーワード2"],
+                "seasonal_weight": 1.2,
+                "enabled": True
+            }),
+            (SeasonalEvent, {
+                "name": "テストイベント",
+                "start_date": "01-01",
+                "end_date": "01-07",
+                "categories": ["cat1", "cat2"],
+                "weight": 1.5,
+                "enabled": True
+            }),
+            (PostStyle, {
+                "name": "テストスタイル",
+                "tone": "親しみやすい",
+                "format": "短文",
+                "length_limit": 280,
+                "language": "日本語",
+                "enabled": True
+            }),
+        ],
+        ids=["category", "seasonal_event", "post_style"],
+    )
+    def test_dataclass_round_trip(self, cls, fields):
+        """データクラスのフィールド保持テスト"""
+        assert asdict(cls(**fields)) == fields
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from datetime import datetime, timedelta
 from backend.services.trend_analyzer import TrendAnalyzer
 from backend.models.trend_data import TrendData
@@ -7,14 +8,16 @@ from backend.models.trend_data import TrendData
 def trend_analyzer():
     return TrendAnalyzer()
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_trend_data():
+    # 読み取り専用のためモジュール内で共有する
+    now = datetime.now()
     return [
         TrendData(
             id=1,
             keyword="test",
             category="technology",
-            timestamp=datetime.now(),
+            timestamp=now,
             score=85,
             engagement_rate=0.15,
             comment_count=100,
@@ -24,7 +27,7 @@ def sample_trend_data():
             id=2,
             keyword="test2",
             category="gaming",
-            timestamp=datetime.now() - timedelta(days=1),
+            timestamp=now - timedelta(days=1),
             score=75,
             engagement_rate=0.12,
             comment_count=80,
@@ -32,6 +35,40 @@ def sample_trend_data():
         )
     ]
 
+_LARGE_N = 10_000
+_LARGE_BASE = datetime(2024, 1, 1)
+_CATEGORIES = np.array(["technology", "gaming", "music", "sports", "news"])
+
+@pytest.fixture(scope="module")
+def large_trend_soa():
+    """大規模データ（列ごとのnumpy配列）"""
+    rng = np.random.default_rng(0)
+    return {
+        "id": np.arange(_LARGE_N),
+        "keyword": np.array([f"kw{i % 500}" for i in range(_LARGE_N)]),
+        "category": _CATEGORIES[rng.integers(0, len(_CATEGORIES), _LARGE_N)],
+        "score": rng.integers(0, 100, _LARGE_N),
+        "minutes": rng.integers(0, 60 * 24 * 30, _LARGE_N),
+    }
+
+@pytest.fixture(scope="module")
+def large_trend_data(large_trend_soa):
+    """大規模データ（TrendDataのリスト）"""
+    soa = large_trend_soa
+    return [
+        TrendData(
+            id=int(soa["id"][i]),
+            keyword=str(soa["keyword"][i]),
+            category=str(soa["category"][i]),
+            timestamp=_LARGE_BASE + timedelta(minutes=int(soa["minutes"][i])),
+            score=int(soa["score"][i]),
+            engagement_rate=0.1,
+            comment_count=0,
+            view_count=0
+        )
+        for i in range(_LARGE_N)
+    ]
+
 class TestTrendAnalyzer:
     def test_keyword_search(self, trend_analyzer, sample_trend_data):
         """キーワード検索機能のテスト"""
@@ -86,4 +123,37 @@ class TestTrendAnalyzer:
 
         # 空のデータでの時系列分析テスト
         time_series = trend_analyzer.analyze_time_series([])
-        assert len(time_series) == 0 
\ No newline at end of file
+        assert len(time_series) == 0 
+
+    def test_category_analysis_large(self, trend_analyzer, large_trend_soa, large_trend_data):
+        """大規模データでのカテゴリ別分析テスト（numpyでの集計結果と比較）"""
+        category_stats = trend_analyzer.analyze_by_category(large_trend_data)
+
+        categories, inverse = np.unique(large_trend_soa["category"], return_inverse=True)
+        counts = np.bincount(inverse)
+        totals = np.bincount(inverse, weights=large_trend_soa["score"])
+
+        assert set(category_stats) == set(categories.tolist())
+        for category, count, total in zip(categories.tolist(), counts, totals):
+            assert category_stats[category]["count"] == count
+            assert category_stats[category]["total_score"] == total
+            assert category_stats[category]["avg_score"] == pytest.approx(total / count)
+
+    def test_time_series_analysis_large(self, trend_analyzer, large_trend_soa, large_trend_data):
+        """大規模データでの時系列分析テスト"""
+        time_series = trend_analyzer.analyze_time_series(large_trend_data)
+
+        assert len(time_series) == _LARGE_N
+        expected = np.sort(large_trend_soa["minutes"])[::-1]
+        actual = np.array([int((item.timestamp - _LARGE_BASE).total_seconds() // 60) for item in time_series])
+        assert np.array_equal(actual, expected)
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="keyword_search")
+    def test_keyword_search_bench(self, benchmark, trend_analyzer, large_trend_data):
+        """大規模データでのキーワード検索ベンチマーク"""
+        results = benchmark(trend_analyzer.search_by_keyword, large_trend_data, "KW1")
+
+        # kw1, kw10〜kw19, kw100〜kw199 に一致する（500種類のキーワードを均等に割り当て）
+        assert len(results) == _LARGE_N // 500 * 111
+        assert all("kw1" in item.keyword for item in results)
@@ -2,7 +2,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
 from trend_analysis.services.analysis import AnalysisService
-from trend_analysis.models import TrendVideo, VideoStats, VideoStatsHistory, ForeignReaction
+from trend_analysis.models import TrendVideo, VideoStats, VideoStatsHistory, ForeignReaction, Comment
 
 @pytest.fixture
 def analysis_service():
@@ -72,9 +72,9 @@ def test_analyze_trends_over_time(analysis_service, mock_video):
 def test_analyze_sentiment(analysis_service, mock_video):
     # モックコメントの追加
     mock_video.comments = [
-        Mock(text="素晴らしい動画です！", like_count=10),
-        Mock(text="普通の動画ですね", like_count=5),
-        Mock(text="あまり良くない動画です", like_count=2)
+        Comment(text="素晴らしい動画です！", like_count=10),
+        Comment(text="普通の動画ですね", like_count=5),
+        Comment(text="あまり良くない動画です", like_count=2)
     ]
     
     # テスト実行
@@ -89,9 +89,9 @@ def test_analyze_sentiment(analysis_service, mock_video):
 def test_calculate_sentiment_score(analysis_service, mock_video):
     # モックコメントの追加
     mock_video.comments = [
-        Mock(text="素晴らしい動画です！", like_count=10),
-        Mock(text="普通の動画ですね", like_count=5),
-        Mock(text="あまり良くない動画です", like_count=2)
+        Comment(text="素晴らしい動画です！", like_count=10),
+        Comment(text="普通の動画ですね", like_count=5),
+        Comment(text="あまり良くない動画です", like_count=2)
     ]
     
     # テスト実行
@@ -129,10 +129,10 @@ def test_determine_dominant_sentiment(analysis_service):
 def test_analyze_foreign_reaction(analysis_service, mock_video):
     # モックコメントの追加
     mock_video.comments = [
-        Mock(text="This is amazing! 😍", like_count=100),
-        Mock(text="普通の動画ですね", like_count=5),
-        Mock(text="I love this content! ❤️", like_count=50),
-        Mock(text="Not bad at all", like_count=20)
+        Comment(text="This is amazing! 😍", like_count=100),
+        Comment(text="普通の動画ですね", like_count=5),
+        Comment(text="I love this content! ❤️", like_count=50),
+        Comment(text="Not bad at all", like_count=20)
     ]
     
     # テスト実行
@@ -212,4 +212,12 @@ def test_get_channel_videos(analysis_service, mock_video):
     
     # 検証
     assert isinstance(videos, list)
-    assert len(videos) == 0  # 現在は空のリストを返す実装 
\ No newline at end of file
+    assert len(videos) == 0  # 現在は空のリストを返す実装 
+def test_get_channel_videos_cached(analysis_service):
+    # 同じチャンネルはキャッシュから返される
+    first = analysis_service._get_channel_videos("test_channel_id")
+    assert analysis_service._get_channel_videos("test_channel_id") is first
+    
+    # キャッシュ破棄後は再取得される
+    analysis_service.clear_channel_cache()
+    assert analysis_service._get_channel_videos("test_channel_id") is not first
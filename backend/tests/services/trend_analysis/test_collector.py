@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, ANY
 from datetime import datetime, timedelta
 from trend_analysis.services.collector import TrendCollector
 from trend_analysis.models import TrendVideo, VideoStats
@@ -37,7 +37,7 @@ async def test_collect_trends(trend_collector, mock_youtube_service, mock_trend_
     )
 
     mock_youtube_service.get_trending_videos.return_value = [mock_video]
-    mock_trend_repository.save_video.return_value = mock_video
+    mock_trend_repository.save_many.return_value = [mock_video]
     mock_trend_repository.delete_old_videos.return_value = 0
 
     # テスト実行
@@ -47,7 +47,7 @@ async def test_collect_trends(trend_collector, mock_youtube_service, mock_trend_
     assert len(result) == 1
     assert result[0].video_id == "test_video_id"
     mock_youtube_service.get_trending_videos.assert_called_once()
-    mock_trend_repository.save_video.assert_called_once_with(mock_video)
+    mock_trend_repository.save_many.assert_called_once_with([mock_video], now=ANY)
     mock_trend_repository.delete_old_videos.assert_called_once_with(days=30)
 
 @pytest.mark.asyncio
@@ -80,7 +80,7 @@ async def test_start_collection_loop(trend_collector, mock_youtube_service, mock
     )
 
     mock_youtube_service.get_trending_videos.return_value = [mock_video]
-    mock_trend_repository.save_video.return_value = mock_video
+    mock_trend_repository.save_many.return_value = [mock_video]
     mock_trend_repository.delete_old_videos.return_value = 0
 
     # テスト実行（短い間隔で1回だけ実行）
@@ -92,5 +92,5 @@ async def test_start_collection_loop(trend_collector, mock_youtube_service, mock
 
     # 検証
     mock_youtube_service.get_trending_videos.assert_called_once()
-    mock_trend_repository.save_video.assert_called_once_with(mock_video)
+    mock_trend_repository.save_many.assert_called_once_with([mock_video], now=ANY)
     mock_trend_repository.delete_old_videos.assert_called_once_with(days=30) 
\ No newline at end of file
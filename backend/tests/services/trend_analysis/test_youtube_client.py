@@ -90,6 +90,51 @@ async def test_get_video_comments(youtube_client, mock_youtube):
     assert comment['text'] == 'Test Comment'
     assert comment['like_count'] == 10
 
+@pytest.mark.asyncio
+async def test_get_comments_for_videos(youtube_client, mock_youtube):
+    # バッチリクエストのモック（追加されたリクエストごとにコールバックを呼ぶ）
+    batches = []
+    
+    class FakeBatch:
+        def __init__(self, callback):
+            self.callback = callback
+            self.request_ids = []
+        
+        def add(self, request, request_id):
+            self.request_ids.append(request_id)
+        
+        def execute(self):
+            for request_id in self.request_ids:
+                self.callback(request_id, {'items': [{
+                    'id': f'{request_id}_comment',
+                    'snippet': {
+                        'topLevelComment': {
+                            'snippet': {
+                                'authorDisplayName': 'Test User',
+                                'textDisplay': f'Comment on {request_id}',
+                                'likeCount': 1,
+                                'publishedAt': '2024-01-01T00:00:00Z'
+                            }
+                        }
+                    }
+                }]}, None)
+    
+    def new_batch(callback):
+        batch = FakeBatch(callback)
+        batches.append(batch)
+        return batch
+    
+    mock_youtube.new_batch_http_request.side_effect = new_batch
+    video_ids = [f'video_{i}' for i in range(60)]
+    
+    # テスト実行
+    comments = await youtube_client.get_comments_for_videos(video_ids)
+    
+    # アサーション（50件ごとに1回のバッチリクエスト）
+    assert [len(batch.request_ids) for batch in batches] == [50, 10]
+    assert set(comments) == set(video_ids)
+    assert comments['video_0'][0]['text'] == 'Comment on video_0'
+
 @pytest.mark.asyncio
 async def test_analyze_video_trends(youtube_client, mock_youtube):
     # モックのレスポンスを設定
@@ -1,20 +1,25 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from typing import List, Optional
 from datetime import datetime
-from ..models import TrendAnalysisRequest, TrendAnalysisResponse, TrendVideo
-from ..services.youtube import YouTubeService
+import asyncio
+import orjson
+from ..models import TrendAnalysisRequest, TrendAnalysisResponse, TrendVideo, VideoId
+from ..services.youtube import YouTubeService, get_inflight_request_count, parse_youtube_timestamp
 from ..services.analysis import AnalysisService
 from ..services.scheduler import TrendScheduler
+from ..core.deps import get_youtube_service, get_analysis_service, get_trend_scheduler
 from ..core.logging import get_logger
 
-router = APIRouter()
+# 動画・コメントを多数含むレスポンスのため、シリアライズはorjsonで行う
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = get_logger(__name__)
 
 @router.get("/videos", response_model=TrendAnalysisResponse)
 async def get_trending_videos(
     request: TrendAnalysisRequest = Depends(),
-    youtube_service: YouTubeService = Depends(),
-    analysis_service: AnalysisService = Depends()
+    youtube_service: YouTubeService = Depends(get_youtube_service),
+    analysis_service: AnalysisService = Depends(get_analysis_service)
 ) -> TrendAnalysisResponse:
     """
     トレンド動画を取得し分析する
@@ -52,14 +57,56 @@ async def get_trending_videos(
             detail="Failed to analyze trending videos"
         )
 
+@router.get("/videos/stream")
+async def stream_trending_videos(
+    request: TrendAnalysisRequest = Depends(),
+    youtube_service: YouTubeService = Depends(get_youtube_service),
+    analysis_service: AnalysisService = Depends(get_analysis_service)
+) -> StreamingResponse:
+    """
+    トレンド動画を取得し、分析が終わった動画から順にNDJSONで返す
+
+    Args:
+        request: 分析リクエストパラメータ
+        youtube_service: YouTube APIサービス
+        analysis_service: 分析サービス
+
+    Returns:
+        StreamingResponse: 1行1動画のNDJSON
+    """
+    try:
+        videos = await youtube_service.get_trending_videos(
+            region_code=request.region_code,
+            max_results=request.max_results,
+            category_id=request.category_id,
+            time_period=request.time_period
+        )
+    except Exception as e:
+        logger.error(f"Error in stream_trending_videos: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to fetch trending videos"
+        )
+
+    async def _ndjson():
+        # レスポンス送信開始後はステータスコードを変えられないため、エラーは最終行で通知する
+        try:
+            async for video in analysis_service.analyze_trends_stream(videos):
+                yield orjson.dumps(video.model_dump(mode="json")) + b"\n"
+        except Exception as e:
+            logger.error(f"Error in stream_trending_videos: {str(e)}")
+            yield orjson.dumps({"error": "Failed to analyze trending videos"}) + b"\n"
+
+    return StreamingResponse(_ndjson(), media_type="application/x-ndjson")
+
 @router.get("/search")
 async def search_videos(
-    query: str = Query(..., description="検索クエリ"),
-    max_results: int = Query(50, description="取得する最大結果数"),
+    query: str = Query(..., min_length=1, max_length=200, description="検索クエリ"),
+    max_results: int = Query(50, ge=1, le=50, description="取得する最大結果数"),
     order: str = Query("relevance", description="ソート順（relevance, date, rating, viewCount）"),
     region_code: str = Query("JP", description="地域コード"),
     language: str = Query("ja", description="言語コード"),
-    youtube_service: YouTubeService = Depends()
+    youtube_service: YouTubeService = Depends(get_youtube_service)
 ):
     """
     キーワード検索で動画を取得する
@@ -101,9 +148,9 @@ async def search_videos(
 
 @router.get("/videos/{video_id}", response_model=TrendVideo)
 async def get_video_details(
-    video_id: str,
-    youtube_service: YouTubeService = Depends(),
-    analysis_service: AnalysisService = Depends()
+    video_id: VideoId,
+    youtube_service: YouTubeService = Depends(get_youtube_service),
+    analysis_service: AnalysisService = Depends(get_analysis_service)
 ) -> TrendVideo:
     """
     特定の動画の詳細情報を取得する
@@ -144,9 +191,9 @@ async def get_video_details(
 
 @router.get("/videos/{video_id}/comprehensive")
 async def get_comprehensive_analysis(
-    video_id: str,
-    youtube_service: YouTubeService = Depends(),
-    analysis_service: AnalysisService = Depends()
+    video_id: VideoId,
+    youtube_service: YouTubeService = Depends(get_youtube_service),
+    analysis_service: AnalysisService = Depends(get_analysis_service)
 ):
     """
     動画の包括的な分析を取得する
@@ -160,27 +207,28 @@ async def get_comprehensive_analysis(
         Dict: 包括的な分析結果
     """
     try:
-        # 動画情報の取得
-        video_details = await youtube_service.get_video_details(video_id)
+        # 動画情報とコメントを並行して取得
+        video_details, comments = await asyncio.gather(
+            youtube_service.get_video_details(video_id),
+            youtube_service.get_video_comments(video_id, max_results=100)
+        )
         if not video_details:
             raise HTTPException(
                 status_code=404,
                 detail="Video not found"
             )
-
-        # コメントの取得
-        comments = await youtube_service.get_video_comments(video_id, max_results=100)
         
         # TrendVideoオブジェクトの作成
+        # YouTubeServiceで型変換済みの値のため、検証を省略して生成する
         from ..models import TrendVideo, VideoStats
-        video = TrendVideo(
+        video = TrendVideo.model_construct(
             video_id=video_details["video_id"],
             title=video_details["title"],
             description=video_details["description"],
-            published_at=datetime.fromisoformat(video_details["published_at"].replace("Z", "+00:00")),
+            published_at=parse_youtube_timestamp(video_details["published_at"]),
             channel_id=video_details["channel_id"],
             channel_title=video_details["channel_title"],
-            stats=VideoStats(
+            stats=VideoStats.model_construct(
                 view_count=video_details["view_count"],
                 like_count=video_details["like_count"],
                 comment_count=video_details["comment_count"],
@@ -212,10 +260,10 @@ async def get_comprehensive_analysis(
 
 @router.get("/videos/{video_id}/comments")
 async def get_video_comments(
-    video_id: str,
-    max_results: int = Query(100, description="取得するコメントの最大数"),
+    video_id: VideoId,
+    max_results: int = Query(100, ge=1, le=200, description="取得するコメントの最大数"),
     order: str = Query("relevance", description="ソート順（relevance, time）"),
-    youtube_service: YouTubeService = Depends()
+    youtube_service: YouTubeService = Depends(get_youtube_service)
 ):
     """
     動画のコメントを取得する
@@ -251,10 +299,40 @@ async def get_video_comments(
             detail=f"Failed to get comments: {str(e)}"
         )
 
+@router.get("/videos/{video_id}/comments/stream")
+async def stream_video_comments(
+    video_id: VideoId,
+    max_results: int = Query(100, ge=1, le=200, description="取得するコメントの最大数"),
+    order: str = Query("relevance", description="ソート順（relevance, time）"),
+    youtube_service: YouTubeService = Depends(get_youtube_service)
+) -> StreamingResponse:
+    """
+    動画のコメントを取得したページから順にNDJSONで返す
+
+    Args:
+        video_id: 動画ID
+        max_results: 取得するコメントの最大数
+        order: ソート順
+        youtube_service: YouTube APIサービス
+
+    Returns:
+        StreamingResponse: 1行1コメントのNDJSON
+    """
+    async def _ndjson():
+        # レスポンス送信開始後はステータスコードを変えられないため、エラーは最終行で通知する
+        try:
+            async for comment in youtube_service.iter_video_comments(video_id, max_results, order):
+                yield orjson.dumps(comment) + b"\n"
+        except Exception as e:
+            logger.error(f"Error in stream_video_comments: {str(e)}")
+            yield orjson.dumps({"error": f"Failed to get comments: {str(e)}"}) + b"\n"
+
+    return StreamingResponse(_ndjson(), media_type="application/x-ndjson")
+
 @router.post("/scheduler/start")
 async def start_scheduler(
     collection_interval: int = Query(60, description="収集間隔（分）"),
-    scheduler: TrendScheduler = Depends()
+    scheduler: TrendScheduler = Depends(get_trend_scheduler)
 ):
     """
     トレンド収集スケジューラーを開始する
@@ -286,7 +364,7 @@ async def start_scheduler(
 
 @router.post("/scheduler/stop")
 async def stop_scheduler(
-    scheduler: TrendScheduler = Depends()
+    scheduler: TrendScheduler = Depends(get_trend_scheduler)
 ):
     """
     トレンド収集スケジューラーを停止する
@@ -315,7 +393,7 @@ async def stop_scheduler(
 
 @router.get("/scheduler/status")
 async def get_scheduler_status(
-    scheduler: TrendScheduler = Depends()
+    scheduler: TrendScheduler = Depends(get_trend_scheduler)
 ):
     """
     スケジューラーの状態を取得する
@@ -328,6 +406,8 @@ async def get_scheduler_status(
     """
     try:
         status = scheduler.get_scheduler_status()
+        # 実行中のYouTube API呼び出し数（同時実行数の上限に張り付いていないかの確認用）
+        status["youtube_inflight_requests"] = get_inflight_request_count()
         
         return {
             "status": "success",
@@ -346,7 +426,7 @@ async def get_scheduler_status(
 async def collect_by_category(
     category_id: str,
     region_code: str = Query("JP", description="地域コード"),
-    scheduler: TrendScheduler = Depends()
+    scheduler: TrendScheduler = Depends(get_trend_scheduler)
 ):
     """
     特定カテゴリのトレンドを収集する
@@ -379,9 +459,9 @@ async def collect_by_category(
 
 @router.post("/collect/keyword")
 async def collect_by_keyword(
-    keyword: str = Query(..., description="検索キーワード"),
+    keyword: str = Query(..., min_length=1, max_length=200, description="検索キーワード"),
     region_code: str = Query("JP", description="地域コード"),
-    scheduler: TrendScheduler = Depends()
+    scheduler: TrendScheduler = Depends(get_trend_scheduler)
 ):
     """
     キーワードベースでトレンドを収集する
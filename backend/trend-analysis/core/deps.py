@@ -0,0 +1,17 @@
+from functools import lru_cache
+from ..services.youtube import get_youtube_service
+from ..services.analysis import AnalysisService
+from ..services.scheduler import TrendScheduler
+
+# FastAPIの依存関係として使うサービスのプロバイダー
+# リクエストごとに生成せず、プロセス内で1つのインスタンスを共有する
+
+@lru_cache
+def get_analysis_service() -> AnalysisService:
+    """分析サービスを取得する"""
+    return AnalysisService()
+
+@lru_cache
+def get_trend_scheduler() -> TrendScheduler:
+    """トレンド収集スケジューラーを取得する"""
+    return TrendScheduler()
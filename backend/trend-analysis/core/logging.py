@@ -1,36 +1,37 @@
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
 from .config import get_settings
 
-def setup_logger(name: str, level: Optional[str] = None) -> logging.Logger:
+# ロガー名ごとの設定済みロガー
+_loggers: Dict[str, logging.Logger] = {}
+
+# 全ロガー共通のログキューと書き込みスレッド
+_log_queue: Optional[queue.SimpleQueue] = None
+_queue_listener: Optional[QueueListener] = None
+
+def _get_log_queue() -> queue.SimpleQueue:
     """
-    ロガーを設定する
+    ログキューを取得する
 
-    Args:
-        name: ロガー名
-        level: ログレベル
+    コンソール・ファイルへの書き込みは別スレッドのQueueListenerが行い、
+    ログを出力する側はキューへの追加だけを行う。ファイルは最初の1回だけ開く
 
     Returns:
-        logging.Logger: 設定されたロガー
+        queue.SimpleQueue: ログキュー
     """
+    global _log_queue, _queue_listener
+    if _log_queue is not None:
+        return _log_queue
+
     settings = get_settings()
-    
-    # ログレベルの設定
-    log_level = level or settings.log_level
-    numeric_level = getattr(logging, log_level.upper(), logging.INFO)
-    
-    # ロガーの作成
-    logger = logging.getLogger(name)
-    logger.setLevel(numeric_level)
-    
-    # 既存のハンドラーをクリア
-    logger.handlers.clear()
-    
+
     # コンソールハンドラーの設定
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(numeric_level)
     
     # ファイルハンドラーの設定
     log_dir = os.path.dirname(settings.log_file)
@@ -38,7 +39,6 @@ def setup_logger(name: str, level: Optional[str] = None) -> logging.Logger:
         os.makedirs(log_dir)
     
     file_handler = logging.FileHandler(settings.log_file, encoding='utf-8')
-    file_handler.setLevel(numeric_level)
     
     # フォーマッターの設定
     formatter = logging.Formatter(
@@ -48,16 +48,47 @@ def setup_logger(name: str, level: Optional[str] = None) -> logging.Logger:
     
     console_handler.setFormatter(formatter)
     file_handler.setFormatter(formatter)
+
+    _log_queue = queue.SimpleQueue()
+    _queue_listener = QueueListener(_log_queue, console_handler, file_handler)
+    _queue_listener.start()
+    # 終了時にキューに残ったログを書き出す
+    atexit.register(_queue_listener.stop)
+    return _log_queue
+
+def setup_logger(name: str, level: Optional[str] = None) -> logging.Logger:
+    """
+    ロガーを設定する
+
+    Args:
+        name: ロガー名
+        level: ログレベル
+
+    Returns:
+        logging.Logger: 設定されたロガー
+    """
+    settings = get_settings()
     
-    # ハンドラーの追加
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    # ログレベルの設定
+    log_level = level or settings.log_level
+    numeric_level = getattr(logging, log_level.upper(), logging.INFO)
+    
+    # ロガーの作成
+    logger = logging.getLogger(name)
+    logger.setLevel(numeric_level)
+    
+    # 既存のハンドラーをクリア
+    logger.handlers.clear()
+    
+    # ハンドラーの追加（出力はキュー経由で共通のハンドラーが行う）
+    logger.addHandler(QueueHandler(_get_log_queue()))
     
+    _loggers[name] = logger
     return logger
 
 def get_logger(name: str) -> logging.Logger:
     """
-    ロガーを取得する
+    ロガーを取得する（設定済みのロガーは再設定しない）
 
     Args:
         name: ロガー名
@@ -65,7 +96,10 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         logging.Logger: ロガーインスタンス
     """
-    return setup_logger(name)
+    logger = _loggers.get(name)
+    if logger is None:
+        logger = setup_logger(name)
+    return logger
 
 # デフォルトロガー
 default_logger = get_logger("trend_analysis")
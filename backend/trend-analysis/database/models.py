@@ -1,5 +1,6 @@
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Index, inspect
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import relationship
 from ..database.base import Base
 
@@ -7,7 +8,8 @@ class VideoStats(Base):
     __tablename__ = "video_stats"
 
     id = Column(Integer, primary_key=True)
-    video_id = Column(String, ForeignKey("trend_videos.video_id"), nullable=False)
+    # 動画からの統計情報の読み込み（1対1）で使う
+    video_id = Column(String, ForeignKey("trend_videos.video_id"), nullable=False, index=True)
     view_count = Column(Integer, default=0)
     like_count = Column(Integer, default=0)
     comment_count = Column(Integer, default=0)
@@ -22,7 +24,7 @@ class VideoStatsHistory(Base):
     __tablename__ = "video_stats_history"
 
     id = Column(Integer, primary_key=True)
-    stats_id = Column(Integer, ForeignKey("video_stats.id"), nullable=False)
+    stats_id = Column(Integer, ForeignKey("video_stats.id"), nullable=False, index=True)
     view_count = Column(Integer, default=0)
     like_count = Column(Integer, default=0)
     comment_count = Column(Integer, default=0)
@@ -44,4 +46,28 @@ class TrendVideo(Base):
     collected_at = Column(DateTime, default=datetime.now)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
 
-    stats = relationship("VideoStats", back_populates="video", uselist=False) 
\ No newline at end of file
+    stats = relationship("VideoStats", back_populates="video", uselist=False)
+
+    __table_args__ = (
+        # バズり度順のトレンド一覧（ORDER BY buzz_score DESC, video_id DESC のキーセットページング）
+        Index("ix_trend_videos_buzz_score", buzz_score.desc(), video_id.desc()),
+        # 保持期間を過ぎた動画の削除（collected_at < ?）
+        Index("ix_trend_videos_collected_at", collected_at),
+    )
+
+
+def ensure_indexes(bind: Engine) -> None:
+    """
+    モデルで宣言したインデックスを既存のテーブルに作成する（作成済みのものは作らない）
+
+    create_allはテーブルがある場合インデックスを追加しないため、既存のデータベースには起動時にこれで反映する
+
+    Args:
+        bind: 対象データベースのエンジン
+    """
+    existing_tables = set(inspect(bind).get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        for index in table.indexes:
+            index.create(bind, checkfirst=True)
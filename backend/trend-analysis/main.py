@@ -1,16 +1,52 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from sqlalchemy import create_engine
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from .core.config import get_settings
 from .api.endpoints import router as trend_router
-from .services.youtube import YouTubeService
-from .services.analysis import AnalysisService
+from .core.deps import get_youtube_service, get_analysis_service
+from .core.logging import get_logger
+from .database.models import ensure_indexes
 from .api.youtube import router as youtube_router
 
+logger = get_logger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    アプリケーションの起動・終了処理
+
+    共有サービス（core.depsのプロバイダーが返すインスタンス）は起動時に生成し、終了時に解放する。
+    既存のデータベースには、後から追加したインデックスを起動時に作成する
+    """
+    engine = create_engine(get_settings().database_url)
+    try:
+        ensure_indexes(engine)
+    except Exception as e:
+        logger.error(f"Error creating database indexes: {str(e)}")
+    finally:
+        engine.dispose()
+
+    get_youtube_service()
+    analysis_service = get_analysis_service()
+    yield
+    # 分析サービスのプロセスプールを終了する
+    analysis_service.close()
+
 app = FastAPI(
+    lifespan=lifespan,
     title="Xbot Trend Analysis Service",
     description="YouTubeトレンド分析サービス",
-    version="1.0.0"
+    version="1.0.0",
+    # 全エンドポイントのレスポンスをorjsonでシリアライズする
+    default_response_class=ORJSONResponse
 )
 
+# 1KB以上のレスポンスをgzip圧縮する（タイトル・説明文を含むトレンド一覧向け）
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # CORS設定
 app.add_middleware(
     CORSMiddleware,
@@ -20,10 +56,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# サービスの初期化
-youtube_service = YouTubeService()
-analysis_service = AnalysisService()
-
 # ルーターの登録
 app.include_router(trend_router, prefix="/api/v1/trends", tags=["trends"])
 app.include_router(youtube_router, prefix="/api/youtube", tags=["youtube"])
@@ -36,3 +68,9 @@ async def health_check():
 @app.get("/")
 async def root():
     return {"message": "Trend Analysis Service is running"}
+
+if __name__ == "__main__":
+    import uvicorn
+    settings = get_settings()
+    # イベントループとHTTPパーサーにuvloop・httptoolsを明示的に使う
+    uvicorn.run(app, host=settings.api_host, port=settings.api_port, loop="uvloop", http="httptools")
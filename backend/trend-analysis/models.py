@@ -1,6 +1,18 @@
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List
-from pydantic import BaseModel, Field
+from typing import Annotated, Dict, Optional, List
+from pydantic import BaseModel, Field, StringConstraints, field_validator
+
+# YouTubeの動画ID（11文字のbase64url）。形式が違うIDはAPIを呼ぶ前に弾く
+VideoId = Annotated[str, StringConstraints(pattern=r"^[A-Za-z0-9_-]{11}$")]
+
+class VideoStatsHistory(BaseModel):
+    """動画の統計情報の履歴（1時点分）"""
+    view_count: int = 0
+    like_count: int = 0
+    comment_count: int = 0
+    engagement_rate: float = 0.0
+    recorded_at: datetime = Field(default_factory=datetime.now)
 
 class VideoStats(BaseModel):
     """動画の統計情報"""
@@ -8,6 +20,19 @@ class VideoStats(BaseModel):
     like_count: int = 0
     comment_count: int = 0
     engagement_rate: float = 0.0
+    history: List[VideoStatsHistory] = Field(default_factory=list, description="記録日時の昇順の履歴")
+
+    @field_validator("history")
+    @classmethod
+    def sort_history(cls, history: List[VideoStatsHistory]) -> List[VideoStatsHistory]:
+        """履歴は取り込み時に一度だけ記録日時順に並べる（分析側では並べ替えない）"""
+        return sorted(history, key=lambda point: point.recorded_at)
+
+@dataclass(frozen=True, slots=True)
+class Comment:
+    """分析対象のコメント（大量に生成されるため軽量なdataclassとする）"""
+    text: str
+    like_count: int = 0
 
 class ForeignReaction(BaseModel):
     """外国人視点からの反応"""
@@ -24,7 +49,9 @@ class TrendVideo(BaseModel):
     channel_id: str
     channel_title: str
     stats: VideoStats
+    comments: List[Comment] = Field(default_factory=list, description="分析対象のコメント")
     buzz_score: float = 0.0
+    analysis: Optional[Dict] = Field(None, description="時系列分析・感情分析の結果（分析前はNone）")
     collected_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
 
@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from typing import List, Optional, Tuple
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session, selectinload
 from ..database.models import TrendVideo, VideoStats
 from ..models import TrendVideo as TrendVideoModel
 
@@ -8,26 +9,91 @@ class TrendRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def save_video(self, video: TrendVideoModel) -> TrendVideo:
+    def save_video(self, video: TrendVideoModel, now: Optional[datetime] = None) -> TrendVideo:
         """
         動画情報を保存する
 
         Args:
             video: 保存する動画情報
+            now: 収集・更新日時として記録する日時（省略時は現在時刻）
 
         Returns:
             TrendVideo: 保存された動画情報
         """
+        if now is None:
+            now = datetime.now()
+
         # 既存の動画を検索
         existing_video = self.db.query(TrendVideo).filter_by(video_id=video.video_id).first()
 
+        db_video = self._upsert_video(video, existing_video, now)
+        self.db.commit()
+        if existing_video is None:
+            self.db.refresh(db_video)
+        return db_video
+
+    def save_many(self, videos: List[TrendVideoModel], now: Optional[datetime] = None) -> List[TrendVideo]:
+        """
+        複数の動画情報をまとめて保存する
+
+        既存動画の検索とコミットはそれぞれ1回で行う
+
+        Args:
+            videos: 保存する動画情報のリスト
+            now: 収集・更新日時として記録する日時（省略時は現在時刻）
+
+        Returns:
+            List[TrendVideo]: 保存された動画情報のリスト
+        """
+        if not videos:
+            return []
+        if now is None:
+            now = datetime.now()
+
+        # 既存の動画を統計情報と合わせて一括で検索（動画ごとの統計情報の遅延読み込みを避ける）
+        video_ids = [video.video_id for video in videos]
+        existing_videos = {
+            db_video.video_id: db_video
+            for db_video in self.db.query(TrendVideo)
+                .options(selectinload(TrendVideo.stats))
+                .filter(TrendVideo.video_id.in_(video_ids))
+                .all()
+        }
+
+        saved_videos = []
+        for video in videos:
+            db_video = self._upsert_video(video, existing_videos.get(video.video_id), now)
+            # 同じバッチ内で同じ動画IDが重複しても二重に作成しない
+            existing_videos[video.video_id] = db_video
+            saved_videos.append(db_video)
+
+        self.db.commit()
+        return saved_videos
+
+    def _upsert_video(
+        self,
+        video: TrendVideoModel,
+        existing_video: Optional[TrendVideo],
+        now: datetime
+    ) -> TrendVideo:
+        """
+        既存の動画を更新、または新しい動画をセッションに追加する（コミットは呼び出し側で行う）
+
+        Args:
+            video: 保存する動画情報
+            existing_video: 既存の動画（存在しない場合はNone）
+            now: 収集・更新日時として記録する日時
+
+        Returns:
+            TrendVideo: 更新または追加された動画情報
+        """
         if existing_video:
             # 既存の動画を更新
             existing_video.title = video.title
             existing_video.description = video.description
             existing_video.channel_title = video.channel_title
             existing_video.buzz_score = video.buzz_score
-            existing_video.updated_at = datetime.now()
+            existing_video.updated_at = now
 
             # 統計情報を更新
             if existing_video.stats:
@@ -35,7 +101,7 @@ class TrendRepository:
                 existing_video.stats.like_count = video.stats.like_count
                 existing_video.stats.comment_count = video.stats.comment_count
                 existing_video.stats.engagement_rate = video.stats.engagement_rate
-                existing_video.stats.updated_at = datetime.now()
+                existing_video.stats.updated_at = now
             else:
                 # 新しい統計情報を作成
                 stats = VideoStats(
@@ -47,36 +113,32 @@ class TrendRepository:
                 )
                 existing_video.stats = stats
 
-            self.db.commit()
             return existing_video
 
-        else:
-            # 新しい動画を作成
-            db_video = TrendVideo(
-                video_id=video.video_id,
-                title=video.title,
-                description=video.description,
-                published_at=video.published_at,
-                channel_id=video.channel_id,
-                channel_title=video.channel_title,
-                buzz_score=video.buzz_score,
-                collected_at=datetime.now()
-            )
-
-            # 統計情報を作成
-            stats = VideoStats(
-                video_id=video.video_id,
-                view_count=video.stats.view_count,
-                like_count=video.stats.like_count,
-                comment_count=video.stats.comment_count,
-                engagement_rate=video.stats.engagement_rate
-            )
-            db_video.stats = stats
-
-            self.db.add(db_video)
-            self.db.commit()
-            self.db.refresh(db_video)
-            return db_video
+        # 新しい動画を作成
+        db_video = TrendVideo(
+            video_id=video.video_id,
+            title=video.title,
+            description=video.description,
+            published_at=video.published_at,
+            channel_id=video.channel_id,
+            channel_title=video.channel_title,
+            buzz_score=video.buzz_score,
+            collected_at=now
+        )
+
+        # 統計情報を作成
+        stats = VideoStats(
+            video_id=video.video_id,
+            view_count=video.stats.view_count,
+            like_count=video.stats.like_count,
+            comment_count=video.stats.comment_count,
+            engagement_rate=video.stats.engagement_rate
+        )
+        db_video.stats = stats
+
+        self.db.add(db_video)
+        return db_video
 
     def get_video(self, video_id: str) -> Optional[TrendVideo]:
         """
@@ -88,32 +150,50 @@ class TrendRepository:
         Returns:
             Optional[TrendVideo]: 動画情報
         """
-        return self.db.query(TrendVideo).filter_by(video_id=video_id).first()
+        # 統計情報は呼び出し側で必ず参照するため、合わせて読み込む
+        return self.db.query(TrendVideo)\
+            .options(selectinload(TrendVideo.stats))\
+            .filter_by(video_id=video_id)\
+            .first()
 
     def get_trending_videos(
         self,
         limit: int = 50,
-        offset: int = 0,
+        cursor: Optional[Tuple[float, str]] = None,
         min_buzz_score: float = 0.0
-    ) -> List[TrendVideo]:
+    ) -> Tuple[List[TrendVideo], Optional[Tuple[float, str]]]:
         """
         トレンド動画のリストを取得する
 
+        OFFSETの代わりに (buzz_score, video_id) のキーセットでページングし、
+        ページが深くなっても読み飛ばす行が増えないようにする
+
         Args:
             limit: 取得する最大数
-            offset: スキップする数
+            cursor: 前のページの最後の動画の (buzz_score, video_id)（先頭ページはNone）
             min_buzz_score: 最小バズり度スコア
 
         Returns:
-            List[TrendVideo]: トレンド動画のリスト
+            Tuple[List[TrendVideo], Optional[Tuple[float, str]]]: トレンド動画のリストと次のページのカーソル
         """
-        return self.db.query(TrendVideo)\
-            .filter(TrendVideo.buzz_score >= min_buzz_score)\
-            .order_by(TrendVideo.buzz_score.desc())\
-            .offset(offset)\
+        # 統計情報を2回目のクエリでまとめて読み込み、動画ごとの遅延読み込み（N+1）を避ける
+        query = self.db.query(TrendVideo)\
+            .options(selectinload(TrendVideo.stats))\
+            .filter(TrendVideo.buzz_score >= min_buzz_score)
+        if cursor is not None:
+            query = query.filter(tuple_(TrendVideo.buzz_score, TrendVideo.video_id) < tuple_(*cursor))
+        videos = query\
+            .order_by(TrendVideo.buzz_score.desc(), TrendVideo.video_id.desc())\
             .limit(limit)\
             .all()
 
+        # 件数が上限に満たなければ最後のページ
+        next_cursor = None
+        if len(videos) == limit:
+            last = videos[-1]
+            next_cursor = (last.buzz_score, last.video_id)
+        return videos, next_cursor
+
     def delete_old_videos(self, days: int = 30) -> int:
         """
         古い動画を削除する
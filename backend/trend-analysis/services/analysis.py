@@ -1,15 +1,205 @@
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from ..models import TrendVideo, ForeignReaction, VideoStats
+from ..core.config import get_settings
 from ..core.logging import get_logger
-from textblob import TextBlob
+from textblob.sentiments import PatternAnalyzer
 import numpy as np
+import asyncio
+import copy
+import heapq
+import os
+import string
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
 logger = get_logger(__name__)
 
+# 時系列データが不足している場合の分析結果
+_EMPTY_TREND_ANALYSIS = {
+    "view_growth_rate": 0.0,
+    "engagement_growth_rate": 0.0,
+    "comment_growth_rate": 0.0,
+    "trend_direction": "stable"
+}
+
+# トレンドの方向（加重成長率が閾値を下回る/範囲内/上回る）
+_TREND_DIRECTIONS = ("decreasing", "stable", "increasing")
+
+# 分析結果キャッシュの最大件数
+_ANALYSIS_CACHE_MAX_ENTRIES = 4096
+
+# チャンネル動画キャッシュの最大件数
+_CHANNEL_VIDEOS_CACHE_MAX_ENTRIES = 1024
+
+# この件数以上のコメントはプロセスプールで並列に感情分析する
+_PARALLEL_MIN_TEXTS = 256
+
+# 感情極性キャッシュの最大件数
+_POLARITY_CACHE_MAX_ENTRIES = 65536
+
+# ストリーミング分析で感情極性をまとめて計算する動画数
+_STREAM_BATCH_SIZE = 10
+
+# 感情極性の解析器（TextBlobの既定の辞書ベース解析器。コメントごとにTextBlobを生成しない）
+_SENTIMENT_ANALYZER = PatternAnalyzer()
+
+# 外国人コメント判定に使う英字の集合（呼び出しごとに生成しない）
+_ENGLISH_CHARS = frozenset(string.ascii_letters)
+
+# バズり度スコアの配点（各要素の上限点と、統計値から点数への換算）
+_VIEW_SCORE_MAX = 30
+_VIEW_COUNT_FOR_MAX = 100000
+_ENGAGEMENT_SCORE_MAX = 25
+_ENGAGEMENT_SCORE_PER_PERCENT = 2.5
+_COMMENT_SCORE_MAX = 20
+_COMMENT_COUNT_FOR_MAX = 1000
+_BUZZ_SCORE_MAX = 100
+
+def _stats_score(view_counts, engagement_rates, comment_counts):
+    """
+    視聴回数・エンゲージメント率・コメント数によるスコアの合計を計算する
+
+    1動画分の値でも、複数動画分の配列でも同じ式で計算する
+
+    Args:
+        view_counts: 視聴回数
+        engagement_rates: エンゲージメント率（%）
+        comment_counts: コメント数
+
+    Returns:
+        スコアの合計（0-75）。配列を渡した場合は動画ごとの配列
+    """
+    return (
+        np.minimum(view_counts / _VIEW_COUNT_FOR_MAX * _VIEW_SCORE_MAX, _VIEW_SCORE_MAX)
+        + np.minimum(engagement_rates * _ENGAGEMENT_SCORE_PER_PERCENT, _ENGAGEMENT_SCORE_MAX)
+        + np.minimum(comment_counts / _COMMENT_COUNT_FOR_MAX * _COMMENT_SCORE_MAX, _COMMENT_SCORE_MAX)
+    )
+
+def _comment_field(comment, name: str, default):
+    """コメント（辞書またはComment）から項目を取り出す"""
+    if isinstance(comment, dict):
+        return comment.get(name, default)
+    return getattr(comment, name, default)
+
+@lru_cache(maxsize=65536)
+def _is_foreign_text(text: str) -> bool:
+    """
+    英字の割合から外国人コメントかどうかを判定する
+
+    同じコメントは外国人反応・視聴者層の両方の分析で判定されるため、結果をキャッシュする
+    """
+    # 英語の文字が含まれているかチェック
+    text_chars = set(text)
+    
+    # 英語文字の割合を計算
+    english_char_count = len(text_chars.intersection(_ENGLISH_CHARS))
+    total_chars = len(text_chars)
+    
+    if total_chars == 0:
+        return False
+        
+    english_ratio = english_char_count / total_chars
+    
+    # 英語文字が30%以上含まれている場合を外国人コメントと判定
+    return english_ratio > 0.3
+
+# コメントテキスト -> 感情極性のキャッシュ（プロセスプールで計算した結果も親プロセスのここに保存する）
+_polarity_cache: Dict[str, float] = {}
+
+def _store_polarity(text: str, polarity: float) -> None:
+    """感情極性をキャッシュに保存する（上限を超えたら古いものから破棄）"""
+    if len(_polarity_cache) >= _POLARITY_CACHE_MAX_ENTRIES:
+        del _polarity_cache[next(iter(_polarity_cache))]
+    _polarity_cache[text] = polarity
+
+def _text_polarity(text: str) -> float:
+    """
+    コメントの感情極性を計算する
+
+    トレンド動画は収集のたびに同じコメントが再分析されるため、結果をキャッシュする
+    """
+    polarity = _polarity_cache.get(text)
+    if polarity is None:
+        polarity = _SENTIMENT_ANALYZER.analyze(text).polarity
+        _store_polarity(text, polarity)
+    return polarity
+
+def _batch_polarities(texts: List[str]) -> List[float]:
+    """
+    複数コメントの感情極性をまとめて計算する
+
+    同一テキストは1回だけ解析する
+
+    Args:
+        texts: コメントテキストのリスト
+
+    Returns:
+        List[float]: textsと同じ順序の極性（-1から1）
+    """
+    return [_text_polarity(text) for text in texts]
+
 class AnalysisService:
     def __init__(self):
         self.logger = logger
+        self.settings = get_settings()
+        # チャンネル動画のキャッシュ（(channel_id, limit) -> (有効期限, 動画リスト)）
+        self._channel_videos_cache: Dict[Tuple[str, int], Tuple[float, List[TrendVideo]]] = {}
+        # 分析結果のキャッシュ（(video_id, 視聴数, いいね数, コメント数) -> (有効期限, バズり度スコア, 分析結果)）
+        self._analysis_cache: Dict[Tuple[str, int, int, int], Tuple[float, float, Dict]] = {}
+        # 感情分析用のプロセスプール（必要になった時点で生成する）
+        self._max_workers = os.cpu_count() or 1
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def close(self) -> None:
+        """プロセスプールを終了する"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    async def _compute_polarities(self, texts: List[str]) -> List[float]:
+        """
+        コメントの感情極性を計算する
+
+        キャッシュ済みのテキストと重複を除いた件数が多い場合は、CPUコア数に分割してプロセスプールで並列に計算する。
+        ワーカーのキャッシュはプロセスごとに別のため、計算結果は親プロセスのキャッシュに保存する
+
+        Args:
+            texts: コメントテキストのリスト
+
+        Returns:
+            List[float]: textsと同じ順序の極性
+        """
+        polarities = {text: _polarity_cache.get(text) for text in texts}
+        missing = [text for text, polarity in polarities.items() if polarity is None]
+
+        if len(missing) < _PARALLEL_MIN_TEXTS or self._max_workers == 1:
+            for text, polarity in zip(missing, _batch_polarities(missing)):
+                polarities[text] = polarity
+            return [polarities[text] for text in texts]
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self._max_workers)
+
+        chunk_size = -(-len(missing) // self._max_workers)
+        loop = asyncio.get_running_loop()
+        chunks = await asyncio.gather(*[
+            loop.run_in_executor(self._pool, _batch_polarities, missing[i:i + chunk_size])
+            for i in range(0, len(missing), chunk_size)
+        ])
+        for text, polarity in zip(missing, (polarity for chunk in chunks for polarity in chunk)):
+            polarities[text] = polarity
+            _store_polarity(text, polarity)
+        return [polarities[text] for text in texts]
+
+    def clear_channel_cache(self) -> None:
+        """チャンネル動画のキャッシュを破棄する"""
+        self._channel_videos_cache.clear()
+
+    def clear_analysis_cache(self) -> None:
+        """分析結果のキャッシュを破棄する"""
+        self._analysis_cache.clear()
 
     async def analyze_trends(self, videos: List[TrendVideo]) -> List[TrendVideo]:
         """
@@ -21,33 +211,150 @@ class AnalysisService:
         Returns:
             List[TrendVideo]: 分析結果を含む動画リスト
         """
-        analyzed_videos = []
-        for video in videos:
+        # 全動画を1つのバッチとして感情極性を一括計算する
+        return [
+            video async for video in self.analyze_trends_stream(videos, batch_size=max(len(videos), 1))
+        ]
+
+    async def analyze_trends_stream(
+        self,
+        videos: List[TrendVideo],
+        batch_size: int = _STREAM_BATCH_SIZE
+    ) -> AsyncIterator[TrendVideo]:
+        """
+        動画のトレンドを分析し、分析が終わった動画から順に返す
+
+        Args:
+            videos: 分析対象の動画リスト
+            batch_size: 感情極性をまとめて計算する動画数
+
+        Yields:
+            TrendVideo: 分析結果を含む動画
+        """
+        for start in range(0, len(videos), batch_size):
+            batch = videos[start:start + batch_size]
+            now = time.monotonic()
+
+            # キャッシュの確認（キーを作れない動画はその動画だけ除外する）
+            entries = []
+            for video in batch:
+                try:
+                    key = self._analysis_cache_key(video)
+                except Exception as e:
+                    self.logger.error(f"Error analyzing video {video.video_id}: {str(e)}")
+                    continue
+                entries.append((video, key, self._get_cached_analysis(key, now)))
+
+            # キャッシュにない動画の感情分析とバズり度スコアをまとめて計算する（失敗した場合は動画ごとに計算する）
+            misses = [video for video, _, hit in entries if hit is None]
+            sentiments = buzz_scores = None
             try:
-                # バズり度スコアの計算
-                video.buzz_score = self._calculate_buzz_score(video)
-                
-                # 時系列分析の実行
-                trend_analysis = self._analyze_trends_over_time(video)
-                
-                # コメントの感情分析
-                sentiment_analysis = self._analyze_sentiment(video)
-                
-                # 分析結果を動画オブジェクトに追加
-                video.analysis = {
-                    "trend_analysis": trend_analysis,
-                    "sentiment_analysis": sentiment_analysis
-                }
-                
-                analyzed_videos.append(video)
-                
+                sentiment_analyses, channel_scores = await self._analyze_sentiments_batch(misses)
+                scores = self._calculate_buzz_scores_batch(misses, sentiment_analyses, channel_scores)
             except Exception as e:
-                self.logger.error(f"Error analyzing video {video.video_id}: {str(e)}")
-                continue
-                
-        return analyzed_videos
+                self.logger.error(f"Error analyzing videos in batch: {str(e)}")
+            else:
+                buzz_scores = iter(scores)
+                sentiments = iter(sentiment_analyses)
+
+            for video, key, hit in entries:
+                if hit is not None:
+                    # 統計情報が前回から変わっていない動画は前回の分析結果を使う
+                    video.buzz_score, video.analysis = hit
+                    yield video
+                    continue
+
+                try:
+                    if sentiments is not None:
+                        sentiment_analysis = next(sentiments)
+                        video.buzz_score = next(buzz_scores)
+                    else:
+                        sentiment_analysis = self._analyze_sentiment(video)
+                        video.buzz_score = self._calculate_buzz_score(video, sentiment_analysis)
+
+                    # 時系列分析の実行
+                    trend_analysis = self._analyze_trends_over_time(video)
+                    
+                    # 分析結果を動画オブジェクトに追加
+                    video.analysis = {
+                        "trend_analysis": trend_analysis,
+                        "sentiment_analysis": sentiment_analysis
+                    }
+                    self._store_analysis(key, now, video.buzz_score, video.analysis)
+                    
+                except Exception as e:
+                    self.logger.error(f"Error analyzing video {video.video_id}: {str(e)}")
+                    continue
+
+                yield video
+
+    async def _analyze_sentiments_batch(
+        self,
+        videos: List[TrendVideo]
+    ) -> Tuple[List[Dict], Dict[str, float]]:
+        """
+        複数動画のコメントの感情分析をまとめて行う
+
+        全動画のコメントを1つのリストにまとめて感情極性を一括計算し、動画ごとに割り当てる
 
-    def _calculate_buzz_score(self, video: TrendVideo) -> float:
+        Args:
+            videos: 分析対象の動画リスト
+
+        Returns:
+            Tuple[List[Dict], Dict[str, float]]: videosと同じ順序の感情分析結果と、チャンネルIDごとの影響力スコア
+        """
+        comment_texts = [
+            [_comment_field(comment, 'text', '') for comment in (getattr(video, 'comments', None) or [])]
+            for video in videos
+        ]
+        polarities = await self._compute_polarities([text for texts in comment_texts for text in texts])
+        channel_scores = self._channel_score_table(videos)
+
+        sentiment_analyses = []
+        offset = 0
+        for video, texts in zip(videos, comment_texts):
+            sentiment_analyses.append(
+                self._analyze_sentiment(video, polarities[offset:offset + len(texts)])
+            )
+            offset += len(texts)
+        return sentiment_analyses, channel_scores
+
+    @staticmethod
+    def _analysis_cache_key(video: TrendVideo) -> Tuple[str, int, int, int]:
+        """分析結果のキャッシュキー（動画IDと統計情報の組）"""
+        stats = video.stats
+        return (video.video_id, stats.view_count, stats.like_count, stats.comment_count)
+
+    def _get_cached_analysis(
+        self,
+        key: Tuple[str, int, int, int],
+        now: float
+    ) -> Optional[Tuple[float, Dict]]:
+        """有効期限内の分析結果（バズり度スコア, 分析結果のコピー）を返す"""
+        cached = self._analysis_cache.get(key)
+        if cached is None or cached[0] <= now:
+            return None
+        return cached[1], copy.deepcopy(cached[2])
+
+    def _store_analysis(
+        self,
+        key: Tuple[str, int, int, int],
+        now: float,
+        buzz_score: float,
+        analysis: Dict
+    ) -> None:
+        """分析結果のコピーをキャッシュに保存する（上限を超えたら古いものから破棄）"""
+        self._analysis_cache.pop(key, None)
+        if len(self._analysis_cache) >= _ANALYSIS_CACHE_MAX_ENTRIES:
+            del self._analysis_cache[next(iter(self._analysis_cache))]
+        self._analysis_cache[key] = (now + self.settings.cache_ttl, buzz_score, copy.deepcopy(analysis))
+
+    def _calculate_buzz_score(
+        self,
+        video: TrendVideo,
+        sentiment_analysis: Optional[Dict] = None,
+        channel_scores: Optional[Dict[str, float]] = None
+    ) -> float:
         """
         バズり度スコアを計算する
 
@@ -58,37 +365,116 @@ class AnalysisService:
         - チャンネルの影響力（0-15点）
         - 感情分析スコア（0-10点）
 
+        Args:
+            video: 分析対象の動画
+            sentiment_analysis: 計算済みの感情分析結果（省略時はここで計算する）
+            channel_scores: チャンネルIDごとの計算済み影響力スコア（省略時はここで計算する）
+
         Returns:
             float: バズり度スコア（0-100）
         """
         try:
-            # 視聴回数スコア（0-30点）
-            # 10万回視聴で30点、それ以上は30点固定
-            view_score = min(video.stats.view_count / 100000 * 30, 30)
-
-            # エンゲージメントスコア（0-25点）
-            # エンゲージメント率が10%で25点、それ以上は25点固定
-            engagement_score = min(video.stats.engagement_rate * 2.5, 25)
-
-            # コメント活性度スコア（0-20点）
-            # 1000コメントで20点、それ以上は20点固定
-            comment_score = min(video.stats.comment_count / 1000 * 20, 20)
+            # 視聴回数スコア（10万回視聴で30点）、エンゲージメントスコア（10%で25点）、
+            # コメント活性度スコア（1000コメントで20点）の合計。いずれも上限で固定
+            stats_score = float(_stats_score(
+                video.stats.view_count,
+                video.stats.engagement_rate,
+                video.stats.comment_count
+            ))
 
             # チャンネル影響力スコア（0-15点）
-            channel_score = self._calculate_channel_score(video)
+            if channel_scores is not None and video.channel_id in channel_scores:
+                channel_score = channel_scores[video.channel_id]
+            else:
+                channel_score = self._calculate_channel_score(video)
 
             # 感情分析スコア（0-10点）
-            sentiment_score = self._calculate_sentiment_score(video)
+            sentiment_score = self._calculate_sentiment_score(video, sentiment_analysis)
 
             # 合計スコア
-            total_score = view_score + engagement_score + comment_score + channel_score + sentiment_score
+            total_score = stats_score + channel_score + sentiment_score
 
-            return min(total_score, 100)
+            return min(total_score, _BUZZ_SCORE_MAX)
 
         except Exception as e:
             self.logger.error(f"Error calculating buzz score: {str(e)}")
             return 0.0
 
+    def _calculate_buzz_scores_batch(
+        self,
+        videos: List[TrendVideo],
+        sentiment_analyses: List[Dict],
+        channel_scores: Dict[str, float]
+    ) -> List[float]:
+        """
+        複数動画のバズり度スコアをまとめて計算する
+
+        各スコア要素を動画数の長さの配列にまとめ、配列演算で一度に計算する。
+        配点は_calculate_buzz_scoreと共通の_stats_scoreで計算する
+
+        Args:
+            videos: 分析対象の動画リスト
+            sentiment_analyses: videosと同じ順序の計算済み感情分析結果
+            channel_scores: チャンネルIDごとの計算済み影響力スコア
+
+        Returns:
+            List[float]: videosと同じ順序のバズり度スコア（0-100）
+        """
+        if not videos:
+            return []
+
+        try:
+            count = len(videos)
+            view_counts = np.fromiter((video.stats.view_count for video in videos), dtype=np.float64, count=count)
+            engagement_rates = np.fromiter((video.stats.engagement_rate for video in videos), dtype=np.float64, count=count)
+            comment_counts = np.fromiter((video.stats.comment_count for video in videos), dtype=np.float64, count=count)
+            channel = np.fromiter(
+                (
+                    channel_scores[video.channel_id] if video.channel_id in channel_scores
+                    else self._calculate_channel_score(video)
+                    for video in videos
+                ),
+                dtype=np.float64,
+                count=count
+            )
+            sentiment = np.fromiter(
+                (
+                    self._calculate_sentiment_score(video, analysis)
+                    for video, analysis in zip(videos, sentiment_analyses)
+                ),
+                dtype=np.float64,
+                count=count
+            )
+
+            total = _stats_score(view_counts, engagement_rates, comment_counts) + channel + sentiment
+            return np.minimum(total, _BUZZ_SCORE_MAX).tolist()
+
+        except Exception as e:
+            # 一部の動画の統計情報が不正な場合は動画ごとに計算する
+            self.logger.error(f"Error calculating buzz scores in batch: {str(e)}")
+            return [
+                self._calculate_buzz_score(video, analysis, channel_scores)
+                for video, analysis in zip(videos, sentiment_analyses)
+            ]
+
+    def _channel_score_table(self, videos: List[TrendVideo]) -> Dict[str, float]:
+        """
+        動画リストに含まれるチャンネルの影響力スコアをまとめて計算する
+
+        同じチャンネルの動画が複数あっても、スコアはチャンネルごとに1回だけ計算する
+
+        Args:
+            videos: 分析対象の動画リスト
+
+        Returns:
+            Dict[str, float]: チャンネルIDごとの影響力スコア
+        """
+        table: Dict[str, float] = {}
+        for video in videos:
+            if video.channel_id not in table:
+                table[video.channel_id] = self._calculate_channel_score(video)
+        return table
+
     def _calculate_channel_score(self, video: TrendVideo) -> float:
         """
         チャンネルの影響力スコアを計算する
@@ -121,6 +507,9 @@ class AnalysisService:
         """
         チャンネルの過去の動画を取得する
 
+        同じバッチに同一チャンネルの動画が複数含まれることが多いため、
+        取得結果はcache_ttl秒の間キャッシュする
+
         Args:
             channel_id: チャンネルID
             limit: 取得する動画の最大数
@@ -128,13 +517,26 @@ class AnalysisService:
         Returns:
             List[TrendVideo]: チャンネルの動画リスト
         """
+        key = (channel_id, limit)
+        now = time.monotonic()
+        cached = self._channel_videos_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
         try:
             # TODO: 実際のデータベースから取得する実装に変更
-            return []
+            videos: List[TrendVideo] = []
         except Exception as e:
             self.logger.error(f"Error getting channel videos: {str(e)}")
             return []
 
+        # 上限を超えたら古いものから破棄する
+        self._channel_videos_cache.pop(key, None)
+        if len(self._channel_videos_cache) >= _CHANNEL_VIDEOS_CACHE_MAX_ENTRIES:
+            del self._channel_videos_cache[next(iter(self._channel_videos_cache))]
+        self._channel_videos_cache[key] = (now + self.settings.cache_ttl, videos)
+        return videos
+
     def _analyze_trends_over_time(self, video: TrendVideo) -> Dict:
         """
         時系列での統計情報の変化を分析する
@@ -147,12 +549,7 @@ class AnalysisService:
         """
         try:
             if not video.stats.history:
-                return {
-                    "view_growth_rate": 0.0,
-                    "engagement_growth_rate": 0.0,
-                    "comment_growth_rate": 0.0,
-                    "trend_direction": "stable"
-                }
+                return dict(_EMPTY_TREND_ANALYSIS)
 
             # 最新と最古の統計情報を取得
             latest_stats = video.stats.history[-1]
@@ -162,17 +559,20 @@ class AnalysisService:
             time_diff = (latest_stats.recorded_at - oldest_stats.recorded_at).total_seconds() / 3600
             
             if time_diff == 0:
-                return {
-                    "view_growth_rate": 0.0,
-                    "engagement_growth_rate": 0.0,
-                    "comment_growth_rate": 0.0,
-                    "trend_direction": "stable"
-                }
+                return dict(_EMPTY_TREND_ANALYSIS)
 
             # 成長率の計算（1時間あたり）
-            view_growth = (latest_stats.view_count - oldest_stats.view_count) / time_diff
-            engagement_growth = (latest_stats.engagement_rate - oldest_stats.engagement_rate) / time_diff
-            comment_growth = (latest_stats.comment_count - oldest_stats.comment_count) / time_diff
+            # 最古・最新の2点を (2, 3) の配列にまとめ、差分と除算を一度に行う
+            endpoints = np.array(
+                [
+                    (oldest_stats.view_count, oldest_stats.engagement_rate, oldest_stats.comment_count),
+                    (latest_stats.view_count, latest_stats.engagement_rate, latest_stats.comment_count),
+                ],
+                dtype=np.float64
+            )
+            view_growth, engagement_growth, comment_growth = (
+                (endpoints[1] - endpoints[0]) / time_diff
+            ).tolist()
 
             # トレンドの方向を判定
             trend_direction = self._determine_trend_direction(
@@ -188,19 +588,19 @@ class AnalysisService:
 
         except Exception as e:
             self.logger.error(f"Error analyzing trends over time: {str(e)}")
-            return {
-                "view_growth_rate": 0.0,
-                "engagement_growth_rate": 0.0,
-                "comment_growth_rate": 0.0,
-                "trend_direction": "stable"
-            }
+            return dict(_EMPTY_TREND_ANALYSIS)
 
-    def _analyze_sentiment(self, video: TrendVideo) -> Dict:
+    def _analyze_sentiment(
+        self,
+        video: TrendVideo,
+        sentiments: Optional[List[float]] = None
+    ) -> Dict:
         """
         コメントの感情分析を行う
 
         Args:
             video: 分析対象の動画
+            sentiments: 計算済みのコメント極性（省略時はここで計算する）
 
         Returns:
             Dict: 感情分析結果
@@ -217,10 +617,8 @@ class AnalysisService:
                     "dominant_sentiment": "neutral"
                 }
 
-            sentiments = []
-            for comment in video.comments:
-                blob = TextBlob(comment.text)
-                sentiments.append(blob.sentiment.polarity)
+            if sentiments is None:
+                sentiments = _batch_polarities([_comment_field(comment, 'text', '') for comment in video.comments])
 
             if not sentiments:
                 return {
@@ -233,13 +631,17 @@ class AnalysisService:
                     "dominant_sentiment": "neutral"
                 }
 
+            scores = np.asarray(sentiments, dtype=np.float64)
+
             # 感情スコアの計算
-            avg_sentiment = np.mean(sentiments)
+            avg_sentiment = float(scores.mean())
             
-            # 感情分布の計算
-            positive = len([s for s in sentiments if s > 0.1]) / len(sentiments)
-            neutral = len([s for s in sentiments if -0.1 <= s <= 0.1]) / len(sentiments)
-            negative = len([s for s in sentiments if s < -0.1]) / len(sentiments)
+            # 感情分布の計算（配列演算で一括集計する）
+            positive_count = np.count_nonzero(scores > 0.1)
+            negative_count = np.count_nonzero(scores < -0.1)
+            positive = positive_count / scores.size
+            neutral = (scores.size - positive_count - negative_count) / scores.size
+            negative = negative_count / scores.size
 
             # 主要な感情を判定
             dominant_sentiment = self._determine_dominant_sentiment(positive, neutral, negative)
@@ -266,18 +668,24 @@ class AnalysisService:
                 "dominant_sentiment": "neutral"
             }
 
-    def _calculate_sentiment_score(self, video: TrendVideo) -> float:
+    def _calculate_sentiment_score(
+        self,
+        video: TrendVideo,
+        sentiment_analysis: Optional[Dict] = None
+    ) -> float:
         """
         感情分析スコアを計算する
 
         Args:
             video: 分析対象の動画
+            sentiment_analysis: 計算済みの感情分析結果（省略時はここで計算する）
 
         Returns:
             float: 感情分析スコア（0-10）
         """
         try:
-            sentiment_analysis = self._analyze_sentiment(video)
+            if sentiment_analysis is None:
+                sentiment_analysis = self._analyze_sentiment(video)
             sentiment_score = sentiment_analysis["sentiment_score"]
             
             # 感情スコアを0-10の範囲に変換
@@ -313,12 +721,8 @@ class AnalysisService:
             comment_growth * 0.2
         )
 
-        if weighted_growth > 100:
-            return "increasing"
-        elif weighted_growth < -100:
-            return "decreasing"
-        else:
-            return "stable"
+        # 閾値との比較結果（-1, 0, 1）でラベルを引く
+        return _TREND_DIRECTIONS[(weighted_growth > 100) - (weighted_growth < -100) + 1]
 
     def _determine_dominant_sentiment(
         self,
@@ -344,12 +748,17 @@ class AnalysisService:
         else:
             return "neutral"
 
-    def _analyze_foreign_reaction(self, video: TrendVideo) -> ForeignReaction:
+    def _analyze_foreign_reaction(
+        self,
+        video: TrendVideo,
+        sentiments: Optional[List[float]] = None
+    ) -> ForeignReaction:
         """
         外国人視点からの反応を分析する
 
         Args:
             video: 分析対象の動画
+            sentiments: video.commentsと同じ順序の計算済み極性（省略時はここで計算する）
 
         Returns:
             ForeignReaction: 外国人視点からの反応
@@ -363,9 +772,14 @@ class AnalysisService:
                 )
 
             # 外国人コメントの抽出（英語コメントを想定）
+            foreign_flags = np.fromiter(
+                (self._is_foreign_comment(_comment_field(comment, 'text', '')) for comment in video.comments),
+                dtype=bool,
+                count=len(video.comments)
+            )
             foreign_comments = [
-                comment for comment in video.comments
-                if self._is_foreign_comment(comment.text)
+                comment for comment, is_foreign in zip(video.comments, foreign_flags)
+                if is_foreign
             ]
 
             if not foreign_comments:
@@ -375,14 +789,17 @@ class AnalysisService:
                     comment_examples=[]
                 )
 
-            # 感情分析の実行
-            sentiments = []
-            for comment in foreign_comments:
-                blob = TextBlob(comment.text)
-                sentiments.append(blob.sentiment.polarity)
+            # 感情分析の実行（計算済みの極性は外国人コメントのマスクで一度に絞り込む）
+            if sentiments is None:
+                scores = np.asarray(
+                    _batch_polarities([_comment_field(comment, 'text', '') for comment in foreign_comments]),
+                    dtype=np.float64
+                )
+            else:
+                scores = np.asarray(sentiments, dtype=np.float64)[foreign_flags]
 
             # 感情スコアの計算
-            sentiment_score = np.mean(sentiments) if sentiments else 0.0
+            sentiment_score = float(scores.mean()) if scores.size else 0.0
 
             # 反応タイプの判定
             reaction_type = self._determine_reaction_type(foreign_comments, sentiment_score)
@@ -414,21 +831,7 @@ class AnalysisService:
         Returns:
             bool: 外国人コメントの場合True
         """
-        # 英語の文字が含まれているかチェック
-        english_chars = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')
-        text_chars = set(text)
-        
-        # 英語文字の割合を計算
-        english_char_count = len(english_chars.intersection(text_chars))
-        total_chars = len(text_chars)
-        
-        if total_chars == 0:
-            return False
-            
-        english_ratio = english_char_count / total_chars
-        
-        # 英語文字が30%以上含まれている場合を外国人コメントと判定
-        return english_ratio > 0.3
+        return _is_foreign_text(text)
 
     def _determine_reaction_type(self, comments: List[Dict], sentiment_score: float) -> str:
         """
@@ -475,16 +878,22 @@ class AnalysisService:
         if not comments:
             return []
 
-        # いいね数でソート
-        sorted_comments = sorted(comments, key=lambda x: x.get('like_count', 0), reverse=True)
+        # いいね数の多い順に取り出すヒープ（同数の場合は元の順序を優先）
+        heap = [
+            (-_comment_field(comment, 'like_count', 0), index)
+            for index, comment in enumerate(comments)
+        ]
+        heapq.heapify(heap)
         
         # 上位のコメントを抽出（重複を避けるため）
+        # 全件をソートせず、必要な件数が揃った時点で打ち切る
         representative_comments = []
         seen_texts = set()
         
-        for comment in sorted_comments:
-            text = comment.get('text', '').strip()
-            if text and text not in seen_texts and len(representative_comments) < max_examples:
+        while heap and len(representative_comments) < max_examples:
+            _, index = heapq.heappop(heap)
+            text = _comment_field(comments[index], 'text', '').strip()
+            if text and text not in seen_texts:
                 representative_comments.append(text)
                 seen_texts.add(text)
         
@@ -501,11 +910,15 @@ class AnalysisService:
             Dict: 包括的な分析結果
         """
         try:
+            # コメントの感情極性は一度だけ計算し、各分析で共有する
+            comments = getattr(video, 'comments', None) or []
+            sentiments = _batch_polarities([_comment_field(comment, 'text', '') for comment in comments])
+
             # 基本分析
-            buzz_score = self._calculate_buzz_score(video)
+            sentiment_analysis = self._analyze_sentiment(video, sentiments)
+            buzz_score = self._calculate_buzz_score(video, sentiment_analysis)
             trend_analysis = self._analyze_trends_over_time(video)
-            sentiment_analysis = self._analyze_sentiment(video)
-            foreign_reaction = self._analyze_foreign_reaction(video)
+            foreign_reaction = self._analyze_foreign_reaction(video, sentiments)
 
             # 詳細分析
             engagement_analysis = self._analyze_engagement_patterns(video)
@@ -614,7 +1027,7 @@ class AnalysisService:
             if hasattr(video, 'comments') and video.comments:
                 foreign_comment_count = len([
                     comment for comment in video.comments
-                    if self._is_foreign_comment(comment.get('text', ''))
+                    if self._is_foreign_comment(_comment_field(comment, 'text', ''))
                 ])
                 foreign_ratio = foreign_comment_count / len(video.comments)
             else:
@@ -13,6 +13,8 @@ class TrendCollector:
         self.youtube_service = youtube_service
         self.trend_repository = trend_repository
         self.logger = logger
+        # リポジトリのセッションはスレッドセーフではないため、地域ごとの並行収集でもDB操作は1つずつ行う
+        self._db_lock = asyncio.Lock()
 
     async def collect_trends(
         self,
@@ -43,13 +45,10 @@ class TrendCollector:
             )
 
             # 動画情報をデータベースに保存
-            saved_videos = []
-            for video in videos:
-                saved_video = self.trend_repository.save_video(video)
-                saved_videos.append(saved_video)
+            saved_videos = await self.save_videos(videos)
 
             # 古い動画を削除
-            deleted_count = self.trend_repository.delete_old_videos(days=30)
+            deleted_count = await self.delete_old_videos(days=30)
             if deleted_count > 0:
                 self.logger.info(f"Deleted {deleted_count} old videos")
 
@@ -59,6 +58,37 @@ class TrendCollector:
             self.logger.error(f"Error collecting trends: {str(e)}")
             raise
 
+    async def save_videos(self, videos: List[TrendVideo]) -> List[TrendVideo]:
+        """
+        動画情報を1回のトランザクションでまとめて保存する
+
+        同じバッチの動画は同時に収集したものとして、日時は1回だけ取得する。
+        同期のORM呼び出しはスレッドで実行し、イベントループを止めない
+
+        Args:
+            videos: 保存する動画リスト
+
+        Returns:
+            List[TrendVideo]: 保存した動画リスト
+        """
+        async with self._db_lock:
+            return await asyncio.to_thread(
+                self.trend_repository.save_many, videos, now=datetime.now()
+            )
+
+    async def delete_old_videos(self, days: int = 30) -> int:
+        """
+        古い動画を削除する
+
+        Args:
+            days: 削除する動画の日数
+
+        Returns:
+            int: 削除した動画の数
+        """
+        async with self._db_lock:
+            return await asyncio.to_thread(self.trend_repository.delete_old_videos, days=days)
+
     async def start_collection_loop(
         self,
         interval_minutes: int = 60,
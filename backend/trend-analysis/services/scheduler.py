@@ -1,10 +1,9 @@
 import asyncio
-import schedule
 import time
 from datetime import datetime, timedelta
 from typing import List, Optional
 from ..services.collector import TrendCollector
-from ..services.youtube import YouTubeService
+from ..services.youtube import get_youtube_service, parse_youtube_timestamp
 from ..repositories.trend_repository import TrendRepository
 from ..core.logging import get_logger
 
@@ -12,11 +11,15 @@ logger = get_logger(__name__)
 
 class TrendScheduler:
     def __init__(self):
-        self.youtube_service = YouTubeService()
+        self.youtube_service = get_youtube_service()
         self.trend_repository = TrendRepository()
         self.collector = TrendCollector(self.youtube_service, self.trend_repository)
         self.logger = logger
         self.is_running = False
+        # 停止要求（収集間隔の待機中でもすぐに停止できるようにする）
+        self._stop_event = asyncio.Event()
+        self._collection_interval: Optional[int] = None
+        self._last_run: Optional[datetime] = None
 
     async def start_scheduler(self, collection_interval: int = 60):
         """
@@ -27,18 +30,19 @@ class TrendScheduler:
         """
         try:
             self.is_running = True
+            self._collection_interval = collection_interval
+            self._stop_event.clear()
             self.logger.info(f"Starting trend collection scheduler with {collection_interval} minute intervals")
 
-            # スケジュールの設定
-            schedule.every(collection_interval).minutes.do(self._collect_trends_job)
-
-            # 初回収集を即座に実行
-            await self._collect_trends_job()
-
-            # スケジューラーの実行
+            # 初回収集を即座に実行し、以降は次の収集時刻まで停止要求を待つ
+            # （ポーリングせず、待機中はイベントループを起こさない）
             while self.is_running:
-                schedule.run_pending()
-                await asyncio.sleep(1)
+                self._last_run = datetime.now()
+                await self._collect_trends_job()
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=collection_interval * 60)
+                except asyncio.TimeoutError:
+                    pass
 
         except Exception as e:
             self.logger.error(f"Error in scheduler: {str(e)}")
@@ -48,6 +52,7 @@ class TrendScheduler:
     def stop_scheduler(self):
         """スケジューラーを停止する"""
         self.is_running = False
+        self._stop_event.set()
         self.logger.info("Trend collection scheduler stopped")
 
     async def _collect_trends_job(self):
@@ -57,32 +62,45 @@ class TrendScheduler:
         try:
             self.logger.info("Starting trend collection job")
 
-            # 複数の地域でトレンドを収集
+            # 複数の地域でトレンドを並行して収集
+            # （API呼び出しの同時実行数はYouTubeServiceのセマフォで制限される）
             regions = ["JP", "US", "GB", "CA", "AU"]
             all_videos = []
 
-            for region in regions:
-                try:
-                    videos = await self.collector.collect_trends(
+            # 全地域のトレンドを1回のバッチリクエストで取得してキャッシュしておき、
+            # 地域ごとの収集ではキャッシュを使う
+            try:
+                await self.youtube_service.get_trending_videos_multi(
+                    regions, max_results=20, time_period="day"
+                )
+            except Exception as e:
+                # 失敗した場合は地域ごとの収集で個別に取得する
+                self.logger.error(f"Error prefetching trends in batch: {str(e)}")
+
+            results = await asyncio.gather(
+                *(
+                    self.collector.collect_trends(
                         region_code=region,
                         max_results=20,
                         time_period="day"
                     )
-                    all_videos.extend(videos)
-                    self.logger.info(f"Collected {len(videos)} videos from region {region}")
-
-                    # API制限を考慮して少し待機
-                    await asyncio.sleep(1)
+                    for region in regions
+                ),
+                return_exceptions=True
+            )
 
-                except Exception as e:
-                    self.logger.error(f"Error collecting trends for region {region}: {str(e)}")
+            for region, result in zip(regions, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Error collecting trends for region {region}: {str(result)}")
                     continue
+                all_videos.extend(result)
+                self.logger.info(f"Collected {len(result)} videos from region {region}")
 
             # 重複を除去
             unique_videos = self._remove_duplicates(all_videos)
             
             # 古いデータの削除
-            deleted_count = self.trend_repository.delete_old_videos(days=30)
+            deleted_count = await self.collector.delete_old_videos(days=30)
             
             self.logger.info(f"Collection job completed. Collected {len(unique_videos)} unique videos, deleted {deleted_count} old videos")
 
@@ -99,15 +117,12 @@ class TrendScheduler:
         Returns:
             List: 重複を除去した動画リスト
         """
-        seen_video_ids = set()
-        unique_videos = []
-
+        # 辞書の挿入順を利用し、動画IDごとに最初に出現した動画を残す
+        unique_videos = {}
         for video in videos:
-            if video.video_id not in seen_video_ids:
-                seen_video_ids.add(video.video_id)
-                unique_videos.append(video)
+            unique_videos.setdefault(video.video_id, video)
 
-        return unique_videos
+        return list(unique_videos.values())
 
     async def collect_by_category(self, category_id: str, region_code: str = "JP"):
         """
@@ -155,11 +170,8 @@ class TrendScheduler:
                 if video:
                     videos.append(video)
 
-            # データベースに保存
-            saved_videos = []
-            for video in videos:
-                saved_video = self.trend_repository.save_video(video)
-                saved_videos.append(saved_video)
+            # データベースにまとめて保存（1回のコミット）
+            saved_videos = await self.collector.save_videos(videos)
 
             self.logger.info(f"Collected {len(saved_videos)} videos for keyword '{keyword}'")
             return saved_videos
@@ -192,7 +204,7 @@ class TrendScheduler:
                 video_id=search_result["video_id"],
                 title=search_result["title"],
                 description=search_result["description"],
-                published_at=datetime.fromisoformat(search_result["published_at"].replace("Z", "+00:00")),
+                published_at=parse_youtube_timestamp(search_result["published_at"]),
                 channel_id=search_result.get("channel_id", ""),
                 channel_title=search_result["channel_title"],
                 stats=stats
@@ -209,9 +221,13 @@ class TrendScheduler:
         Returns:
             dict: スケジューラーの状態情報
         """
+        next_run = None
+        if self.is_running and self._last_run is not None:
+            next_run = self._last_run + timedelta(minutes=self._collection_interval)
+
         return {
             "is_running": self.is_running,
-            "next_run": schedule.next_run(),
-            "last_run": getattr(self, '_last_run', None),
-            "total_jobs": len(schedule.jobs)
+            "next_run": next_run,
+            "last_run": self._last_run,
+            "total_jobs": 1 if self.is_running else 0
         } 
\ No newline at end of file
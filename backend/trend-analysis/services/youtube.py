@@ -1,18 +1,326 @@
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict
+import asyncio
+import re
+import threading
+import time
+import weakref
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional, Dict, Tuple
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+from googleapiclient.model import JsonModel
+import orjson
 from ..models import TrendVideo, VideoStats
 from ..core.config import get_settings
 from ..core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# API呼び出しスレッドごとのHTTPクライアント
+_thread_local = threading.local()
+
+# commentThreads.list の1ページあたりの最大件数（APIの上限）
+_COMMENTS_PAGE_SIZE = 100
+
+# search.list / videos.list の1ページあたりの最大件数（APIの上限、videos.list のID指定数の上限も同じ）
+_VIDEOS_PAGE_SIZE = 50
+
+# レスポンスに含める項目（変換で使う項目だけを返させ、レスポンスのサイズを減らす）
+_SEARCH_FIELDS = "nextPageToken,items/id/videoId"
+_VIDEO_DETAILS_FIELDS = (
+    "items(id,snippet(title,description,publishedAt,channelId,channelTitle,thumbnails/high/url),"
+    "statistics(viewCount,likeCount,commentCount),contentDetails/duration)"
+)
+_TRENDING_FIELDS = (
+    "nextPageToken,items(id,snippet(title,description,publishedAt,channelId,channelTitle),"
+    "statistics(viewCount,likeCount,commentCount))"
+)
+_COMMENT_FIELDS = (
+    "nextPageToken,items(id,snippet/topLevelComment/snippet"
+    "(authorDisplayName,textDisplay,likeCount,publishedAt,updatedAt,authorChannelId))"
+)
+
+# APIレスポンスキャッシュの最大件数
+_RESPONSE_CACHE_MAX_ENTRIES = 1024
+
+# プロセス内で同時に実行するYouTube API呼び出しの上限
+_MAX_CONCURRENT_REQUESTS = 16
+
+# 429・5xxエラー時の再試行回数（googleapiclientが指数バックオフで再試行する）
+_MAX_RETRIES = 3
+
+# クォータ超過後にAPI呼び出しを止める時間（秒）
+_QUOTA_COOLDOWN_SECONDS = 60
+
+# 全インスタンス共通のAPI呼び出しの同時実行数の制限（イベントループごと）と、実行中の呼び出し数
+_request_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+_inflight_requests = 0
+
+# 直近のクォータ超過エラーと、API呼び出しを再開する時刻（time.monotonic()）
+_quota_error: Optional[HttpError] = None
+_quota_retry_at = 0.0
+
+def _get_request_semaphore() -> asyncio.Semaphore:
+    """
+    実行中のイベントループのセマフォを取得する（なければ生成する）
+
+    asyncio.Semaphoreは最初に待機したイベントループに紐づくため、
+    テストやスケジューラーなど別のループから呼ばれてもエラーにならないようループごとに生成する
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _request_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _request_semaphores[loop] = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+    return semaphore
+
+def get_inflight_request_count() -> int:
+    """実行中のYouTube API呼び出し数を取得する"""
+    return _inflight_requests
+
+# 期間ごとの公開日時の下限までの長さ（未知の期間は1日として扱う）
+_PUBLISHED_AFTER_PERIODS = {
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30),
+}
+
+@lru_cache(maxsize=8)
+def _published_after_str(time_period: str, minute_bucket: int) -> str:
+    """
+    期間に応じた公開日時の下限をAPIに渡す文字列で取得する
+
+    同じ分の間の呼び出しでは同じ文字列を使い回す
+
+    Args:
+        time_period: 期間（day, week, month）
+        minute_bucket: 現在時刻（UNIX時間）を分単位に切り捨てた値
+
+    Returns:
+        str: "YYYY-MM-DDTHH:MM:SSZ" 形式の日時
+    """
+    now = datetime.fromtimestamp(minute_bucket * 60, tz=timezone.utc)
+    published_after = now - _PUBLISHED_AFTER_PERIODS.get(time_period, _PUBLISHED_AFTER_PERIODS["day"])
+    return published_after.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+# contentDetails.duration（ISO 8601の期間。例: "PT10M30S"、ライブ配信などでは "P1DT2H"）
+_DURATION_RE = re.compile(r"P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?")
+
+def parse_iso_duration(value: str) -> int:
+    """
+    ISO 8601の期間を秒数に変換する
+
+    Args:
+        value: 期間の文字列
+
+    Returns:
+        int: 秒数（形式が違う場合は0）
+    """
+    match = _DURATION_RE.fullmatch(value)
+    if match is None:
+        return 0
+    days, hours, minutes, seconds = (int(part) if part else 0 for part in match.groups())
+    return ((days * 24 + hours) * 60 + minutes) * 60 + seconds
+
+@lru_cache(maxsize=4096)
+def parse_youtube_timestamp(value: str) -> datetime:
+    """
+    YouTube APIの日時文字列（RFC 3339）をdatetimeに変換する
+
+    通常の "YYYY-MM-DDTHH:MM:SSZ" 形式は位置を決め打ちで読み取り、
+    それ以外の形式はfromisoformatで変換する。定期収集で同じ動画の日時を繰り返し変換するためキャッシュする
+
+    Args:
+        value: 日時文字列
+
+    Returns:
+        datetime: タイムゾーン付きの日時
+    """
+    if len(value) == 20 and value[19] == "Z":
+        return datetime(
+            int(value[0:4]), int(value[5:7]), int(value[8:10]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19]),
+            tzinfo=timezone.utc
+        )
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+class _OrjsonModel(JsonModel):
+    """APIレスポンスのJSONを標準のjsonモジュールではなくorjsonでデコードするモデル"""
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # JSONでないレスポンスはJsonModelと同じく文字列のまま返す
+            return content.decode("utf-8") if isinstance(content, bytes) else content
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
 class YouTubeService:
     def __init__(self):
         self.settings = get_settings()
-        self.youtube = build('youtube', 'v3', developerKey=self.settings.youtube_api_key)
+        self.youtube = build(
+            'youtube', 'v3',
+            developerKey=self.settings.youtube_api_key,
+            model=_OrjsonModel()
+        )
+        # リソースオブジェクトは呼び出しごとに生成せず、1回だけ生成して使い回す
+        self._videos = self.youtube.videos()
+        self._search = self.youtube.search()
+        self._comment_threads = self.youtube.commentThreads()
         self.logger = logger
+        # APIレスポンスのキャッシュ（(メソッド名, 引数...) -> (有効期限, 結果)）
+        self._response_cache: Dict[Tuple, Tuple[float, Any]] = {}
+        # 取得中のリクエスト（同じキーの同時リクエストは1回のAPI呼び出しにまとめる）
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+
+    async def _execute(self, request, retry: bool = True) -> Dict:
+        """
+        APIリクエストをスレッドで実行する（イベントループを止めず、複数の呼び出しを並行させる）
+
+        httplib2.Httpはスレッドセーフではないため、スレッドごとに1つ生成して使い回す。
+        一括収集でクォータを一気に消費しないよう、同時実行数はセマフォで制限する。
+        429・5xxエラーは指数バックオフで再試行し、クォータ超過後は一定時間APIを呼ばずに同じエラーを返す
+
+        Args:
+            request: googleapiclientのHttpRequest（またはBatchHttpRequest）
+            retry: 失敗時に再試行するか（BatchHttpRequestは再試行に対応していないためFalseを指定する）
+
+        Returns:
+            Dict: APIレスポンス
+        """
+        global _inflight_requests
+        if _quota_error is not None and time.monotonic() < _quota_retry_at:
+            raise _quota_error
+
+        def _run() -> Dict:
+            http = getattr(_thread_local, "http", None)
+            if http is None:
+                http = _thread_local.http = build_http()
+            if retry:
+                return request.execute(http=http, num_retries=_MAX_RETRIES)
+            return request.execute(http=http)
+
+        async with _get_request_semaphore():
+            _inflight_requests += 1
+            try:
+                return await asyncio.to_thread(_run)
+            except HttpError as e:
+                self._record_quota_error(e)
+                raise
+            finally:
+                _inflight_requests -= 1
+
+    def _record_quota_error(self, error: Exception) -> None:
+        """
+        クォータ超過エラーであれば、一定時間API呼び出しを止める
+
+        Args:
+            error: API呼び出しで発生したエラー（BatchHttpRequestのコールバックに渡されたエラーを含む）
+        """
+        global _quota_error, _quota_retry_at
+        if (
+            isinstance(error, HttpError)
+            and getattr(error.resp, "status", None) == 403
+            and b"quotaExceeded" in (error.content or b"")
+        ):
+            self.logger.error(f"YouTube API quota exceeded; pausing requests for {_QUOTA_COOLDOWN_SECONDS}s")
+            _quota_error = error
+            _quota_retry_at = time.monotonic() + _QUOTA_COOLDOWN_SECONDS
+
+    def clear_cache(self) -> None:
+        """APIレスポンスのキャッシュを破棄する"""
+        self._response_cache.clear()
+
+    async def _cached(self, key: Tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        キャッシュ済みのAPIレスポンスを返す（なければ取得してcache_ttl秒キャッシュする）
+
+        Args:
+            key: キャッシュキー
+            fetch: APIレスポンスを取得するコルーチン関数
+
+        Returns:
+            Any: APIレスポンス
+        """
+        cached = self._response_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        # 取得中の同じリクエストがあれば、その結果を待つ
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.ensure_future(fetch())
+        self._inflight[key] = future
+
+        # 呼び出し元がキャンセルされても、取得が完了した時点でキャッシュに保存する
+        def _done(done: asyncio.Future) -> None:
+            self._inflight.pop(key, None)
+            if not done.cancelled() and done.exception() is None:
+                self._store_cached(key, done.result())
+
+        future.add_done_callback(_done)
+        # 待機中の他の呼び出し元がいるため、この呼び出し元のキャンセルで取得自体を止めない
+        return await asyncio.shield(future)
+
+    def _store_cached(self, key: Tuple, result: Any) -> None:
+        """APIレスポンスをcache_ttl秒キャッシュする（上限を超えたら古いものから破棄）"""
+        self._response_cache.pop(key, None)
+        if len(self._response_cache) >= _RESPONSE_CACHE_MAX_ENTRIES:
+            del self._response_cache[next(iter(self._response_cache))]
+        self._response_cache[key] = (time.monotonic() + self.settings.cache_ttl, result)
+
+    async def _paginate(
+        self,
+        list_method: Callable[..., Any],
+        params: Dict,
+        max_results: int,
+        page_size: int = _VIDEOS_PAGE_SIZE
+    ) -> AsyncIterator[Dict]:
+        """
+        pageTokenをたどってAPIの結果を項目ごとに返す
+
+        現在のページの項目を返している間に次のページを先読みする。
+        max_results件に達するか、次のページがなくなった時点で終了する
+
+        Args:
+            list_method: リソースのlistメソッド（self._videos.list など）
+            params: maxResults・pageToken以外のリクエストパラメータ
+            max_results: 取得する項目の最大数
+            page_size: 1ページあたりの最大件数
+
+        Yields:
+            Dict: APIレスポンスの項目
+        """
+        def _fetch(page_token: Optional[str], remaining: int) -> asyncio.Future:
+            page_params = dict(params, maxResults=min(remaining, page_size))
+            if page_token:
+                page_params["pageToken"] = page_token
+            return asyncio.ensure_future(self._execute(list_method(**page_params)))
+
+        remaining = max_results
+        pending = _fetch(None, remaining) if remaining > 0 else None
+        try:
+            while pending is not None:
+                response = await pending
+                pending = None
+
+                items = response.get("items", [])[:remaining]
+                remaining -= len(items)
+
+                # 呼び出し側が現在のページを処理している間に次のページを取得しておく
+                page_token = response.get("nextPageToken")
+                if items and page_token and remaining > 0:
+                    pending = _fetch(page_token, remaining)
+
+                for item in items:
+                    yield item
+        finally:
+            if pending is not None:
+                pending.cancel()
 
     async def search_videos(
         self,
@@ -24,7 +332,7 @@ class YouTubeService:
         published_after: Optional[datetime] = None
     ) -> List[Dict]:
         """
-        キーワード検索で動画を取得する
+        キーワード検索で動画を取得する（同じ条件の結果はキャッシュから返す）
 
         Args:
             query: 検索クエリ
@@ -37,12 +345,32 @@ class YouTubeService:
         Returns:
             List[Dict]: 検索結果の動画リスト
         """
+        key = ("search_videos", query, max_results, order, region_code, language, published_after)
+        videos = await self._cached(
+            key,
+            lambda: self._fetch_search_videos(
+                query, max_results, order, region_code, language, published_after
+            )
+        )
+        return list(videos)
+
+    async def _fetch_search_videos(
+        self,
+        query: str,
+        max_results: int,
+        order: str,
+        region_code: str,
+        language: str,
+        published_after: Optional[datetime]
+    ) -> List[Dict]:
+        """キーワード検索をYouTube APIで実行する"""
         try:
             # 検索リクエストの構築
+            # 動画IDだけを使うため、snippetは要求しない
             search_params = {
                 "q": query,
-                "part": "snippet",
-                "maxResults": max_results,
+                "part": "id",
+                "fields": _SEARCH_FIELDS,
                 "order": order,
                 "regionCode": region_code,
                 "relevanceLanguage": language,
@@ -52,27 +380,32 @@ class YouTubeService:
             if published_after:
                 search_params["publishedAfter"] = published_after.isoformat() + "Z"
 
-            # 検索実行
-            search_response = self.youtube.search().list(**search_params).execute()
-
-            # 動画IDの抽出
-            video_ids = [item["id"]["videoId"] for item in search_response.get("items", [])]
+            # 検索実行（50件を超える場合は次のページをたどる）し、動画IDを抽出
+            video_ids = [
+                item["id"]["videoId"]
+                async for item in self._paginate(self._search.list, search_params, max_results)
+            ]
 
             if not video_ids:
                 return []
 
-            # 動画の詳細情報を取得
-            videos_response = self.youtube.videos().list(
-                part="snippet,statistics,contentDetails",
-                id=",".join(video_ids)
-            ).execute()
+            # 動画の詳細情報を取得（50件ごとに1リクエスト）
+            videos_responses = await asyncio.gather(*[
+                self._execute(self._videos.list(
+                    part="snippet,statistics,contentDetails",
+                    id=",".join(video_ids[start:start + _VIDEOS_PAGE_SIZE]),
+                    fields=_VIDEO_DETAILS_FIELDS
+                ))
+                for start in range(0, len(video_ids), _VIDEOS_PAGE_SIZE)
+            ])
 
             # 結果の変換
             videos = []
-            for item in videos_response.get("items", []):
-                video_info = self._convert_to_video_dict(item)
-                if video_info:
-                    videos.append(video_info)
+            for videos_response in videos_responses:
+                for item in videos_response.get("items", []):
+                    video_info = self._convert_to_video_dict(item)
+                    if video_info:
+                        videos.append(video_info)
 
             return videos
 
@@ -100,35 +433,58 @@ class YouTubeService:
         Returns:
             List[Dict]: コメントリスト
         """
+        return [
+            comment async for comment in self.iter_video_comments(video_id, max_results, order)
+        ]
+
+    async def iter_video_comments(
+        self,
+        video_id: str,
+        max_results: int = 100,
+        order: str = "relevance"
+    ) -> AsyncIterator[Dict]:
+        """
+        動画のコメントをページ単位で取得しながら順に返す
+
+        呼び出し側が途中で読むのをやめた場合、残りのページは取得しない
+
+        Args:
+            video_id: 動画ID
+            max_results: 取得するコメントの最大数
+            order: ソート順（relevance, time）
+
+        Yields:
+            Dict: コメント
+        """
+        remaining = max_results
+        page_token = None
         try:
-            comments_response = self.youtube.commentThreads().list(
-                part="snippet",
-                videoId=video_id,
-                maxResults=max_results,
-                order=order
-            ).execute()
-
-            comments = []
-            for item in comments_response.get("items", []):
-                comment_snippet = item["snippet"]["topLevelComment"]["snippet"]
-                
-                comment = {
-                    "id": item["id"],
-                    "author": comment_snippet["authorDisplayName"],
-                    "text": comment_snippet["textDisplay"],
-                    "like_count": comment_snippet["likeCount"],
-                    "published_at": comment_snippet["publishedAt"],
-                    "updated_at": comment_snippet["updatedAt"],
-                    "author_channel_id": comment_snippet.get("authorChannelId", {}).get("value", "")
+            while remaining > 0:
+                params = {
+                    "part": "snippet",
+                    "fields": _COMMENT_FIELDS,
+                    "videoId": video_id,
+                    "maxResults": min(remaining, _COMMENTS_PAGE_SIZE),
+                    "order": order
                 }
-                comments.append(comment)
+                if page_token:
+                    params["pageToken"] = page_token
 
-            return comments
+                comments_response = await self._execute(self._comment_threads.list(**params))
+
+                items = comments_response.get("items", [])
+                for item in items[:remaining]:
+                    yield self._convert_to_comment_dict(item)
+                remaining -= len(items)
+
+                page_token = comments_response.get("nextPageToken")
+                if not items or not page_token:
+                    break
 
         except HttpError as e:
             if "commentsDisabled" in str(e):
                 self.logger.info(f"Comments disabled for video {video_id}")
-                return []
+                return
             else:
                 self.logger.error(f"YouTube API comments error: {str(e)}")
                 raise
@@ -136,6 +492,19 @@ class YouTubeService:
             self.logger.error(f"Unexpected comments error: {str(e)}")
             raise
 
+    def _convert_to_comment_dict(self, item: dict) -> Dict:
+        """コメントのAPIレスポンスを辞書形式に変換"""
+        comment_snippet = item["snippet"]["topLevelComment"]["snippet"]
+        return {
+            "id": item["id"],
+            "author": comment_snippet["authorDisplayName"],
+            "text": comment_snippet["textDisplay"],
+            "like_count": comment_snippet["likeCount"],
+            "published_at": comment_snippet["publishedAt"],
+            "updated_at": comment_snippet["updatedAt"],
+            "author_channel_id": comment_snippet.get("authorChannelId", {}).get("value", "")
+        }
+
     async def get_trending_videos(
         self,
         region_code: str = "JP",
@@ -144,7 +513,7 @@ class YouTubeService:
         time_period: str = "day"
     ) -> List[TrendVideo]:
         """
-        トレンド動画を取得する
+        トレンド動画を取得する（同じ条件の結果はキャッシュから返す）
 
         Args:
             region_code: 地域コード
@@ -155,24 +524,107 @@ class YouTubeService:
         Returns:
             List[TrendVideo]: トレンド動画リスト
         """
+        key = ("get_trending_videos", region_code, max_results, category_id, time_period)
+        videos = await self._cached(
+            key,
+            lambda: self._fetch_trending_videos(region_code, max_results, category_id, time_period)
+        )
+        # 呼び出し側で分析結果を書き込むため、キャッシュ内の動画とは別のオブジェクトを返す
+        return [video.model_copy() for video in videos]
+
+    async def get_trending_videos_multi(
+        self,
+        region_codes: List[str],
+        max_results: int = 50,
+        category_id: Optional[str] = None,
+        time_period: str = "day"
+    ) -> Dict[str, List[TrendVideo]]:
+        """
+        複数地域のトレンド動画を1回のHTTPバッチリクエストで取得する
+
+        各地域の1ページ目（最大50件）だけを取得する。
+        取得結果は地域ごとにget_trending_videosと同じキーでキャッシュする
+
+        Args:
+            region_codes: 地域コードのリスト
+            max_results: 地域ごとに取得する動画の最大数
+            category_id: カテゴリID
+            time_period: 期間（day, week, month）
+
+        Returns:
+            Dict[str, List[TrendVideo]]: 地域コードごとのトレンド動画リスト（取得に失敗した地域は空）
+        """
+        published_after = self._get_published_after(time_period)
+        responses: Dict[str, Dict] = {}
+
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                self.logger.error(f"YouTube API error for region {request_id}: {str(exception)}")
+                # バッチ内のリクエストのエラーは_executeに伝わらないため、ここでクォータ超過を記録する
+                self._record_quota_error(exception)
+                return
+            responses[request_id] = response
+
+        batch = self.youtube.new_batch_http_request(callback=_collect)
+        for region_code in region_codes:
+            batch.add(
+                self._videos.list(
+                    part="snippet,statistics",
+                    fields=_TRENDING_FIELDS,
+                    chart="mostPopular",
+                    regionCode=region_code,
+                    maxResults=min(max_results, _VIDEOS_PAGE_SIZE),
+                    videoCategoryId=category_id,
+                    publishedAfter=published_after
+                ),
+                request_id=region_code
+            )
+        await self._execute(batch, retry=False)
+
+        videos_by_region: Dict[str, List[TrendVideo]] = {}
+        for region_code in region_codes:
+            response = responses.get(region_code)
+            if response is None:
+                videos_by_region[region_code] = []
+                continue
+
+            videos = [
+                video for video in map(self._convert_to_trend_video, response.get("items", []))
+                if video
+            ]
+            if max_results <= _VIDEOS_PAGE_SIZE:
+                self._store_cached(
+                    ("get_trending_videos", region_code, max_results, category_id, time_period), videos
+                )
+            videos_by_region[region_code] = [video.model_copy() for video in videos]
+
+        return videos_by_region
+
+    async def _fetch_trending_videos(
+        self,
+        region_code: str,
+        max_results: int,
+        category_id: Optional[str],
+        time_period: str
+    ) -> List[TrendVideo]:
+        """トレンド動画をYouTube APIから取得する"""
         try:
             # 期間の設定
             published_after = self._get_published_after(time_period)
 
-            # トレンド動画の取得
-            request = self.youtube.videos().list(
-                part="snippet,statistics",
-                chart="mostPopular",
-                regionCode=region_code,
-                maxResults=max_results,
-                videoCategoryId=category_id,
-                publishedAfter=published_after.isoformat() + "Z"
-            )
-            response = request.execute()
+            # トレンド動画の取得（50件を超える場合は次のページをたどる）
+            params = {
+                "part": "snippet,statistics",
+                "fields": _TRENDING_FIELDS,
+                "chart": "mostPopular",
+                "regionCode": region_code,
+                "videoCategoryId": category_id,
+                "publishedAfter": published_after
+            }
 
             # 動画情報の変換
             videos = []
-            for item in response.get("items", []):
+            async for item in self._paginate(self._videos.list, params, max_results):
                 video = self._convert_to_trend_video(item)
                 if video:
                     videos.append(video)
@@ -188,7 +640,7 @@ class YouTubeService:
 
     async def get_video_details(self, video_id: str) -> Optional[Dict]:
         """
-        特定の動画の詳細情報を取得する
+        特定の動画の詳細情報を取得する（キャッシュがあればキャッシュから返す）
 
         Args:
             video_id: 動画ID
@@ -196,11 +648,20 @@ class YouTubeService:
         Returns:
             Optional[Dict]: 動画の詳細情報
         """
+        details = await self._cached(
+            ("get_video_details", video_id),
+            lambda: self._fetch_video_details(video_id)
+        )
+        return dict(details) if details is not None else None
+
+    async def _fetch_video_details(self, video_id: str) -> Optional[Dict]:
+        """動画の詳細情報をYouTube APIから取得する"""
         try:
-            response = self.youtube.videos().list(
+            response = await self._execute(self._videos.list(
                 part="snippet,statistics,contentDetails",
-                id=video_id
-            ).execute()
+                id=video_id,
+                fields=_VIDEO_DETAILS_FIELDS
+            ))
 
             if not response.get("items"):
                 return None
@@ -214,17 +675,9 @@ class YouTubeService:
             self.logger.error(f"Unexpected video details error: {str(e)}")
             raise
 
-    def _get_published_after(self, time_period: str) -> datetime:
-        """期間に応じた開始日時を取得"""
-        now = datetime.utcnow()
-        if time_period == "day":
-            return now - timedelta(days=1)
-        elif time_period == "week":
-            return now - timedelta(weeks=1)
-        elif time_period == "month":
-            return now - timedelta(days=30)
-        else:
-            return now - timedelta(days=1)
+    def _get_published_after(self, time_period: str) -> str:
+        """期間に応じた開始日時を取得（分単位に切り捨てたAPI用の文字列）"""
+        return _published_after_str(time_period, int(time.time() // 60))
 
     def _convert_to_trend_video(self, item: dict) -> Optional[TrendVideo]:
         """APIレスポンスをTrendVideoモデルに変換"""
@@ -232,12 +685,15 @@ class YouTubeService:
             snippet = item["snippet"]
             statistics = item["statistics"]
 
-            # 統計情報の取得
+            # 統計情報の取得（各値は一度だけ数値に変換する）
+            views = int(statistics.get("viewCount", 0))
+            likes = int(statistics.get("likeCount", 0))
+            comments = int(statistics.get("commentCount", 0))
             stats = VideoStats(
-                view_count=int(statistics.get("viewCount", 0)),
-                like_count=int(statistics.get("likeCount", 0)),
-                comment_count=int(statistics.get("commentCount", 0)),
-                engagement_rate=self._calculate_engagement_rate(statistics)
+                view_count=views,
+                like_count=likes,
+                comment_count=comments,
+                engagement_rate=self._engagement_from_ints(views, likes, comments)
             )
 
             # 動画情報の作成
@@ -245,7 +701,7 @@ class YouTubeService:
                 video_id=item["id"],
                 title=snippet["title"],
                 description=snippet["description"],
-                published_at=datetime.fromisoformat(snippet["publishedAt"].replace("Z", "+00:00")),
+                published_at=parse_youtube_timestamp(snippet["publishedAt"]),
                 channel_id=snippet["channelId"],
                 channel_title=snippet["channelTitle"],
                 stats=stats,
@@ -263,6 +719,11 @@ class YouTubeService:
             statistics = item["statistics"]
             content_details = item.get("contentDetails", {})
 
+            # 各値は一度だけ数値に変換する
+            views = int(statistics.get("viewCount", 0))
+            likes = int(statistics.get("likeCount", 0))
+            comments = int(statistics.get("commentCount", 0))
+
             return {
                 "video_id": item["id"],
                 "title": snippet["title"],
@@ -271,11 +732,13 @@ class YouTubeService:
                 "channel_id": snippet["channelId"],
                 "channel_title": snippet["channelTitle"],
                 "thumbnail_url": snippet["thumbnails"]["high"]["url"],
-                "view_count": int(statistics.get("viewCount", 0)),
-                "like_count": int(statistics.get("likeCount", 0)),
-                "comment_count": int(statistics.get("commentCount", 0)),
+                "view_count": views,
+                "like_count": likes,
+                "comment_count": comments,
                 "duration": content_details.get("duration", ""),
-                "engagement_rate": self._calculate_engagement_rate(statistics)
+                # 長さでの絞り込み・並べ替え用に、取り込み時に一度だけ秒数に変換する
+                "duration_seconds": parse_iso_duration(content_details.get("duration", "")),
+                "engagement_rate": self._engagement_from_ints(views, likes, comments)
             }
 
         except (KeyError, ValueError) as e:
@@ -285,15 +748,29 @@ class YouTubeService:
     def _calculate_engagement_rate(self, statistics: dict) -> float:
         """エンゲージメント率を計算"""
         try:
-            views = int(statistics.get("viewCount", 0))
-            if views == 0:
-                return 0.0
+            return self._engagement_from_ints(
+                int(statistics.get("viewCount", 0)),
+                int(statistics.get("likeCount", 0)),
+                int(statistics.get("commentCount", 0))
+            )
 
-            likes = int(statistics.get("likeCount", 0))
-            comments = int(statistics.get("commentCount", 0))
+        except ValueError:
+            return 0.0
+
+    @staticmethod
+    def _engagement_from_ints(views: int, likes: int, comments: int) -> float:
+        """数値に変換済みの統計情報からエンゲージメント率を計算"""
+        if views == 0:
+            return 0.0
+
+        # エンゲージメント率 = (いいね数 + コメント数) / 視聴回数 * 100
+        return ((likes + comments) / views) * 100 
 
-            # エンゲージメント率 = (いいね数 + コメント数) / 視聴回数 * 100
-            return ((likes + comments) / views) * 100
+@lru_cache(maxsize=1)
+def get_youtube_service() -> YouTubeService:
+    """
+    プロセス内で共有するYouTube APIサービスを取得する
 
-        except (ValueError, ZeroDivisionError):
-            return 0.0 
\ No newline at end of file
+    build()によるAPIクライアントの構築とレスポンスキャッシュを、APIとスケジューラーで共有する
+    """
+    return YouTubeService()
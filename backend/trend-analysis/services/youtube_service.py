@@ -1,17 +1,64 @@
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 from typing import List, Dict, Optional
+import asyncio
 import os
+import threading
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# API呼び出しスレッドごとのHTTPクライアント
+_thread_local = threading.local()
+
+# videos.list の1回のリクエストで指定できる動画IDの上限
+_VIDEOS_LIST_MAX_IDS = 50
+
+# 同時に実行するAPI呼び出しの上限（デフォルトのスレッドプールを使い切らないようにする）
+_MAX_CONCURRENT_REQUESTS = 10
+
+# レスポンスに含める項目（変換で使う項目だけを返させ、レスポンスのサイズを減らす）
+_SEARCH_FIELDS = "items(id/videoId,snippet(title,description,publishedAt,channelTitle,thumbnails/high/url))"
+_SEARCH_DETAILS_FIELDS = "items(id,statistics(viewCount,likeCount,commentCount),contentDetails/duration)"
+_VIDEO_DETAILS_FIELDS = (
+    "items(id,snippet(title,description,publishedAt,channelTitle,thumbnails/high/url),"
+    "statistics(viewCount,likeCount,commentCount),contentDetails/duration)"
+)
+
 class YouTubeService:
     def __init__(self):
         self.api_key = os.getenv("YOUTUBE_API_KEY")
         if not self.api_key:
             raise ValueError("YouTube API key is not set in environment variables")
         self.youtube = build("youtube", "v3", developerKey=self.api_key)
+        # リソースオブジェクトは呼び出しごとに生成せず、1回だけ生成して使い回す
+        self._videos = self.youtube.videos()
+        self._search = self.youtube.search()
+        # API呼び出しの同時実行数の制限（インスタンスごとに生成し、モジュール読み込み時のループに紐づけない）
+        self._sem = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+
+    async def _execute(self, request) -> Dict:
+        """
+        APIリクエストをスレッドで実行する（イベントループを止めない）
+
+        httplib2.Httpはスレッドセーフではないため、スレッドごとに1つ生成して使い回す。
+        同時実行数はセマフォで制限する
+
+        Args:
+            request: googleapiclientのHttpRequest
+
+        Returns:
+            Dict: APIレスポンス
+        """
+        def _run() -> Dict:
+            http = getattr(_thread_local, "http", None)
+            if http is None:
+                http = _thread_local.http = build_http()
+            return request.execute(http=http)
+
+        async with self._sem:
+            return await asyncio.to_thread(_run)
 
     async def search_videos(
         self,
@@ -35,26 +82,39 @@ class YouTubeService:
             List[Dict]: 検索結果のリスト
         """
         try:
-            search_response = self.youtube.search().list(
+            search_response = await self._execute(self._search.list(
                 q=query,
                 part="snippet",
+                fields=_SEARCH_FIELDS,
                 maxResults=max_results,
                 order=order,
                 regionCode=region_code,
                 relevanceLanguage=language,
                 type="video"
-            ).execute()
+            ))
 
-            videos = []
-            for item in search_response.get("items", []):
-                video_id = item["id"]["videoId"]
-                video_details = self.youtube.videos().list(
+            # 検索結果の詳細は動画IDをまとめて取得する（50件ごとに1リクエスト）
+            items = search_response.get("items", [])
+            video_ids = [item["id"]["videoId"] for item in items]
+            responses = await asyncio.gather(*[
+                self._execute(self._videos.list(
                     part="statistics,contentDetails",
-                    id=video_id
-                ).execute()
+                    id=",".join(video_ids[start:start + _VIDEOS_LIST_MAX_IDS]),
+                    fields=_SEARCH_DETAILS_FIELDS
+                ))
+                for start in range(0, len(video_ids), _VIDEOS_LIST_MAX_IDS)
+            ])
+            details = {
+                video_info["id"]: video_info
+                for response in responses
+                for video_info in response.get("items", [])
+            }
 
-                if video_details["items"]:
-                    video_info = video_details["items"][0]
+            # 検索結果の順序で組み立てる
+            videos = []
+            for item, video_id in zip(items, video_ids):
+                video_info = details.get(video_id)
+                if video_info is not None:
                     videos.append({
                         "video_id": video_id,
                         "title": item["snippet"]["title"],
@@ -85,10 +145,11 @@ class YouTubeService:
             Optional[Dict]: 動画の詳細情報
         """
         try:
-            response = self.youtube.videos().list(
+            response = await self._execute(self._videos.list(
                 part="snippet,statistics,contentDetails",
-                id=video_id
-            ).execute()
+                id=video_id,
+                fields=_VIDEO_DETAILS_FIELDS
+            ))
 
             if not response["items"]:
                 return None
@@ -0,0 +1,136 @@
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from datetime import datetime
+from ..api.endpoints import get_comprehensive_analysis
+from ..services.analysis import AnalysisService
+from ..models import TrendVideo, VideoStats
+
+class TestAnalysisService:
+    """分析サービスのテストクラス"""
+
+    @pytest.fixture
+    def analysis_service(self):
+        """分析サービスのインスタンスを作成"""
+        service = AnalysisService()
+        yield service
+        service.close()
+
+    @pytest.fixture
+    def video(self):
+        """分析対象の動画を作成"""
+        return TrendVideo(
+            video_id="abcdefghijk",
+            title="Test Video",
+            description="Test Description",
+            published_at=datetime(2024, 1, 1),
+            channel_id="test_channel_id",
+            channel_title="Test Channel",
+            stats=VideoStats(view_count=1000, like_count=100, comment_count=50, engagement_rate=15.0)
+        )
+
+    @pytest.mark.asyncio
+    async def test_analyze_trends_cached(self, analysis_service, video):
+        """分析結果のキャッシュテスト（統計情報が同じ動画は再計算しない）"""
+        # 初回の分析結果がキャッシュされる
+        analyzed_videos = await analysis_service.analyze_trends([video])
+        assert analyzed_videos == [video]
+        first_analysis = video.analysis
+        assert "trend_analysis" in first_analysis
+        assert "sentiment_analysis" in first_analysis
+
+        # 統計情報が同じなら再計算せずキャッシュを返す
+        with patch.object(analysis_service, "_analyze_trends_over_time") as mock_trends:
+            analyzed_videos = await analysis_service.analyze_trends([video])
+        mock_trends.assert_not_called()
+        assert analyzed_videos[0].analysis == first_analysis
+
+        # 返された分析結果を変更してもキャッシュには影響しない
+        analyzed_videos[0].analysis["sentiment_analysis"]["sentiment_score"] = 99.0
+        analyzed_videos = await analysis_service.analyze_trends([video])
+        assert analyzed_videos[0].analysis == first_analysis
+
+        # 統計情報が変わると再計算される
+        video.stats.view_count += 1
+        with patch.object(analysis_service, "_analyze_trends_over_time", return_value={}) as mock_trends:
+            analyzed_videos = await analysis_service.analyze_trends([video])
+        mock_trends.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_compute_polarities_uses_parent_cache(self, analysis_service):
+        """並列計算の閾値を超える件数でも、キャッシュ済みのテキストはプロセスプールに送らないテスト"""
+        texts = [f"great comment number {index}" for index in range(300)]
+
+        # 1プロセスで計算し、親プロセスのキャッシュに保存する
+        analysis_service._max_workers = 1
+        first = await analysis_service._compute_polarities(texts)
+
+        # キャッシュ済みのため、並列計算が有効でもプロセスプールは生成されない
+        analysis_service._max_workers = 2
+        second = await analysis_service._compute_polarities(texts + texts)
+        assert analysis_service._pool is None
+        assert second == first + first
+
+    def test_buzz_scores_batch_matches_scalar(self, analysis_service, video):
+        """バズり度スコアの一括計算が動画ごとの計算と一致するテスト"""
+        # 上限未満・上限超えの統計値を含む動画を用意する
+        videos = [
+            video.model_copy(update={"video_id": f"video{index:06d}", "stats": stats})
+            for index, stats in enumerate([
+                VideoStats(view_count=0, like_count=0, comment_count=0, engagement_rate=0.0),
+                VideoStats(view_count=1234, like_count=56, comment_count=7, engagement_rate=5.1),
+                VideoStats(view_count=50000, like_count=3000, comment_count=400, engagement_rate=6.8),
+                VideoStats(view_count=2000000, like_count=90000, comment_count=5000, engagement_rate=4.75),
+                VideoStats(view_count=100000, like_count=20000, comment_count=1000, engagement_rate=21.0),
+            ])
+        ]
+        sentiment_analyses = [
+            {"sentiment_score": score}
+            for score in (0.0, 0.4, -0.2, 0.9, 1.0)
+        ]
+        channel_scores = analysis_service._channel_score_table(videos)
+
+        # テスト実行
+        batch_scores = analysis_service._calculate_buzz_scores_batch(videos, sentiment_analyses, channel_scores)
+        scalar_scores = [
+            analysis_service._calculate_buzz_score(v, analysis, channel_scores)
+            for v, analysis in zip(videos, sentiment_analyses)
+        ]
+
+        # 結果の検証
+        assert batch_scores == pytest.approx(scalar_scores)
+
+    @pytest.mark.asyncio
+    async def test_comprehensive_analysis_with_api_comments(self, analysis_service):
+        """包括的分析のテスト（YouTubeServiceが返す辞書のコメントをそのまま分析する）"""
+        # YouTubeServiceのモック（get_video_commentsは辞書のリストを返す）
+        youtube_service = Mock()
+        youtube_service.get_video_details = AsyncMock(return_value={
+            "video_id": "abcdefghijk",
+            "title": "Test Video",
+            "description": "Test Description",
+            "published_at": "2024-01-01T00:00:00Z",
+            "channel_id": "test_channel_id",
+            "channel_title": "Test Channel",
+            "view_count": 1000,
+            "like_count": 100,
+            "comment_count": 2,
+            "engagement_rate": 10.2
+        })
+        youtube_service.get_video_comments = AsyncMock(return_value=[
+            {"id": "comment_id_1", "author": "User A", "text": "Great video!", "like_count": 10},
+            {"id": "comment_id_2", "author": "User B", "text": "すごい動画です", "like_count": 3}
+        ])
+
+        # テスト実行
+        result = await get_comprehensive_analysis(
+            "abcdefghijk",
+            youtube_service=youtube_service,
+            analysis_service=analysis_service
+        )
+
+        # 結果の検証（コメントの読み取りで失敗せず、各分析が実行される）
+        analysis = result["analysis"]
+        assert "error" not in analysis
+        assert analysis["sentiment_analysis"]["sentiment_score"] > 0
+        assert analysis["foreign_reaction"].comment_examples == ["Great video!"]
+        assert analysis["audience_demographics"]["foreign_audience_ratio"] == 0.5
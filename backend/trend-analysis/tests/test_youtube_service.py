@@ -12,6 +12,7 @@ class TestYouTubeService:
         """YouTubeサービスのインスタンスを作成"""
         with patch('trend_analysis.services.youtube.get_settings') as mock_settings:
             mock_settings.return_value.youtube_api_key = "test_api_key"
+            mock_settings.return_value.cache_ttl = 3600
             with patch('trend_analysis.services.youtube.build') as mock_build:
                 mock_youtube = Mock()
                 mock_build.return_value = mock_youtube
@@ -63,6 +64,87 @@ class TestYouTubeService:
         assert result[0].stats.like_count == 100
         assert result[0].stats.comment_count == 50
 
+    @pytest.mark.asyncio
+    async def test_get_video_details_cached(self, youtube_service):
+        """動画詳細のキャッシュテスト（同じ動画IDはAPIを再度呼ばない）"""
+        mock_videos = Mock()
+        mock_videos.execute.return_value = {"items": []}
+        youtube_service.youtube.videos.return_value.list.return_value = mock_videos
+
+        # テスト実行
+        assert await youtube_service.get_video_details("test_video_id") is None
+        assert await youtube_service.get_video_details("test_video_id") is None
+
+        # 結果の検証
+        assert mock_videos.execute.call_count == 1
+
+        # キャッシュ破棄後は再取得される
+        youtube_service.clear_cache()
+        await youtube_service.get_video_details("test_video_id")
+        assert mock_videos.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_trending_videos_multi(self, youtube_service):
+        """複数地域のトレンド動画取得のテスト（1回のバッチリクエスト）"""
+        def make_item(region_code):
+            return {
+                "id": f"{region_code}_video_id",
+                "snippet": {
+                    "title": f"Test Video {region_code}",
+                    "description": "Test Description",
+                    "publishedAt": "2024-01-01T00:00:00Z",
+                    "channelId": "test_channel_id",
+                    "channelTitle": "Test Channel"
+                },
+                "statistics": {
+                    "viewCount": "1000",
+                    "likeCount": "100",
+                    "commentCount": "50"
+                }
+            }
+
+        # バッチリクエストのモック（追加されたリクエストごとにコールバックを呼ぶ）
+        batches = []
+
+        class FakeBatch:
+            def __init__(self, callback):
+                self.callback = callback
+                self.request_ids = []
+
+            def add(self, request, request_id):
+                self.request_ids.append(request_id)
+
+            def execute(self, http=None):
+                for request_id in self.request_ids:
+                    if request_id == "GB":
+                        self.callback(request_id, None, Exception("API Error"))
+                    else:
+                        self.callback(request_id, {"items": [make_item(request_id)]}, None)
+
+        def new_batch(callback):
+            batch = FakeBatch(callback)
+            batches.append(batch)
+            return batch
+
+        youtube_service.youtube.new_batch_http_request.side_effect = new_batch
+
+        # テスト実行
+        result = await youtube_service.get_trending_videos_multi(["JP", "US", "GB"], max_results=20)
+
+        # 結果の検証（失敗した地域は空）
+        assert len(batches) == 1
+        assert batches[0].request_ids == ["JP", "US", "GB"]
+        assert result["JP"][0].video_id == "JP_video_id"
+        assert result["US"][0].video_id == "US_video_id"
+        assert result["GB"] == []
+
+        # 地域ごとの取得はキャッシュから返される
+        mock_videos_list = Mock()
+        youtube_service.youtube.videos.return_value.list.return_value = mock_videos_list
+        cached = await youtube_service.get_trending_videos(region_code="JP", max_results=20)
+        assert cached[0].video_id == "JP_video_id"
+        mock_videos_list.execute.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_search_videos_success(self, youtube_service):
         """動画検索のテスト（成功）"""
@@ -122,6 +204,7 @@ class TestYouTubeService:
         assert result[0]["video_id"] == "test_video_id"
         assert result[0]["title"] == "Test Video"
         assert result[0]["view_count"] == 1000
+        assert result[0]["duration_seconds"] == 630
 
     @pytest.mark.asyncio
     async def test_get_video_comments_success(self, youtube_service):
@@ -224,11 +307,15 @@ class TestYouTubeService:
         month_result = youtube_service._get_published_after("month")
         default_result = youtube_service._get_published_after("invalid")
 
-        # 結果の検証
-        assert isinstance(day_result, datetime)
-        assert isinstance(week_result, datetime)
-        assert isinstance(month_result, datetime)
-        assert isinstance(default_result, datetime)
+        # 結果の検証（APIに渡す "YYYY-MM-DDTHH:MM:SSZ" 形式の文字列）
+        for result in (day_result, week_result, month_result, default_result):
+            assert isinstance(result, str)
+            assert result.endswith("Z")
+            datetime.strptime(result, "%Y-%m-%dT%H:%M:%SZ")
+
+        # 期間が長いほど下限は過去になり、未知の期間は1日として扱う
+        assert month_result < week_result < day_result
+        assert default_result == day_result
 
     def test_convert_to_trend_video_success(self, youtube_service):
         """動画データ変換のテスト（成功）"""